@@ -1,23 +1,50 @@
 """Module with models for graph and text embedding and their Keras Sequences."""
-from .embedders import CBOW, SkipGram, GloVe
+from .embedders import CBOW, SkipGram, GloVe, MatrixFactorization, MultilevelEmbedder, NodeLossCallback
 from .transformers import (
-    NodeTransformer, EdgeTransformer, GraphTransformer, CorpusTransformer, LinkPredictionTransformer)
+    NodeTransformer, EdgeTransformer, GraphTransformer, CorpusTransformer, LinkPredictionTransformer,
+    EdgeEmbeddingSequence, EdgeEmbeddingShardSequence, EdgeFeatureCache)
 from .sequences import (Node2VecSequence,
                         LinkPredictionSequence,
-                        Word2VecSequence)
+                        Word2VecSequence,
+                        NodeScheduler,
+                        PrefetchSequence,
+                        WalkCache,
+                        CachedNode2VecSequence,
+                        SharedNode2VecSequence,
+                        TokenCorpus,
+                        CachedWord2VecSequence,
+                        StreamingWord2VecSequence,
+                        NegativeEdgePool,
+                        parallel_batches)
 from .visualizations import GraphVisualizations
 
 __all__ = [
     "CBOW",
     "SkipGram",
     "GloVe",
+    "MatrixFactorization",
+    "MultilevelEmbedder",
+    "NodeLossCallback",
     "LinkPredictionSequence",
     "Node2VecSequence",
     "Word2VecSequence",
+    "NodeScheduler",
+    "PrefetchSequence",
+    "WalkCache",
+    "CachedNode2VecSequence",
+    "SharedNode2VecSequence",
+    "TokenCorpus",
+    "CachedWord2VecSequence",
+    "StreamingWord2VecSequence",
+    "NegativeEdgePool",
+    "parallel_batches",
     "NodeTransformer",
     "EdgeTransformer",
     "GraphTransformer",
     "CorpusTransformer",
     "LinkPredictionTransformer",
+    "EdgeEmbeddingSequence",
+    "EdgeEmbeddingShardSequence",
+    "EdgeFeatureCache",
     "GraphVisualizations"
 ]
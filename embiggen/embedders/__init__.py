@@ -2,7 +2,11 @@
 from .glove import GloVe
 from .skipgram import SkipGram
 from .cbow import CBOW
+from .matrix_factorization import MatrixFactorization
+from .multilevel_embedder import MultilevelEmbedder
+from .node_loss_callback import NodeLossCallback
 
 __all__ = [
-    "GloVe", "SkipGram", "CBOW"
+    "GloVe", "SkipGram", "CBOW", "MatrixFactorization", "MultilevelEmbedder",
+    "NodeLossCallback"
 ]
@@ -19,7 +19,9 @@ class CBOW(Node2Vec):
         embedding_size: int,
         optimizer: Union[str, Optimizer] = "nadam",
         window_size: int = 4,
-        negative_samples: int = 10
+        negative_samples: int = 10,
+        precision: str = "float32",
+        walk_length: int = None
     ):
         """Create new CBOW-based Embedder object.
 
@@ -33,12 +35,26 @@ class CBOW(Node2Vec):
             Dimension of the embedding.
         optimizer: Union[str, Optimizer] = "nadam",
             The optimizer to be used during the training of the model.
+        precision: str = "float32",
+            Precision of the embedding lookups.
+            Can either be 'float32', 'mixed_float16' or 'mixed_bfloat16'.
         window_size: int = 4,
             Window size for the local context.
             On the borders the window size is trimmed.
         negative_samples: int,
             The number of negative classes to randomly sample per batch.
             This single sample of negative classes is evaluated for each element in the batch.
+        walk_length: int = None,
+            Length of the walks received by the model.
+            When provided, the model receives the raw walks, padded with
+            values not smaller than the vocabulary size, and extracts the
+            windows within the model, instead of receiving the contexts
+            and the central words.
+
+        Raises
+        -------------------------------------------
+        ValueError,
+            If the given walk length cannot contain a window.
         """
         super().__init__(
             vocabulary_size=vocabulary_size,
@@ -46,7 +62,9 @@ class CBOW(Node2Vec):
             model_name="CBOW",
             optimizer=optimizer,
             window_size=window_size,
-            negative_samples=negative_samples
+            negative_samples=negative_samples,
+            precision=precision,
+            walk_length=walk_length
         )
 
     def _get_true_input_length(self) -> int:
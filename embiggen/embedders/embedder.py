@@ -11,12 +11,14 @@ class Embedder:
     """Abstract Keras Model object for embedding models."""
 
     EMBEDDING_LAYER_NAME = "words_embedding"
+    PRECISIONS = ("float32", "mixed_float16", "mixed_bfloat16")
 
     def __init__(
         self,
         vocabulary_size: int,
         embedding_size: int,
-        optimizer: Union[str, Optimizer] = "nadam"
+        optimizer: Union[str, Optimizer] = "nadam",
+        precision: str = "float32"
     ):
         """Create new Embedder object.
 
@@ -30,6 +32,16 @@ class Embedder:
             Dimension of the embedding.
         optimizer: Union[str, Optimizer] = "nadam",
             The optimizer to be used during the training of the model.
+        precision: str = "float32",
+            Precision of the embedding lookups.
+            Can either be 'float32', 'mixed_float16' or 'mixed_bfloat16'.
+            With the mixed precisions the embedding tables, and therefore
+            the optimizer slots, are kept as float32 master weights, and
+            at every step the rows are gathered from a half precision copy
+            of the tables, halving the bandwidth of the gathers. The memory
+            of the tables is not reduced, as the copy is added to the
+            float32 master weights.
+            The loss is always computed in float32.
 
         Raises
         -----------------------------------
@@ -37,6 +49,8 @@ class Embedder:
             When the given vocabulary size is not a strictly positive integer.
         ValueError,
             When the given embedding size is not a strictly positive integer.
+        ValueError,
+            When the given precision is not supported.
         """
         if not isinstance(vocabulary_size, int) or vocabulary_size < 1:
             raise ValueError((
@@ -52,9 +66,18 @@ class Embedder:
             ).format(
                 embedding_size
             ))
+        if precision not in Embedder.PRECISIONS:
+            raise ValueError((
+                "Given precision '{}' is not supported. "
+                "Supported precisions are {}."
+            ).format(
+                precision, ", ".join(Embedder.PRECISIONS)
+            ))
         self._vocabulary_size = vocabulary_size
         self._embedding_size = embedding_size
         self._optimizer = optimizer
+        self._precision = precision
+        self._embedding_snapshot = None
         self._model = self._build_model()
 
     def _build_model(self) -> Model:
@@ -69,15 +92,57 @@ class Embedder:
 
     @property
     def embedding(self) -> np.ndarray:
-        """Return model embeddings."""
+        """Return model embeddings.
+
+        The embedding is always returned as float32, independently
+        of the precision used for the lookups.
+        The weights are copied from the model only once after every change
+        of the model, and the same read-only snapshot is returned until the
+        model is trained again, its weights are loaded or the embedding set.
+        To modify the embedding, copy it, or use `get_embedding_dataframe`,
+        which returns a writable copy.
+        """
+        if self._embedding_snapshot is None:
+            for layer, weights in zip(self._model.layers, self._model.weights):
+                if layer.name == Embedder.EMBEDDING_LAYER_NAME:
+                    embedding = weights.numpy().astype(np.float32, copy=False)
+                    embedding.setflags(write=False)
+                    self._embedding_snapshot = embedding
+        return self._embedding_snapshot
+
+    @embedding.setter
+    def embedding(self, embedding: np.ndarray):
+        """Set the model embeddings, for instance to warm start the training.
+
+        Parameters
+        -----------------------------
+        embedding: np.ndarray,
+            The embedding to load into the model.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the shape of the given embedding does not match the model.
+        """
+        if embedding.shape != (self._vocabulary_size, self._embedding_size):
+            raise ValueError((
+                "The given embedding has shape {}, "
+                "while the model expects shape {}."
+            ).format(
+                embedding.shape,
+                (self._vocabulary_size, self._embedding_size)
+            ))
         for layer, weights in zip(self._model.layers, self._model.weights):
             if layer.name == Embedder.EMBEDDING_LAYER_NAME:
-                return weights.numpy()
-        return None
+                weights.assign(embedding.astype(weights.dtype.as_numpy_dtype))
+        self._embedding_snapshot = None
 
     def get_embedding_dataframe(self, term_names: List[str]) -> pd.DataFrame:
         """Return terms embedding using given index names.
 
+        The DataFrame owns a writable copy of the embedding, so it can be
+        modified without affecting the read-only embedding of the model.
+
         Parameters
         -----------------------------
         path: str,
@@ -86,7 +151,7 @@ class Embedder:
             List of terms to be used as index names.
         """
         return pd.DataFrame(
-            self.embedding,
+            self.embedding.copy(),
             index=term_names
         )
 
@@ -100,7 +165,11 @@ class Embedder:
         term_names: List[str],
             List of terms to be used as index names.
         """
-        self.get_embedding_dataframe(term_names).to_csv(path, header=False)
+        # The embedding is only read, so it is not copied.
+        pd.DataFrame(
+            self.embedding,
+            index=term_names
+        ).to_csv(path, header=False)
 
     @property
     def name(self) -> str:
@@ -126,7 +195,11 @@ class Embedder:
             Path from where to load model weights.
         """
         self._model.load_weights(path)
+        self._embedding_snapshot = None
 
     def fit(self, *args, **kwargs) -> pd.DataFrame:
         """Return pandas dataframe with training history."""
-        return pd.DataFrame(self._model.fit(*args, **kwargs).history)
+        try:
+            return pd.DataFrame(self._model.fit(*args, **kwargs).history)
+        finally:
+            self._embedding_snapshot = None
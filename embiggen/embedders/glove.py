@@ -3,11 +3,12 @@ from typing import Union
 
 import tensorflow as tf
 from tensorflow.keras import backend as K  # pylint: disable=import-error
-from tensorflow.keras.layers import Add, Dot, Embedding, Flatten, Input  # pylint: disable=import-error
+from tensorflow.keras.layers import Add, Dot, Flatten, Input  # pylint: disable=import-error
 from tensorflow.keras.models import Model   # pylint: disable=import-error
 from tensorflow.keras.optimizers import Optimizer   # pylint: disable=import-error
 
 from .embedder import Embedder
+from .layers import MixedPrecisionEmbedding
 
 
 class GloVe(Embedder):
@@ -23,7 +24,8 @@ class GloVe(Embedder):
         embedding_size: int,
         optimizer: Union[str, Optimizer] = "nadam",
         alpha: float = 0.75,
-        shared_embedding_layers: bool = False
+        shared_embedding_layers: bool = False,
+        precision: str = "float32"
     ):
         """Create new GloVe-based Embedder object.
 
@@ -44,13 +46,17 @@ class GloVe(Embedder):
             for the center words and the contexts.
             This will make the GloVe model more practical as it halves the number
             of parameters of the model, but it is still to be studied properly.
+        precision: str = "float32",
+            Precision of the embedding lookups.
+            Can either be 'float32', 'mixed_float16' or 'mixed_bfloat16'.
         """
         self._alpha = alpha
         self._shared_embedding_layers = shared_embedding_layers
         super().__init__(
             vocabulary_size=vocabulary_size,
             embedding_size=embedding_size,
-            optimizer=optimizer
+            optimizer=optimizer,
+            precision=precision
         )
 
     def _glove_loss(self, y_true: tf.Tensor, y_pred: tf.Tensor) -> float:
@@ -83,10 +89,11 @@ class GloVe(Embedder):
 
         # Creating the embedding layer(s)
         if self._shared_embedding_layers:
-            embedding_layer = Embedding(
+            embedding_layer = MixedPrecisionEmbedding(
                 self._vocabulary_size,
                 self._embedding_size,
-                input_length=1
+                input_length=1,
+                dtype=self._precision
             )
             embedding_layers = [
                 embedding_layer(input_layer)
@@ -94,10 +101,11 @@ class GloVe(Embedder):
             ]
         else:
             embedding_layers = [
-                Embedding(
+                MixedPrecisionEmbedding(
                     self._vocabulary_size,
                     self._embedding_size,
-                    input_length=1
+                    input_length=1,
+                    dtype=self._precision
                 )(input_layer)
                 for input_layer in input_layers
             ]
@@ -107,10 +115,11 @@ class GloVe(Embedder):
 
         # Creating the biases layer
         biases = [
-            Embedding(
+            MixedPrecisionEmbedding(
                 self._vocabulary_size,
                 1,
-                input_length=1
+                input_length=1,
+                dtype=self._precision
             )(input_layer)
             for input_layer in input_layers
         ]
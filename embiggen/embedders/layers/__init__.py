@@ -1,4 +1,10 @@
 """Module with custom layers used in embedding models."""
 from .noise_contrastive_estimation import NoiseContrastiveEstimation
+from .walk_windows import WalkWindows
+from .edge_embedding import EdgeEmbedding
+from .mixed_precision_embedding import MixedPrecisionEmbedding
 
-__all__ = ["NoiseContrastiveEstimation"]
+__all__ = [
+    "NoiseContrastiveEstimation", "WalkWindows", "EdgeEmbedding",
+    "MixedPrecisionEmbedding"
+]
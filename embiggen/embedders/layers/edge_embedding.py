@@ -0,0 +1,98 @@
+"""Layer for computing the embedding of edges from node IDs in Keras models."""
+from typing import Dict, Tuple
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.initializers import Constant   # pylint: disable=import-error
+from tensorflow.keras.layers import Layer   # pylint: disable=import-error
+
+
+class EdgeEmbedding(Layer):
+    """Layer for computing the embedding of edges from node IDs in Keras models.
+
+    The layer implements the same methods as the EdgeTransformer, but the
+    node embedding is a weight of the model, so that the batches only
+    contain the IDs of the nodes and the embedding can be fine-tuned.
+    """
+
+    methods = {
+        "Hadamard": lambda x1, x2: x1 * x2,
+        "Sum": lambda x1, x2: x1 + x2,
+        "Average": lambda x1, x2: (x1 + x2) / 2,
+        "L1": lambda x1, x2: x1 - x2,
+        "AbsoluteL1": lambda x1, x2: tf.abs(x1 - x2),
+        "L2": lambda x1, x2: tf.pow(x1 - x2, 2),
+        "Concatenate": lambda x1, x2: tf.concat((x1, x2), axis=-1),
+    }
+
+    def __init__(
+        self,
+        embedding: np.ndarray,
+        method: str = "Hadamard",
+        trainable: bool = False,
+        **kwargs: Dict
+    ):
+        """Create new EdgeEmbedding layer.
+
+        Parameters
+        -------------------------
+        embedding: np.ndarray,
+            The embedding of the nodes, used to initialize the embedding table.
+        method: str = "Hadamard",
+            Method to use for the embedding.
+            Can either be 'Hadamard', 'Sum', 'Average', 'L1', 'AbsoluteL1', 'L2' or 'Concatenate'.
+        trainable: bool = False,
+            Whether to fine-tune the embedding of the nodes.
+
+        Raises
+        -------------------------
+        ValueError,
+            If the given method is not supported.
+        """
+        if method not in EdgeEmbedding.methods:
+            raise ValueError((
+                "Given method '{}' is not supported. "
+                "Supported methods are {}."
+            ).format(
+                method, ", ".join(list(EdgeEmbedding.methods.keys()))
+            ))
+        self.method = method
+        self._initial_embedding = embedding
+        self._embedding = None
+        super().__init__(trainable=trainable, **kwargs)
+
+    def build(self, input_shape: Tuple[Tuple[int], Tuple[int]]):
+        """Build the EdgeEmbedding layer.
+
+        Parameters
+        ------------------------------
+        input_shape: Tuple[Tuple[int], Tuple[int]],
+            Shapes of the source and destination node IDs.
+        """
+        self._embedding = self.add_weight(
+            name="node_embedding",
+            shape=self._initial_embedding.shape,
+            initializer=Constant(self._initial_embedding)
+        )
+        super().build(input_shape)
+
+    def call(self, inputs: Tuple[tf.Tensor, tf.Tensor], **kwargs) -> tf.Tensor:
+        """Create call graph for current layer.
+
+        Parameters
+        ---------------------------
+        inputs: Tuple[tf.Tensor, tf.Tensor],
+            Tuple with the IDs of the source and destination nodes.
+
+        Returns
+        ---------------------------
+        The embedding of the edges.
+        """
+        sources, destinations = [
+            tf.gather(
+                self._embedding,
+                tf.reshape(tf.cast(nodes, tf.int64), (-1,))
+            )
+            for nodes in inputs
+        ]
+        return EdgeEmbedding.methods[self.method](sources, destinations)
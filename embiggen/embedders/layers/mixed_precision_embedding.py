@@ -0,0 +1,31 @@
+"""Embedding layer gathering its rows from a half precision copy of the table."""
+import tensorflow as tf
+from tensorflow.keras.layers import Embedding   # pylint: disable=import-error
+
+
+class MixedPrecisionEmbedding(Embedding):
+    """Embedding layer gathering its rows from a half precision copy of the table.
+
+    Under a mixed precision policy, the Keras Embedding layer gathers the
+    rows from the float32 table and only then casts them to the compute
+    dtype. This layer instead casts the float32 master table to the compute
+    dtype at every call, so the table is refreshed once per step, and
+    gathers the half precision rows from the copy. The gradients of the
+    rows are cast back to float32 and applied sparsely to the master table,
+    so the optimizer and its slots keep working in float32.
+    With the float32 policy the layer behaves as the Keras Embedding layer.
+    """
+
+    def call(self, inputs: tf.Tensor) -> tf.Tensor:
+        """Return the rows of the given IDs in the compute dtype.
+
+        Parameters
+        ---------------------------
+        inputs: tf.Tensor,
+            The IDs of the rows to gather.
+        """
+        if self.compute_dtype == self.dtype:
+            return super().call(inputs)
+        if inputs.dtype not in (tf.int32, tf.int64):
+            inputs = tf.cast(inputs, tf.int32)
+        return tf.gather(tf.cast(self.embeddings, self.compute_dtype), inputs)
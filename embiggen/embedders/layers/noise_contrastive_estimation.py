@@ -78,17 +78,21 @@ class NoiseContrastiveEstimation(Layer):
         predictions, labels = inputs
 
         # Computing NCE loss.
-        self.add_loss(
-            K.mean(tf.nn.nce_loss(
-                self._weights,
-                self._biases,
-                labels=labels,
-                inputs=predictions,
-                num_sampled=self.negative_samples,
-                num_classes=self.vocabulary_size,
-                num_true=self.positive_samples
-            ), axis=0)
+        losses = tf.nn.nce_loss(
+            self._weights,
+            self._biases,
+            labels=labels,
+            inputs=predictions,
+            num_sampled=self.negative_samples,
+            num_classes=self.vocabulary_size,
+            num_true=self.positive_samples
         )
+        # Batches without windows, as those of walks made only of padding,
+        # have zero loss instead of the NaN mean of an empty tensor.
+        self.add_loss(tf.math.divide_no_nan(
+            K.sum(losses),
+            tf.cast(tf.size(losses), losses.dtype)
+        ))
 
         # Computing logits for closing TF graph
         return K.dot(predictions, K.transpose(self._weights))
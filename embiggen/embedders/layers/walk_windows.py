@@ -0,0 +1,69 @@
+"""Layer for extracting the contexts and central words of walks in Keras models."""
+from typing import Dict, Tuple
+
+import tensorflow as tf
+from tensorflow.keras.layers import Layer   # pylint: disable=import-error
+
+
+class WalkWindows(Layer):
+    """Layer for extracting the contexts and central words of walks in Keras models."""
+
+    def __init__(
+        self,
+        window_size: int,
+        vocabulary_size: int,
+        **kwargs: Dict
+    ):
+        """Create new WalkWindows layer.
+
+        The layer receives a batch of walks, or of padded sequences, and
+        frames them into all the windows of size `window_size*2 + 1`.
+        The windows that include values not smaller than the vocabulary
+        size, which are used as padding, are dropped, so a batch of walks
+        made only of padding has no windows.
+
+        Parameters
+        -------------------------
+        window_size: int,
+            Window size for the local context.
+        vocabulary_size: int,
+            Number of vectors in the embedding.
+            Values not smaller than this are considered padding.
+        """
+        self.window_size = window_size
+        self.vocabulary_size = vocabulary_size
+        super().__init__(**kwargs)
+
+    def call(self, inputs: tf.Tensor, **kwargs) -> Tuple[tf.Tensor, tf.Tensor]:
+        """Create call graph for current layer.
+
+        Parameters
+        ---------------------------
+        inputs: tf.Tensor,
+            Matrix of walks.
+
+        Returns
+        ---------------------------
+        Tuple with the contexts and central words.
+        """
+        span = self.window_size*2 + 1
+        windows = tf.reshape(
+            tf.signal.frame(
+                tf.cast(inputs, tf.int64),
+                frame_length=span,
+                frame_step=1,
+                axis=1
+            ),
+            (-1, span)
+        )
+        windows = tf.boolean_mask(
+            windows,
+            tf.reduce_all(windows < self.vocabulary_size, axis=1)
+        )
+        contexts = tf.concat([
+            windows[:, :self.window_size],
+            windows[:, self.window_size + 1:]
+        ], axis=1)
+        words = windows[:, self.window_size:self.window_size + 1]
+        return contexts, words
+
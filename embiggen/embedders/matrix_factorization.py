@@ -0,0 +1,226 @@
+"""MatrixFactorization model for graph and words embedding."""
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix, csr_matrix
+
+from .embedder import Embedder
+
+
+class MatrixFactorization(Embedder):
+    """MatrixFactorization model for graph and words embedding.
+
+    The MatrixFactorization model computes the embedding without any
+    gradient descent, by factorizing with a randomized truncated SVD the
+    shifted positive pointwise mutual information (PPMI) matrix of the
+    given cooccurrences.
+
+    On texts the cooccurrences are the ones returned by the method
+    `cooccurence_matrix` of the ensmallen preprocessing module, and the
+    model is equivalent to the classic PPMI-SVD word embedding.
+    On graphs the cooccurrences can either be the ones returned by the
+    `cooccurence_matrix` method of the graph, which makes the model a
+    sampled variant of NetMF, or directly the edges of the graph, which
+    corresponds to NetMF with a window of size one.
+    """
+
+    def __init__(
+        self,
+        vocabulary_size: int,
+        embedding_size: int,
+        negative_samples: float = 1.0,
+        oversampling: int = 10,
+        power_iterations: int = 5,
+        random_state: int = 42
+    ):
+        """Create new MatrixFactorization-based Embedder object.
+
+        Parameters
+        ----------------------------
+        vocabulary_size: int,
+            Number of terms to embed.
+            In a graph this is the number of nodes, while in a text is the
+            number of the unique words.
+        embedding_size: int,
+            Dimension of the embedding.
+        negative_samples: float = 1.0,
+            The PMI is shifted by the logarithm of this value, which
+            corresponds to the number of negative samples of SkipGram.
+        oversampling: int = 10,
+            Number of additional random vectors used by the randomized SVD.
+        power_iterations: int = 5,
+            Number of power iterations used by the randomized SVD.
+            More iterations improve the accuracy on slowly decaying spectra.
+        random_state: int = 42,
+            The random state to use to make the factorization reproducible.
+
+        Raises
+        ----------------------------
+        ValueError,
+            When the embedding size is not smaller than the vocabulary size.
+        ValueError,
+            When the number of negative samples is not strictly positive.
+        """
+        if (
+            isinstance(embedding_size, int) and
+            isinstance(vocabulary_size, int) and
+            embedding_size >= vocabulary_size
+        ):
+            raise ValueError((
+                "The given embedding size ({}) must be smaller "
+                "than the vocabulary size ({})."
+            ).format(embedding_size, vocabulary_size))
+        if negative_samples <= 0:
+            raise ValueError((
+                "The given number of negative samples ({}) "
+                "is not strictly positive."
+            ).format(negative_samples))
+        self._negative_samples = negative_samples
+        self._oversampling = oversampling
+        self._power_iterations = power_iterations
+        self._random_state = random_state
+        self._embedding = None
+        super().__init__(
+            vocabulary_size=vocabulary_size,
+            embedding_size=embedding_size
+        )
+
+    def _build_model(self):
+        """No Keras model is needed for the factorization."""
+        return None
+
+    def summary(self):
+        """Print model summary."""
+        print("{}: {} terms, {} dimensions.".format(
+            self.name,
+            self._vocabulary_size,
+            self._embedding_size
+        ))
+
+    @property
+    def name(self) -> str:
+        """Return model name."""
+        return "MatrixFactorization"
+
+    @property
+    def embedding(self) -> np.ndarray:
+        """Return model embeddings."""
+        return self._embedding
+
+    def _ppmi(self, words: np.ndarray, contexts: np.ndarray, frequencies: np.ndarray) -> csr_matrix:
+        """Return the sparse shifted PPMI matrix of the given cooccurrences.
+
+        Parameters
+        ----------------------------
+        words: np.ndarray,
+            The IDs of the words.
+        contexts: np.ndarray,
+            The IDs of the contexts.
+        frequencies: np.ndarray,
+            The cooccurrences of the words and contexts.
+
+        Returns
+        ----------------------------
+        The sparse shifted PPMI matrix.
+        """
+        cooccurrences = coo_matrix(
+            (
+                np.asarray(frequencies, dtype=np.float64).flatten(),
+                (
+                    np.asarray(words, dtype=np.int64).flatten(),
+                    np.asarray(contexts, dtype=np.int64).flatten()
+                )
+            ),
+            shape=(self._vocabulary_size, self._vocabulary_size)
+        ).tocsr().tocoo()
+        total = cooccurrences.data.sum()
+        words_counts = np.asarray(cooccurrences.sum(axis=1)).flatten()
+        contexts_counts = np.asarray(cooccurrences.sum(axis=0)).flatten()
+        pmi = np.log(
+            cooccurrences.data * total /
+            (words_counts[cooccurrences.row] * contexts_counts[cooccurrences.col])
+        ) - np.log(self._negative_samples)
+        ppmi = csr_matrix(
+            (np.maximum(pmi, 0), (cooccurrences.row, cooccurrences.col)),
+            shape=cooccurrences.shape
+        )
+        ppmi.eliminate_zeros()
+        return ppmi
+
+    def _randomized_svd(self, matrix: csr_matrix) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the truncated left singular vectors and singular values.
+
+        Parameters
+        ----------------------------
+        matrix: csr_matrix,
+            The sparse matrix to factorize.
+
+        Returns
+        ----------------------------
+        Tuple with the left singular vectors and the singular values.
+        """
+        numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+            seed=self._random_state
+        )
+        components = min(
+            self._embedding_size + self._oversampling,
+            self._vocabulary_size
+        )
+        basis, _ = np.linalg.qr(matrix @ numpy_random_state.normal(
+            size=(self._vocabulary_size, components)
+        ))
+        for _ in range(self._power_iterations):
+            basis, _ = np.linalg.qr(matrix.T @ basis)
+            basis, _ = np.linalg.qr(matrix @ basis)
+        left, singular_values, _ = np.linalg.svd(
+            (matrix.T @ basis).T,
+            full_matrices=False
+        )
+        left = basis @ left
+        return left[:, :self._embedding_size], singular_values[:self._embedding_size]
+
+    def fit(self, x: Tuple[np.ndarray, np.ndarray], y: np.ndarray) -> pd.DataFrame:
+        """Fit the embedding factorizing the PPMI of the given cooccurrences.
+
+        Parameters
+        ----------------------------
+        x: Tuple[np.ndarray, np.ndarray],
+            Tuple with the words and contexts IDs.
+        y: np.ndarray,
+            The cooccurrences of the words and contexts.
+
+        Returns
+        ----------------------------
+        Dataframe with the singular values of the factorization.
+        """
+        words, contexts = x
+        left, singular_values = self._randomized_svd(
+            self._ppmi(words, contexts, y)
+        )
+        self._embedding = (left * np.sqrt(singular_values)).astype(np.float32)
+        return pd.DataFrame({
+            "singular_values": singular_values
+        })
+
+    def save_weights(self, path: str):
+        """Save model weights to given path.
+
+        Parameters
+        ---------------------------
+        path: str,
+            Path where to save model weights.
+        """
+        with open(path, "wb") as weights_file:
+            np.save(weights_file, self._embedding)
+
+    def load_weights(self, path: str):
+        """Load model weights from given path.
+
+        Parameters
+        ---------------------------
+        path: str,
+            Path from where to load model weights.
+        """
+        with open(path, "rb") as weights_file:
+            self._embedding = np.load(weights_file)
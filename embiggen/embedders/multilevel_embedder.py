@@ -0,0 +1,322 @@
+"""Multilevel coarsen-embed-refine driver for graph embedding models."""
+import os
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
+from tqdm.auto import tqdm
+
+from ..sequences import Node2VecSequence
+from .node2vec import Node2Vec
+from .skipgram import SkipGram
+
+
+class MultilevelEmbedder:
+    """Multilevel coarsen-embed-refine driver for graph embedding models.
+
+    The graph is repeatedly coarsened by collapsing a random maximal
+    matching of its edges, so that every level has roughly half the nodes
+    of the previous one. The model is trained on the smallest graph and
+    the obtained embedding is then projected on the next finer graph,
+    where it is used to warm start a new model that is refined with
+    few epochs. Most of the training is therefore executed on small graphs.
+    """
+
+    def __init__(
+        self,
+        model: Type[Node2Vec] = SkipGram,
+        embedding_size: int = 100,
+        walk_length: int = 80,
+        batch_size: int = 2**7,
+        max_levels: int = 5,
+        min_nodes_number: int = 1000,
+        matching_rounds: int = 3,
+        model_kwargs: Dict = None,
+        sequence_kwargs: Dict = None,
+        random_state: int = 42,
+        verbose: bool = True
+    ):
+        """Create new MultilevelEmbedder object.
+
+        Parameters
+        ----------------------------
+        model: Type[Node2Vec] = SkipGram,
+            The model class to train at every level, either SkipGram or CBOW.
+        embedding_size: int = 100,
+            Dimension of the embedding.
+        walk_length: int = 80,
+            Maximal length of the walks.
+        batch_size: int = 2**7,
+            Number of nodes to include in a single batch.
+        max_levels: int = 5,
+            Maximum number of coarsening levels.
+        min_nodes_number: int = 1000,
+            The coarsening stops when a level has less than the given nodes.
+        matching_rounds: int = 3,
+            Number of rounds of the randomized edge matching.
+            More rounds produce matchings closer to maximal ones.
+        model_kwargs: Dict = None,
+            Additional parameters to pass to the model, such as the window size.
+        sequence_kwargs: Dict = None,
+            Additional parameters to pass to the Node2VecSequence objects,
+            such as the return and explore weights.
+        random_state: int = 42,
+            The random state to use to make the coarsening reproducible.
+        verbose: bool = True,
+            Whether to show loading bars.
+
+        Raises
+        ----------------------------
+        ValueError,
+            If the given maximum number of levels is not a positive integer.
+        """
+        if not isinstance(max_levels, int) or max_levels < 0:
+            raise ValueError((
+                "The given maximum number of levels ({}) "
+                "is not a positive integer."
+            ).format(max_levels))
+        self._model_class = model
+        self._embedding_size = embedding_size
+        self._walk_length = walk_length
+        self._batch_size = batch_size
+        self._max_levels = max_levels
+        self._min_nodes_number = min_nodes_number
+        self._matching_rounds = matching_rounds
+        self._model_kwargs = {} if model_kwargs is None else model_kwargs
+        self._sequence_kwargs = {} if sequence_kwargs is None else sequence_kwargs
+        self._random_state = random_state
+        self._verbose = verbose
+        self._model = None
+
+    def _match_edges(self, edges: np.ndarray, nodes_number: int, random_state: int) -> np.ndarray:
+        """Return randomized matching of the given edges.
+
+        At every round, every free edge receives a random priority and the
+        edges that have the highest priority on both their endpoints are
+        added to the matching, which is therefore always valid.
+
+        Parameters
+        ----------------------------
+        edges: np.ndarray,
+            The edges of the graph.
+        nodes_number: int,
+            The number of nodes of the graph.
+        random_state: int,
+            The random state to use for the priorities.
+
+        Returns
+        ----------------------------
+        Array with the node matched to each node, or -1 for unmatched nodes.
+        """
+        numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+            seed=random_state
+        )
+        matches = np.full(nodes_number, -1, dtype=np.int64)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        for _ in range(self._matching_rounds):
+            edges = edges[
+                (matches[edges[:, 0]] == -1) & (matches[edges[:, 1]] == -1)
+            ]
+            if edges.size == 0:
+                break
+            priorities = numpy_random_state.random_sample(edges.shape[0])
+            best = np.full(nodes_number, -1.0)
+            np.maximum.at(best, edges[:, 0], priorities)
+            np.maximum.at(best, edges[:, 1], priorities)
+            dominant = edges[
+                (best[edges[:, 0]] == priorities) &
+                (best[edges[:, 1]] == priorities)
+            ]
+            matches[dominant[:, 0]] = dominant[:, 1]
+            matches[dominant[:, 1]] = dominant[:, 0]
+        return matches
+
+    def _coarsen(self, graph: EnsmallenGraph, random_state: int) -> Tuple[EnsmallenGraph, np.ndarray]:
+        """Return coarsened graph and mapping from the graph to its coarsening.
+
+        Parameters
+        ----------------------------
+        graph: EnsmallenGraph,
+            The graph to coarsen.
+        random_state: int,
+            The random state to use for the edge matching.
+
+        Returns
+        ----------------------------
+        Tuple with the coarsened graph and the array mapping each node of
+        the given graph to the node ID of the coarsened graph.
+        Nodes whose coarsened node has no edges are mapped to -1.
+        """
+        nodes_number = graph.get_nodes_number()
+        edges = graph.get_edges(directed=False).astype(np.int64)
+        matches = self._match_edges(edges, nodes_number, random_state)
+        nodes = np.arange(nodes_number)
+        representatives = np.where(
+            matches == -1,
+            nodes,
+            np.minimum(nodes, matches)
+        )
+        _, clusters = np.unique(representatives, return_inverse=True)
+        coarse_edges = clusters[edges]
+        coarse_edges = coarse_edges[coarse_edges[:, 0] != coarse_edges[:, 1]]
+        coarse_edges, weights = np.unique(
+            np.sort(coarse_edges, axis=1),
+            axis=0,
+            return_counts=True
+        )
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "edges.tsv")
+            pd.DataFrame({
+                "subject": coarse_edges[:, 0],
+                "object": coarse_edges[:, 1],
+                "weight": weights
+            }).to_csv(path, sep="\t", index=False)
+            coarse_graph = EnsmallenGraph.from_unsorted_csv(
+                edge_path=path,
+                sources_column="subject",
+                destinations_column="object",
+                directed=False,
+                weights_column="weight"
+            )
+        coarse_graph.enable()
+        # The coarsened graph assigns its own IDs to the clusters,
+        # so we remap the clusters to these IDs using the node names.
+        cluster_ids = np.full(clusters.max() + 1, -1, dtype=np.int64)
+        cluster_ids[
+            np.array(coarse_graph.get_node_names()).astype(np.int64)
+        ] = np.arange(coarse_graph.get_nodes_number())
+        return coarse_graph, cluster_ids[clusters]
+
+    def _build_hierarchy(self, graph: EnsmallenGraph) -> Tuple[List[EnsmallenGraph], List[np.ndarray]]:
+        """Return the graphs of every level and the mappings between them.
+
+        Parameters
+        ----------------------------
+        graph: EnsmallenGraph,
+            The graph to coarsen.
+
+        Returns
+        ----------------------------
+        Tuple with the list of graphs, from the finest to the coarsest,
+        and the list of mappings from each level to the following one.
+        """
+        graphs, mappings = [graph], []
+        for level in tqdm(
+            range(self._max_levels),
+            desc="Coarsening graph",
+            disable=not self._verbose
+        ):
+            nodes_number = graphs[-1].get_nodes_number()
+            if nodes_number < self._min_nodes_number:
+                break
+            coarse_graph, mapping = self._coarsen(
+                graphs[-1],
+                self._random_state + level
+            )
+            # When the matching does not shrink the graph anymore,
+            # for instance in star-like graphs, we stop the coarsening.
+            if coarse_graph.get_nodes_number() > 0.9 * nodes_number:
+                break
+            graphs.append(coarse_graph)
+            mappings.append(mapping)
+        return graphs, mappings
+
+    def fit(self, graph: EnsmallenGraph, epochs: int = 10, refinement_epochs: int = 1) -> pd.DataFrame:
+        """Fit the embedding of the given graph.
+
+        Parameters
+        ----------------------------
+        graph: EnsmallenGraph,
+            The graph to embed.
+        epochs: int = 10,
+            Number of epochs to train the model on the coarsest graph.
+        refinement_epochs: int = 1,
+            Number of epochs to refine the model on every finer graph.
+
+        Returns
+        ----------------------------
+        Dataframe with the training history of every level.
+        """
+        graphs, mappings = self._build_hierarchy(graph)
+        histories = []
+        embedding = None
+        for level in reversed(range(len(graphs))):
+            level_graph = graphs[level]
+            model = self._model_class(
+                vocabulary_size=level_graph.get_nodes_number(),
+                embedding_size=self._embedding_size,
+                **self._model_kwargs
+            )
+            if embedding is not None:
+                mapping = mappings[level]
+                projected = model.embedding.copy()
+                mask = mapping != -1
+                projected[mask] = embedding[mapping[mask]]
+                model.embedding = projected
+            sequence = Node2VecSequence(
+                level_graph,
+                walk_length=self._walk_length,
+                batch_size=self._batch_size,
+                seed=self._random_state + level,
+                **self._sequence_kwargs
+            )
+            history = model.fit(
+                sequence,
+                steps_per_epoch=sequence.steps_per_epoch,
+                epochs=epochs if embedding is None else refinement_epochs,
+                verbose=False
+            )
+            history["level"] = level
+            histories.append(history)
+            embedding = model.embedding
+        self._model = model
+        return pd.concat(histories, ignore_index=True)
+
+    @property
+    def embedding(self) -> np.ndarray:
+        """Return the embedding of the finest graph.
+
+        As for the embedders, the embedding is a read-only snapshot.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the model was not fitted yet.
+        """
+        if self._model is None:
+            raise ValueError("The model was not fitted yet.")
+        return self._model.embedding
+
+    def get_embedding_dataframe(self, term_names: List[str]) -> pd.DataFrame:
+        """Return terms embedding using given index names.
+
+        The DataFrame owns a writable copy of the embedding, so it can be
+        modified without affecting the read-only embedding of the model.
+
+        Parameters
+        -----------------------------
+        term_names: List[str],
+            List of terms to be used as index names.
+        """
+        return pd.DataFrame(
+            self.embedding.copy(),
+            index=term_names
+        )
+
+    def save_embedding(self, path: str, term_names: List[str]):
+        """Save terms embedding using given index names.
+
+        Parameters
+        -----------------------------
+        path: str,
+            Save embedding as csv to given path.
+        term_names: List[str],
+            List of terms to be used as index names.
+        """
+        # The embedding is only read, so it is not copied.
+        pd.DataFrame(
+            self.embedding,
+            index=term_names
+        ).to_csv(path, header=False)
@@ -2,12 +2,12 @@
 from typing import Union, Tuple
 
 from tensorflow.keras import backend as K   # pylint: disable=import-error
-from tensorflow.keras.layers import Embedding, Input, Lambda, Layer, Flatten   # pylint: disable=import-error
+from tensorflow.keras.layers import Input, Lambda, Layer, Flatten   # pylint: disable=import-error
 from tensorflow.keras.models import Model   # pylint: disable=import-error
 from tensorflow.keras.optimizers import Optimizer   # pylint: disable=import-error
 
 from .embedder import Embedder
-from .layers import NoiseContrastiveEstimation
+from .layers import MixedPrecisionEmbedding, NoiseContrastiveEstimation, WalkWindows
 
 
 class Node2Vec(Embedder):
@@ -20,7 +20,9 @@ class Node2Vec(Embedder):
         model_name: str,
         optimizer: Union[str, Optimizer] = "nadam",
         window_size: int = 4,
-        negative_samples: int = 10
+        negative_samples: int = 10,
+        precision: str = "float32",
+        walk_length: int = None
     ):
         """Create new Graph Embedder model.
 
@@ -36,20 +38,41 @@ class Node2Vec(Embedder):
             Name of the model.
         optimizer: Union[str, Optimizer] = "nadam",
             The optimizer to be used during the training of the model.
+        precision: str = "float32",
+            Precision of the embedding lookups.
+            Can either be 'float32', 'mixed_float16' or 'mixed_bfloat16'.
         window_size: int = 4,
             Window size for the local context.
             On the borders the window size is trimmed.
         negative_samples: int,
             The number of negative classes to randomly sample per batch.
             This single sample of negative classes is evaluated for each element in the batch.
+        walk_length: int = None,
+            Length of the walks received by the model.
+            When provided, the model receives the raw walks, padded with
+            values not smaller than the vocabulary size, and extracts the
+            windows within the model, instead of receiving the contexts
+            and the central words.
+
+        Raises
+        -------------------------------------------
+        ValueError,
+            If the given walk length cannot contain a window.
         """
+        if walk_length is not None and walk_length < window_size*2 + 1:
+            raise ValueError((
+                "The given walk length ({}) must be greater than "
+                "twice the window size ({})."
+            ).format(walk_length, window_size))
         self._model_name = model_name
+        self._walk_length = walk_length
         self._window_size = window_size
         self._negative_samples = negative_samples
         super().__init__(
             vocabulary_size=vocabulary_size,
             embedding_size=embedding_size,
-            optimizer=optimizer
+            optimizer=optimizer,
+            precision=precision
         )
 
     def _get_true_input_length(self) -> int:
@@ -92,19 +115,39 @@ class Node2Vec(Embedder):
     def _build_model(self):
         """Return Node2Vec model."""
         # Creating the inputs layers
-        true_input_layer = Input(
-            (self._get_true_input_length(), ),
-            name=Embedder.EMBEDDING_LAYER_NAME
-        )
-        true_output_layer = Input(
-            (self._get_true_output_length(), ),
-        )
+        if self._walk_length is None:
+            true_input_layer = Input(
+                (self._get_true_input_length(), ),
+                name=Embedder.EMBEDDING_LAYER_NAME
+            )
+            true_output_layer = Input(
+                (self._get_true_output_length(), ),
+            )
+            inputs = self._sort_input_layers(
+                true_input_layer,
+                true_output_layer
+            )
+        else:
+            inputs = Input(
+                (self._walk_length, ),
+                name=Embedder.EMBEDDING_LAYER_NAME
+            )
+            # The input layers are sorted as contexts and words, and since
+            # sorting swaps them or keeps them, sorting them again
+            # returns the true input and output.
+            true_input_layer, true_output_layer = self._sort_input_layers(
+                *WalkWindows(
+                    window_size=self._window_size,
+                    vocabulary_size=self._vocabulary_size
+                )(inputs)
+            )
 
         # Creating the embedding layer for the contexts
-        embedding = Embedding(
+        embedding = MixedPrecisionEmbedding(
             input_dim=self._vocabulary_size,
             output_dim=self._embedding_size,
-            input_length=self._get_true_input_length()
+            input_length=self._get_true_input_length(),
+            dtype=self._precision
         )(true_input_layer)
 
         # If there is more than one value per single sample
@@ -129,10 +172,7 @@ class Node2Vec(Embedder):
 
         # Creating the actual model
         model = Model(
-            inputs=self._sort_input_layers(
-                true_input_layer,
-                true_output_layer
-            ),
+            inputs=inputs,
             outputs=nce_loss,
             name=self._model_name
         )
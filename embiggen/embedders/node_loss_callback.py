@@ -0,0 +1,131 @@
+"""Keras callback feeding the losses of the nodes to the scheduler of a Node2VecSequence."""
+from typing import Dict
+
+import numpy as np
+from tensorflow.keras.callbacks import Callback   # pylint: disable=import-error
+
+from ..sequences import Node2VecSequence
+from ..sequences.seeds import get_batch_seed
+from .embedder import Embedder
+
+
+class NodeLossCallback(Callback):
+    """Keras callback feeding the losses of the nodes to the scheduler of a Node2VecSequence.
+
+    At the end of every epoch, walks are started from a seeded sample of
+    the start nodes of the scheduler, and the loss of each of their windows
+    is computed from the logits of the model, as the softmax cross entropy
+    of its true outputs. The loss of every node is the mean loss of the
+    windows centred on it, and is fed to the method `update_losses` of the
+    scheduler, to oversample the nodes with the highest loss.
+    """
+
+    def __init__(
+        self,
+        sequence: Node2VecSequence,
+        nodes_number: int = 2**10,
+        batch_size: int = 2**8,
+        random_state: int = 42
+    ):
+        """Create new NodeLossCallback object.
+
+        Parameters
+        -----------------------------
+        sequence: Node2VecSequence,
+            The sequence whose scheduler receives the losses.
+        nodes_number: int = 2**10,
+            Number of start nodes whose walks are measured every epoch.
+        batch_size: int = 2**8,
+            Number of windows whose logits are computed at once.
+            Every batch requires the logits of all the vocabulary,
+            so it should be reduced for large vocabularies.
+        random_state: int = 42,
+            The random state to use to sample the nodes and their walks.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the given sequence has no scheduler.
+        """
+        if sequence.scheduler is None:
+            raise ValueError(
+                "The given sequence has no scheduler to receive the losses."
+            )
+        super().__init__()
+        self._sequence = sequence
+        self._nodes_number = nodes_number
+        self._batch_size = batch_size
+        self._random_state = random_state
+
+    def get_losses(self, contexts: np.ndarray, words: np.ndarray) -> np.ndarray:
+        """Return the loss of the model on every given window.
+
+        Parameters
+        -----------------------------
+        contexts: np.ndarray,
+            The contexts of the windows.
+        words: np.ndarray,
+            The central words of the windows.
+
+        Returns
+        -----------------------------
+        Array with the loss of every window.
+        """
+        # The input of the embedding layer is the true input of the model,
+        # while the other one is its true output.
+        if self.model.input_names.index(Embedder.EMBEDDING_LAYER_NAME) == 0:
+            targets = words.reshape(-1, 1)
+        else:
+            targets = contexts
+        losses = np.empty(words.size)
+        for start in range(0, words.size, self._batch_size):
+            batch = slice(start, start + self._batch_size)
+            logits = np.asarray(
+                self.model.predict_on_batch((contexts[batch], words[batch])),
+                dtype=np.float64
+            )
+            maximum = logits.max(axis=1)
+            log_partition = maximum + np.log(
+                np.exp(logits - maximum[:, None]).sum(axis=1)
+            )
+            losses[batch] = log_partition - np.take_along_axis(
+                logits,
+                targets[batch].astype(np.int64),
+                axis=1
+            ).mean(axis=1)
+        return losses
+
+    def on_epoch_end(self, epoch: int, logs: Dict = None):
+        """Update the losses of the nodes of the scheduler.
+
+        Parameters
+        -----------------------------
+        epoch: int,
+            The epoch that just ended.
+        logs: Dict = None,
+            The logs of the epoch.
+        """
+        scheduler = self._sequence.scheduler
+        numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+            seed=get_batch_seed(self._random_state, epoch, 0)
+        )
+        nodes = numpy_random_state.choice(
+            scheduler.start_nodes,
+            size=min(self._nodes_number, scheduler.start_nodes.size),
+            replace=False
+        )
+        contexts, words = self._sequence.sample_windows(
+            nodes,
+            get_batch_seed(self._random_state, epoch, 0, stream=1)
+        )
+        if words.size == 0:
+            return
+        words = words.astype(np.int64)
+        counts = np.bincount(words, minlength=scheduler.losses.size)
+        sums = np.bincount(
+            words,
+            weights=self.get_losses(contexts, words),
+            minlength=scheduler.losses.size
+        )
+        measured = np.flatnonzero(counts)
+        scheduler.update_losses(measured, sums[measured] / counts[measured])
@@ -2,9 +2,29 @@
 from .node2vec_sequence import Node2VecSequence
 from .link_prediction_sequence import LinkPredictionSequence
 from .word2vec import Word2VecSequence
+from .node_scheduler import NodeScheduler
+from .prefetch_sequence import PrefetchSequence
+from .walk_cache import WalkCache
+from .cached_node2vec_sequence import CachedNode2VecSequence
+from .shared_node2vec_sequence import SharedNode2VecSequence
+from .token_corpus import TokenCorpus
+from .cached_word2vec_sequence import CachedWord2VecSequence
+from .streaming_word2vec_sequence import StreamingWord2VecSequence
+from .negative_edge_pool import NegativeEdgePool
+from .parallel_batches import parallel_batches
 
 __all__ = [
     "Node2VecSequence",
     "LinkPredictionSequence",
-    "Word2VecSequence"
+    "Word2VecSequence",
+    "NodeScheduler",
+    "PrefetchSequence",
+    "WalkCache",
+    "CachedNode2VecSequence",
+    "SharedNode2VecSequence",
+    "TokenCorpus",
+    "CachedWord2VecSequence",
+    "StreamingWord2VecSequence",
+    "NegativeEdgePool",
+    "parallel_batches"
 ]
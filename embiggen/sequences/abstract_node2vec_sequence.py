@@ -1,8 +1,12 @@
 """Abstract Keras Sequence object for running models on graph walks."""
 from typing import Dict
 
+import pandas as pd
 from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
 from .abstract_sequence import AbstractSequence
+from .csr_graph import CSRGraph
+from .node_scheduler import NodeScheduler
+from .walk_coverage import WalkCoverage
 
 
 class AbstractNode2VecSequence(AbstractSequence):
@@ -23,7 +27,10 @@ class AbstractNode2VecSequence(AbstractSequence):
         elapsed_epochs: int = 0,
         support_mirror_strategy: bool = False,
         seed: int = 42,
-        dense_node_mapping: Dict[int, int] = None
+        dense_node_mapping: Dict[int, int] = None,
+        scheduler: NodeScheduler = None,
+        track_coverage: bool = False,
+        return_walks: bool = False
     ):
         """Create new Node2Vec Sequence object.
 
@@ -86,7 +93,32 @@ class AbstractNode2VecSequence(AbstractSequence):
             called `get_dense_node_mapping` that returns a mapping from
             the non trap nodes (those from where a walk could start) and
             maps these nodes into a dense range of values.
+        scheduler: NodeScheduler = None,
+            Scheduler of the start nodes of the walks of every batch.
+            When provided, every epoch starts at least a walk from every
+            node, and the walks are executed on a CSRGraph built from the
+            given graph. The scheduled walks support the return and explore
+            weights, but not the node and edge type weights, the maximum
+            number of neighbours and the dense node mapping.
+        track_coverage: bool = False,
+            Whether to count how often each node appears as central and as
+            context node, and to store the coverage statistics of every epoch.
+        return_walks: bool = False,
+            Whether to return the raw matrix of walks, padded with the number
+            of nodes, instead of the contexts and the central words.
+            The windows are then extracted within the model, built with
+            the `walk_length` parameter. As for the scheduled walks, the walks
+            are executed on a CSRGraph built from the given graph.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the return or explore weights are not strictly positive.
+        ValueError,
+            If a scheduler is given, or the walks are returned, with
+            parameters that are not supported.
         """
+        CSRGraph.check_walk_weights(return_weight, explore_weight)
         self._graph = graph
         self._walk_length = walk_length
         self._iterations = iterations
@@ -96,12 +128,91 @@ class AbstractNode2VecSequence(AbstractSequence):
         self._change_node_type_weight = change_node_type_weight
         self._change_edge_type_weight = change_edge_type_weight
         self._dense_node_mapping = dense_node_mapping
+        self._scheduler = scheduler
+        self._return_walks = return_walks
+        self._csr_graph = None
+        self._source_nodes = None
+        self._coverage = WalkCoverage(
+            graph.get_nodes_number()
+        ) if track_coverage else None
+        self._coverage_history = []
+
+        if scheduler is not None or return_walks:
+            if (
+                dense_node_mapping is not None or
+                max_neighbours is not None or
+                change_node_type_weight != 1.0 or
+                change_edge_type_weight != 1.0
+            ):
+                raise ValueError((
+                    "The scheduled and returned walks do not support "
+                    "the dense node mapping, "
+                    "the maximum number of neighbours and "
+                    "the node and edge type weights."
+                ))
+            self._csr_graph = CSRGraph.from_ensmallen(graph)
+            self._source_nodes = self._csr_graph.get_source_nodes()
+        if scheduler is not None:
+            self._scheduler.setup(
+                self._source_nodes,
+                self._csr_graph.nodes_number,
+                batch_size
+            )
 
         super().__init__(
             batch_size=batch_size,
-            sample_number=self._graph.get_unique_sources_number(),
+            # The permutations of the walks on the CSRGraph index its source
+            # nodes, which must therefore be the samples of the sequence.
+            sample_number=(
+                self._graph.get_unique_sources_number()
+                if self._source_nodes is None
+                else self._source_nodes.size
+            ),
             window_size=window_size,
             elapsed_epochs=elapsed_epochs,
             support_mirror_strategy=support_mirror_strategy,
             random_state=seed
         )
+        if scheduler is not None:
+            self._scheduler.freeze_importances(self.elapsed_epochs)
+
+    @property
+    def scheduler(self) -> NodeScheduler:
+        """Return the scheduler of the start nodes, if any."""
+        return self._scheduler
+
+    @property
+    def coverage(self) -> WalkCoverage:
+        """Return the visits of the current epoch, if tracked."""
+        return self._coverage
+
+    @property
+    def coverage_history(self) -> pd.DataFrame:
+        """Return the coverage statistics of every completed epoch.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the coverage is not tracked.
+        """
+        if self._coverage is None:
+            raise ValueError(
+                "The coverage is not tracked, enable it with `track_coverage`."
+            )
+        return pd.DataFrame(self._coverage_history)
+
+    def on_epoch_end(self):
+        """Store the coverage statistics of the epoch and reset the visits.
+
+        The importances of the scheduler are frozen for the next epoch, after
+        all the batches of the ended epoch have updated the visits.
+        """
+        if self._coverage is not None:
+            self._coverage_history.append({
+                "epoch": self.elapsed_epochs,
+                **self._coverage.get_statistics()
+            })
+            self._coverage.reset()
+        super().on_epoch_end()
+        if self._scheduler is not None:
+            self._scheduler.freeze_importances(self.elapsed_epochs)
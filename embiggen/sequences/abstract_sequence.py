@@ -1,6 +1,14 @@
 """Abstract Keras Sequence object for running models on huge datasets."""
+from threading import Lock
+from typing import Dict, Tuple
+
+import numpy as np
+import tensorflow as tf
 from keras_mixed_sequence import Sequence
 
+from .seeds import get_epoch_seed
+from .tf_dataset import to_tf_dataset
+
 
 class AbstractSequence(Sequence):
     """Abstract Keras Sequence object for running models on huge datasets."""
@@ -45,9 +53,117 @@ class AbstractSequence(Sequence):
         self._shuffle = shuffle
         self._random_state = random_state
         self._support_mirror_strategy = support_mirror_strategy
+        self._permutations = {}
+        self._permutations_lock = Lock()
 
         super().__init__(
             sample_number=sample_number,
             batch_size=batch_size,
             elapsed_epochs=elapsed_epochs
         )
+
+    def _get_permutation(self, epoch: int) -> np.ndarray:
+        """Return seeded permutation of the samples of the given epoch.
+
+        The permutations of the two most recent epochs are kept, as batches
+        of consecutive epochs may be requested concurrently.
+
+        Parameters
+        ---------------
+        epoch: int,
+            The epoch whose permutation is to be returned.
+
+        Returns
+        ---------------
+        The permutation of the samples.
+        """
+        with self._permutations_lock:
+            if epoch not in self._permutations:
+                if len(self._permutations) > 1:
+                    self._permutations.pop(min(self._permutations))
+                numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+                    seed=get_epoch_seed(self._random_state, epoch)
+                )
+                self._permutations[epoch] = numpy_random_state.permutation(
+                    self.sample_number
+                )
+            return self._permutations[epoch]
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle, without the cached permutations and their lock."""
+        state = self.__dict__.copy()
+        state["_permutations"] = {}
+        del state["_permutations_lock"]
+        return state
+
+    def __setstate__(self, state: Dict):
+        """Restore the pickled state with a new lock."""
+        self.__dict__.update(state)
+        self._permutations_lock = Lock()
+
+    @property
+    def output_signature(self) -> Tuple:
+        """Return the signature of the batches, as expected by Keras.
+
+        By default the batches contain the contexts and the central words
+        of the windows, as floats when the mirror strategy is supported.
+        Since the true output value is None, the signature is a single
+        element tuple, which Keras interprets as input only.
+        """
+        dtype = tf.float64 if self._support_mirror_strategy else tf.int64
+        return ((
+            tf.TensorSpec((None, self._window_size*2), dtype),
+            tf.TensorSpec((None,), dtype)
+        ),)
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple:
+        """Return batch corresponding to given index and epoch.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple with the input data and the true output values.
+        """
+        raise NotImplementedError(
+            "The method _get_batch must be implemented in the child classes."
+        )
+
+    def __getitem__(self, idx: int) -> Tuple:
+        """Return batch corresponding to given index.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple with the input data and the true output values.
+        """
+        return self._get_batch(idx, self.elapsed_epochs)
+
+    def to_tf_dataset(self, epochs: int = None) -> tf.data.Dataset:
+        """Return TensorFlow dataset generating the batches of this sequence.
+
+        The batches are generated with a parallel map that preserves their
+        order, followed by an autotuned prefetch. The dataset can be used
+        directly in the fit method of the embedders, also within the scope
+        of a tf.distribute strategy.
+
+        Parameters
+        -----------------------------
+        epochs: int = None,
+            Number of epochs to generate. By default the dataset is infinite,
+            and the number of steps per epoch must be given to the fit method.
+
+        Returns
+        -----------------------------
+        The TensorFlow dataset.
+        """
+        return to_tf_dataset(self, epochs)
@@ -1,10 +1,10 @@
 """Abstract Keras Sequence object for running models on graph walks."""
-from typing import List
+from typing import List, Union
 
 import numpy as np  # type: ignore
-from keras_mixed_sequence import VectorSequence
 
 from .abstract_sequence import AbstractSequence
+from .token_corpus import TokenCorpus
 
 
 class AbstractWord2VecSequence(AbstractSequence):
@@ -12,22 +12,25 @@ class AbstractWord2VecSequence(AbstractSequence):
 
     def __init__(
         self,
-        sequences: List[np.ndarray],
+        sequences: Union[List[np.ndarray], TokenCorpus],
         batch_size: int,
         window_size: int = 4,
         shuffle: bool = True,
         support_mirror_strategy: bool = False,
         seed: int = 42,
         elapsed_epochs: int = 0,
+        walk_length: int = None,
+        bucket_size: int = 1
     ):
         """Create new Node2Vec Sequence object.
 
         Parameters
         -----------------------------
-        sequences: List[np.ndarray],
-            List of sequences of integers.
+        sequences: Union[List[np.ndarray], TokenCorpus],
+            List of sequences of integers, or the corpus of the sequences.
+            Lists are converted to a TokenCorpus.
         batch_size: int,
-            Number of nodes to include in a single batch.
+            Average number of sequences to include in a single batch.
         window_size: int = 4,
             Window size for the local context.
             On the borders the window size is trimmed.
@@ -45,25 +48,104 @@ class AbstractWord2VecSequence(AbstractSequence):
             The seed to use to make extraction reproducible.
         elapsed_epochs: int = 0,
             Number of elapsed epochs to init state of generator.
-        """
+        walk_length: int = None,
+            When provided, the batches are the sequences split into padded
+            rows of the given length, overlapping so that no window is lost,
+            instead of the contexts and the central words.
+            The windows are then extracted within the model, built with
+            the same `walk_length` parameter.
+        bucket_size: int = 1,
+            Number of consecutive batches whose sequences are sorted by
+            length and split so that every batch produces a similar
+            number of windows, while containing at least one sequence.
+            By default, no bucketing is executed and every batch contains
+            the given number of sequences.
 
-        self._sequences = VectorSequence(
-            sequences,
-            batch_size,
-            seed=seed,
-            elapsed_epochs=elapsed_epochs
-        )
+        Raises
+        -----------------------------
+        ValueError,
+            If the given walk length cannot contain a window.
+        ValueError,
+            If the given bucket size is not strictly positive.
+        """
+        if walk_length is not None and walk_length <= window_size*2:
+            raise ValueError((
+                "The given walk length ({}) must be greater than "
+                "twice the window size ({})."
+            ).format(walk_length, window_size))
+        self._walk_length = walk_length
+        if bucket_size < 1:
+            raise ValueError((
+                "The given bucket size ({}) must be strictly positive."
+            ).format(bucket_size))
+        self._bucket_size = bucket_size
+        if not isinstance(sequences, TokenCorpus):
+            sequences = TokenCorpus.from_sequences(sequences)
+        self._corpus = sequences
         super().__init__(
             window_size=window_size,
             shuffle=shuffle,
-            sample_number=self._sequences.sample_number,
+            sample_number=len(self._corpus),
             batch_size=batch_size,
             elapsed_epochs=elapsed_epochs,
             support_mirror_strategy=support_mirror_strategy,
             random_state=seed
         )
 
-    def on_epoch_end(self):
-        """Shuffles given sequences object."""
-        super().on_epoch_end()
-        self._sequences.on_epoch_end()
+    def _get_sequences(self, idx: int, epoch: int) -> List[np.ndarray]:
+        """Return the sequences of the batch with given index and epoch.
+
+        The sequences of every bucket of consecutive batches are sorted by
+        length and split by their cumulative number of windows, so that
+        every batch of the bucket produces a similar number of windows.
+        The bounds of the batches are moved forward when needed, so that
+        every batch contains at least one sequence, also with lengths so
+        skewed that the windows are all in few sequences.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        List with the sequences of the batch.
+        """
+        first_batch = idx - idx % self._bucket_size
+        batches_number = min(
+            self._bucket_size,
+            self.steps_per_epoch - first_batch
+        )
+        bucket = slice(
+            first_batch*self._batch_size,
+            min((first_batch + batches_number)*self._batch_size, self.sample_number)
+        )
+        if self._shuffle:
+            indices = self._get_permutation(epoch)[bucket]
+        else:
+            indices = np.arange(bucket.start, bucket.stop)
+        lengths = self._corpus.get_lengths(indices)
+        order = np.argsort(lengths, kind="stable")
+        windows = np.cumsum(np.maximum(lengths[order] - self._window_size*2, 0))
+        batches = np.arange(1, batches_number)
+        # The bounds are made strictly increasing by shifting each one
+        # after the previous, and capped to leave a sequence to the next.
+        shifts = np.maximum.accumulate(np.maximum(np.searchsorted(
+            windows,
+            windows[-1] * batches / batches_number,
+            side="right"
+        ) - batches, 0))
+        bounds = np.concatenate([
+            [0],
+            np.minimum(shifts, indices.size - batches_number) + batches,
+            [indices.size]
+        ])
+        position = idx - first_batch
+        return [
+            sequence.astype(np.uint64)
+            for sequence in self._corpus.get_sequences(
+                indices[order[bounds[position]:bounds[position + 1]]]
+            )
+        ]
@@ -0,0 +1,107 @@
+"""Keras Sequence object for running CBOW and SkipGram on cached graph walks."""
+from typing import Tuple, Union
+
+import numpy as np  # type: ignore
+from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
+
+from .abstract_sequence import AbstractSequence
+from .csr_graph import CSRGraph
+from .walk_cache import WalkCache
+
+
+class CachedNode2VecSequence(AbstractSequence):
+    """Keras Sequence object for running CBOW and SkipGram on cached graph walks.
+
+    Differently from the Node2VecSequence, the walks are not generated at
+    every epoch but read from a WalkCache, so that they are generated only
+    once for all the epochs and for all the models trained on the graph.
+    Every epoch the cached walks are visited in a different seeded order.
+    """
+
+    def __init__(
+        self,
+        graph: Union[EnsmallenGraph, CSRGraph],
+        walk_cache: WalkCache,
+        batch_size: int,
+        window_size: int = 4,
+        shuffle: bool = True,
+        elapsed_epochs: int = 0,
+        support_mirror_strategy: bool = False,
+        seed: int = 42
+    ):
+        """Create new CachedNode2VecSequence object.
+
+        Parameters
+        -----------------------------
+        graph: Union[EnsmallenGraph, CSRGraph],
+            The graph whose walks are to be used.
+        walk_cache: WalkCache,
+            The cache of the walks.
+        batch_size: int,
+            Number of walks to include in a single batch.
+        window_size: int = 4,
+            Window size for the local context.
+            On the borders the window size is trimmed.
+        shuffle: bool = True,
+            Whether to shuffle the walks at every epoch.
+        elapsed_epochs: int = 0,
+            Number of elapsed epochs to init state of generator.
+        support_mirror_strategy: bool = False,
+            Wethever to patch support for mirror strategy.
+            At the time of writing, TensorFlow's MirrorStrategy does not support
+            input values different from floats, therefore to support it we need
+            to convert the unsigned int 32 values that represent the indices of
+            the embedding layers we receive from Ensmallen to floats.
+            This will generally slow down performance, but in the context of
+            exploiting multiple GPUs it may be unnoticeable.
+        seed: int = 42,
+            The seed to use to make the shuffling reproducible.
+        """
+        if isinstance(graph, EnsmallenGraph):
+            graph = CSRGraph.from_ensmallen(graph)
+        self._nodes_number = graph.nodes_number
+        self._walks = walk_cache.get_walks(graph)
+        super().__init__(
+            batch_size=batch_size,
+            sample_number=self._walks.shape[0],
+            window_size=window_size,
+            shuffle=shuffle,
+            elapsed_epochs=elapsed_epochs,
+            support_mirror_strategy=support_mirror_strategy,
+            random_state=seed
+        )
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
+        """Return batch corresponding to given index and epoch.
+
+        The return tuple of tuples is composed of an inner tuple, containing
+        the contexts and the words vectors, as returned by the Node2VecSequence.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple of tuples with input data.
+        """
+        batch = slice(idx*self._batch_size, (idx + 1)*self._batch_size)
+        if self._shuffle:
+            # Sorting the rows keeps the reads from the memory map sequential.
+            walks = self._walks[np.sort(
+                self._get_permutation(epoch)[batch]
+            )]
+        else:
+            walks = self._walks[batch]
+        contexts, words = CSRGraph.get_windows(
+            walks,
+            self._window_size,
+            self._nodes_number
+        )
+
+        if self._support_mirror_strategy:
+            return (contexts.astype(float), words.astype(float)), None
+        return (contexts, words), None
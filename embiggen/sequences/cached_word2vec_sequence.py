@@ -0,0 +1,164 @@
+"""Keras Sequence object for running CBOW and SkipGram on cached text windows."""
+import hashlib
+import os
+from threading import get_ident
+from typing import List, Tuple, Union
+
+import numpy as np  # type: ignore
+
+from .abstract_sequence import AbstractSequence
+from .seeds import get_batch_seed
+from .token_corpus import TokenCorpus
+
+
+class CachedWord2VecSequence(AbstractSequence):
+    """Keras Sequence object for running CBOW and SkipGram on cached text windows.
+
+    Differently from the Word2VecSequence, the windows of the sequences are
+    not rebuilt at every epoch: the positions of the central words of all
+    the windows are computed once, optionally stored in a memory-mapped
+    file, and every epoch only visits them in a different seeded order.
+    The contexts are gathered from the corpus tokens, so the cache holds a
+    single integer per window instead of the whole window.
+
+    Optionally, the frequent central words are subsampled with a mask
+    drawn again at every epoch, as in the word2vec paper.
+    """
+
+    def __init__(
+        self,
+        sequences: Union[List[np.ndarray], TokenCorpus],
+        batch_size: int,
+        window_size: int = 4,
+        shuffle: bool = True,
+        directory: str = None,
+        subsampling_threshold: float = None,
+        support_mirror_strategy: bool = False,
+        seed: int = 42,
+        elapsed_epochs: int = 0
+    ):
+        """Create new CachedWord2VecSequence object.
+
+        Parameters
+        -----------------------------
+        sequences: Union[List[np.ndarray], TokenCorpus],
+            List of sequences of integers, or the corpus of the sequences.
+        batch_size: int,
+            Number of windows to include in a single batch.
+        window_size: int = 4,
+            Window size for the local context.
+            On the borders the window size is trimmed.
+        shuffle: bool = True,
+            Whether to shuffle the windows at every epoch.
+        directory: str = None,
+            Directory where to store the memory-mapped positions of the windows.
+            The positions only depend on the lengths of the sequences and on
+            the window size, and are reused if already present.
+            By default, the positions are kept in memory.
+        subsampling_threshold: float = None,
+            Threshold of the subsampling of the frequent words.
+            Every central word is kept with probability
+            sqrt(threshold / frequency) + threshold / frequency.
+            By default, no subsampling is executed.
+        support_mirror_strategy: bool = False,
+            Wethever to patch support for mirror strategy.
+            At the time of writing, TensorFlow's MirrorStrategy does not support
+            input values different from floats, therefore to support it we need
+            to convert the unsigned int 32 values that represent the indices of
+            the embedding layers we receive from Ensmallen to floats.
+            This will generally slow down performance, but in the context of
+            exploiting multiple GPUs it may be unnoticeable.
+        seed: int = 42,
+            The seed to use to make extraction reproducible.
+        elapsed_epochs: int = 0,
+            Number of elapsed epochs to init state of generator.
+        """
+        if not isinstance(sequences, TokenCorpus):
+            sequences = TokenCorpus.from_sequences(sequences)
+        self._corpus = sequences
+        self._context_offsets = np.concatenate([
+            np.arange(-window_size, 0),
+            np.arange(1, window_size + 1)
+        ])
+        if directory is None:
+            self._centres = self._corpus.get_window_centres(window_size)
+        else:
+            self._centres = self._load_centres(directory, window_size)
+        self._keep_probabilities = None
+        if subsampling_threshold is not None:
+            frequencies = np.bincount(self._corpus.tokens) / self._corpus.tokens.size
+            self._keep_probabilities = np.minimum(1.0, (
+                np.sqrt(subsampling_threshold / np.maximum(frequencies, 1e-12)) +
+                subsampling_threshold / np.maximum(frequencies, 1e-12)
+            ))
+        super().__init__(
+            batch_size=batch_size,
+            sample_number=self._centres.size,
+            window_size=window_size,
+            shuffle=shuffle,
+            elapsed_epochs=elapsed_epochs,
+            support_mirror_strategy=support_mirror_strategy,
+            random_state=seed
+        )
+
+    def _load_centres(self, directory: str, window_size: int) -> np.ndarray:
+        """Return the memory-mapped positions of the windows centres.
+
+        The positions are computed and stored if not already present.
+
+        Parameters
+        -----------------------------
+        directory: str,
+            Directory where to store the positions.
+        window_size: int,
+            Window size for the local context.
+
+        Returns
+        -----------------------------
+        Read-only memory map of the positions of the central words.
+        """
+        os.makedirs(directory, exist_ok=True)
+        key = hashlib.sha256(np.ascontiguousarray(self._corpus.offsets).tobytes())
+        key.update(str(window_size).encode("utf-8"))
+        path = os.path.join(directory, "{}.npy".format(key.hexdigest()))
+        if not os.path.exists(path):
+            temporary_path = "{}.{}.{}.tmp.npy".format(path, os.getpid(), get_ident())
+            np.save(temporary_path, self._corpus.get_window_centres(window_size))
+            os.replace(temporary_path, path)
+        return np.load(path, mmap_mode="r")
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
+        """Return batch corresponding to given index and epoch.
+
+        The return tuple of tuples is composed of an inner tuple, containing
+        the contexts and the words vectors, as returned by the Word2VecSequence.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple of tuples with input data.
+        """
+        batch = slice(idx*self._batch_size, (idx + 1)*self._batch_size)
+        if self._shuffle:
+            # Sorting the positions keeps the reads from the memory maps local.
+            centres = self._centres[np.sort(self._get_permutation(epoch)[batch])]
+        else:
+            centres = self._centres[batch]
+        words = self._corpus.tokens[centres]
+        if self._keep_probabilities is not None:
+            numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+                seed=get_batch_seed(self._random_state, epoch, idx)
+            )
+            kept = numpy_random_state.random_sample(words.size) < self._keep_probabilities[words]
+            centres, words = centres[kept], words[kept]
+        contexts = self._corpus.tokens[centres[:, None] + self._context_offsets]
+
+        if self._support_mirror_strategy:
+            return (contexts.astype(float), words.astype(float)), None
+        return (contexts, words), None
@@ -0,0 +1,703 @@
+"""Compressed sparse row graph to execute random walks from given nodes."""
+import hashlib
+import os
+from threading import get_ident
+from typing import Dict, List, Tuple
+
+import numpy as np
+from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
+
+
+class CSRGraph:
+    """Compressed sparse row graph to execute random walks from given nodes.
+
+    Differently from the walks executed within EnsmallenGraph, these walks
+    start from the nodes requested by the caller, which allows to schedule
+    exactly which nodes are visited in every batch.
+    The walks are vectorized over all the walkers of a batch and support
+    weighted graphs and the second order return and explore weights,
+    the latter using rejection sampling.
+
+    The walks are returned as a matrix: when a walk reaches a trap node,
+    the remaining positions are filled with the number of nodes of the
+    graph, which is never a valid node ID.
+
+    The arrays of the graph can be saved to a directory and loaded back as
+    memory maps: a memory-mapped graph is pickled as the path of its
+    directory, so processes attach to the same pages instead of copying them.
+    """
+
+    ARRAYS = ("indptr", "indices", "cumulative_weights")
+    # File written last by save, marking the saved graph as complete.
+    COMPLETE = "complete"
+    # Rounds of rejection sampling after which the walks still pending
+    # draw their next node from the exact distribution.
+    REJECTION_ROUNDS = 16
+    # Rounds of sampling of the negative edges after which the graphs to
+    # avoid are considered too dense to sample the requested edges.
+    NEGATIVE_SAMPLING_ROUNDS = 2**8
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        cumulative_weights: np.ndarray = None
+    ):
+        """Create new CSRGraph object.
+
+        Parameters
+        ---------------------------
+        indptr: np.ndarray,
+            Offsets of the neighbours of every node, of length nodes number + 1.
+        indices: np.ndarray,
+            Neighbours of every node, sorted within each node.
+        cumulative_weights: np.ndarray = None,
+            Cumulative sum of the edge weights, starting with a zero.
+            If None, the graph is treated as unweighted.
+        """
+        self._indptr = indptr
+        self._indices = indices
+        self._cumulative_weights = cumulative_weights
+        self._directory = None
+
+    @staticmethod
+    def from_edges(
+        edges: np.ndarray,
+        nodes_number: int,
+        weights: np.ndarray = None
+    ) -> "CSRGraph":
+        """Return new CSRGraph built from the given directed edges.
+
+        Parameters
+        ---------------------------
+        edges: np.ndarray,
+            Matrix with the source and destination of every edge.
+        nodes_number: int,
+            Number of nodes of the graph.
+        weights: np.ndarray = None,
+            Weights of the edges. If None, the graph is unweighted.
+
+        Returns
+        ---------------------------
+        The CSRGraph object.
+        """
+        edges = np.asarray(edges, dtype=np.int64)
+        order = np.lexsort((edges[:, 1], edges[:, 0]))
+        sources = edges[order, 0]
+        indices = edges[order, 1].astype(CSRGraph.get_nodes_dtype(nodes_number))
+        indptr = np.zeros(nodes_number + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=nodes_number), out=indptr[1:])
+        cumulative_weights = None
+        if weights is not None:
+            cumulative_weights = np.zeros(order.size + 1, dtype=np.float64)
+            np.cumsum(
+                np.asarray(weights, dtype=np.float64)[order],
+                out=cumulative_weights[1:]
+            )
+        return CSRGraph(indptr, indices, cumulative_weights)
+
+    @staticmethod
+    def from_ensmallen(graph: EnsmallenGraph) -> "CSRGraph":
+        """Return new CSRGraph built from the given EnsmallenGraph.
+
+        Parameters
+        ---------------------------
+        graph: EnsmallenGraph,
+            The graph to convert.
+
+        Returns
+        ---------------------------
+        The CSRGraph object.
+        """
+        edges = graph.get_edges(directed=True)
+        weights = graph.get_weights()
+        # Unweighted graphs do not return a weight for every edge.
+        if weights is None or len(weights) != len(edges):
+            weights = None
+        return CSRGraph.from_edges(edges, graph.get_nodes_number(), weights)
+
+    def save(self, directory: str):
+        """Save the arrays of the graph to the given directory.
+
+        Every array is first written to a temporary file and then moved
+        into place, and a marker file is written after all the arrays, so
+        concurrent processes never load partial arrays or partial graphs.
+
+        Parameters
+        ---------------------------
+        directory: str,
+            The directory where to save the graph.
+        """
+        os.makedirs(directory, exist_ok=True)
+        complete_path = os.path.join(directory, CSRGraph.COMPLETE)
+        for path in (complete_path, os.path.join(directory, "cumulative_weights.npy")):
+            # Remove the marker and the weights of a graph previously saved here.
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        for name in CSRGraph.ARRAYS:
+            array = getattr(self, "_{}".format(name))
+            if array is None:
+                continue
+            path = os.path.join(directory, "{}.npy".format(name))
+            temporary_path = "{}.{}.{}.tmp.npy".format(path, os.getpid(), get_ident())
+            np.save(temporary_path, array)
+            os.replace(temporary_path, path)
+        with open(complete_path, "w"):
+            pass
+
+    @staticmethod
+    def is_saved(directory: str) -> bool:
+        """Return whether the given directory contains a completely saved graph.
+
+        Parameters
+        ---------------------------
+        directory: str,
+            The directory where the graph may have been saved.
+        """
+        return os.path.exists(os.path.join(directory, CSRGraph.COMPLETE))
+
+    @staticmethod
+    def load(directory: str, mmap_mode: str = "r") -> "CSRGraph":
+        """Return the CSRGraph saved in the given directory.
+
+        Parameters
+        ---------------------------
+        directory: str,
+            The directory where the graph was saved.
+        mmap_mode: str = "r",
+            The memory map mode to use to load the arrays.
+            If None, the arrays are read into memory.
+
+        Raises
+        ---------------------------
+        ValueError,
+            If the given directory does not contain a completely saved graph.
+
+        Returns
+        ---------------------------
+        The CSRGraph object.
+        """
+        if not CSRGraph.is_saved(directory):
+            raise ValueError((
+                "The given directory {} does not contain a saved graph."
+            ).format(directory))
+        arrays = {}
+        for name in CSRGraph.ARRAYS:
+            path = os.path.join(directory, "{}.npy".format(name))
+            if os.path.exists(path):
+                arrays[name] = np.load(path, mmap_mode=mmap_mode)
+        if "indptr" not in arrays or "indices" not in arrays:
+            raise ValueError((
+                "The given directory {} does not contain a saved graph."
+            ).format(directory))
+        graph = CSRGraph(**arrays)
+        if mmap_mode is not None:
+            graph._directory = os.path.abspath(directory)  # pylint: disable=protected-access
+        return graph
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle, only the directory for memory-mapped graphs."""
+        if self._directory is not None:
+            return {"directory": self._directory}
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: Dict):
+        """Restore the pickled state, attaching again to the memory maps."""
+        if "directory" in state:
+            state = CSRGraph.load(state["directory"]).__dict__
+        self.__dict__.update(state)
+
+    @staticmethod
+    def check_walk_weights(return_weight: float, explore_weight: float):
+        """Raise an error if the given walk weights are not strictly positive.
+
+        Parameters
+        ---------------------------
+        return_weight: float,
+            Weight on the probability of returning to the previous node.
+        explore_weight: float,
+            Weight on the probability of visiting a node that is
+            not a neighbour of the previous node.
+
+        Raises
+        ---------------------------
+        ValueError,
+            If the return or explore weights are not strictly positive.
+        """
+        if not return_weight > 0 or not explore_weight > 0:
+            raise ValueError((
+                "The given return weight ({}) and explore weight ({}) "
+                "must be strictly positive."
+            ).format(return_weight, explore_weight))
+
+    @staticmethod
+    def get_nodes_dtype(nodes_number: int) -> np.dtype:
+        """Return the smallest unsigned dtype for the given number of nodes.
+
+        The dtype can also represent the padding value, that is the
+        number of nodes itself.
+
+        Parameters
+        ---------------------------
+        nodes_number: int,
+            Number of nodes of the graph.
+
+        Returns
+        ---------------------------
+        The numpy dtype.
+        """
+        return np.uint32 if nodes_number < np.iinfo(np.uint32).max else np.uint64
+
+    @property
+    def nodes_number(self) -> int:
+        """Return number of nodes of the graph."""
+        return self._indptr.size - 1
+
+    @property
+    def edges_number(self) -> int:
+        """Return number of directed edges of the graph."""
+        return self._indices.size
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Return the outbound degree of every node."""
+        return np.diff(self._indptr)
+
+    @property
+    def fingerprint(self) -> str:
+        """Return hash identifying the graph topology and weights."""
+        fingerprint = hashlib.sha256()
+        fingerprint.update(self._indptr.tobytes())
+        fingerprint.update(self._indices.tobytes())
+        if self._cumulative_weights is not None:
+            fingerprint.update(self._cumulative_weights.tobytes())
+        return fingerprint.hexdigest()
+
+    def get_source_nodes(self) -> np.ndarray:
+        """Return the nodes from where a walk can start."""
+        return np.flatnonzero(self.degrees > 0)
+
+    def has_edges(self, sources: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+        """Return boolean mask of the given edges that exist in the graph.
+
+        The destinations are searched within the sorted neighbours of their
+        sources with a vectorized binary search, so no array proportional
+        to the number of edges is allocated, and memory-mapped graphs
+        shared by multiple processes are only read.
+
+        Parameters
+        ---------------------------
+        sources: np.ndarray,
+            The source nodes of the edges.
+        destinations: np.ndarray,
+            The destination nodes of the edges.
+
+        Returns
+        ---------------------------
+        Boolean mask of the existing edges.
+        """
+        if self.edges_number == 0:
+            return np.zeros(len(sources), dtype=bool)
+        sources = np.asarray(sources, dtype=np.int64)
+        destinations = np.asarray(destinations, dtype=np.int64)
+        lower = self._indptr[sources]
+        upper = self._indptr[sources + 1]
+        ends = upper
+        searching = lower < upper
+        while searching.any():
+            middle = (lower + upper) // 2
+            right = searching & (
+                self._indices[np.minimum(middle, self.edges_number - 1)] < destinations
+            )
+            lower = np.where(right, middle + 1, lower)
+            upper = np.where(searching & ~right, middle, upper)
+            searching = lower < upper
+        return (lower < ends) & (
+            self._indices[np.minimum(lower, self.edges_number - 1)] == destinations
+        )
+
+    def sample_edges(
+        self,
+        number: int,
+        random_state: np.random.RandomState  # pylint: disable=no-member
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return uniformly sampled edges of the graph.
+
+        Parameters
+        ---------------------------
+        number: int,
+            Number of edges to sample.
+        random_state: np.random.RandomState,
+            The random state to use for the sampling.
+
+        Returns
+        ---------------------------
+        Tuple with the sources and destinations of the edges.
+        """
+        edges = random_state.randint(self.edges_number, size=number)
+        sources = np.searchsorted(self._indptr, edges, side="right") - 1
+        return sources.astype(self._indices.dtype), self._indices[edges]
+
+    def sample_negative_edges(
+        self,
+        number: int,
+        random_state: np.random.RandomState,  # pylint: disable=no-member
+        graphs_to_avoid: List["CSRGraph"] = ()
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return uniformly sampled pairs of nodes not in the graphs to avoid.
+
+        Parameters
+        ---------------------------
+        number: int,
+            Number of pairs to sample.
+        random_state: np.random.RandomState,
+            The random state to use for the sampling.
+        graphs_to_avoid: List[CSRGraph] = (),
+            The graphs whose edges must not be sampled, for instance
+            this graph itself to avoid false negatives.
+
+        Raises
+        ---------------------------
+        ValueError,
+            If the requested pairs are not found within the maximum number
+            of sampling rounds, as the graphs to avoid are too dense.
+
+        Returns
+        ---------------------------
+        Tuple with the sources and destinations of the pairs.
+        """
+        dtype = self._indices.dtype
+        sources = np.empty(0, dtype=dtype)
+        destinations = np.empty(0, dtype=dtype)
+        for _ in range(CSRGraph.NEGATIVE_SAMPLING_ROUNDS):
+            if sources.size >= number:
+                break
+            missing = number - sources.size
+            new_sources = random_state.randint(self.nodes_number, size=missing).astype(dtype)
+            new_destinations = random_state.randint(self.nodes_number, size=missing).astype(dtype)
+            valid = np.ones(missing, dtype=bool)
+            for graph in graphs_to_avoid:
+                valid &= ~graph.has_edges(new_sources, new_destinations)
+            sources = np.concatenate([sources, new_sources[valid]])
+            destinations = np.concatenate([destinations, new_destinations[valid]])
+        if sources.size < number:
+            raise ValueError((
+                "Only {} of the {} requested negative edges were found in {} "
+                "sampling rounds: the graphs to avoid are too dense."
+            ).format(sources.size, number, CSRGraph.NEGATIVE_SAMPLING_ROUNDS))
+        return sources, destinations
+
+    def sample_neighbours(
+        self,
+        nodes: np.ndarray,
+        random_state: np.random.RandomState  # pylint: disable=no-member
+    ) -> np.ndarray:
+        """Return a random neighbour for each of the given nodes.
+
+        Parameters
+        ---------------------------
+        nodes: np.ndarray,
+            The nodes, which must not be traps.
+        random_state: np.random.RandomState,
+            The random state to use for the sampling.
+
+        Returns
+        ---------------------------
+        The sampled neighbours.
+        """
+        starts = self._indptr[nodes]
+        ends = self._indptr[nodes + 1]
+        if self._cumulative_weights is None:
+            offsets = starts + (
+                random_state.random_sample(nodes.size) * (ends - starts)
+            ).astype(np.int64)
+        else:
+            lower = self._cumulative_weights[starts]
+            upper = self._cumulative_weights[ends]
+            offsets = np.searchsorted(
+                self._cumulative_weights,
+                lower + random_state.random_sample(nodes.size) * (upper - lower),
+                side="right"
+            ) - 1
+        return self._indices[np.clip(offsets, starts, ends - 1)]
+
+    def _sample_second_order(
+        self,
+        nodes: np.ndarray,
+        previous: np.ndarray,
+        return_weight: float,
+        explore_weight: float,
+        random_state: np.random.RandomState  # pylint: disable=no-member
+    ) -> np.ndarray:
+        """Return the next nodes of node2vec walks using rejection sampling.
+
+        The walks whose proposals are all rejected for the given number of
+        rounds, which happens when most of their neighbours have a small
+        weight, draw their next node from the exact distribution instead.
+
+        Parameters
+        ---------------------------
+        nodes: np.ndarray,
+            The current nodes of the walks.
+        previous: np.ndarray,
+            The previous nodes of the walks.
+        return_weight: float,
+            Weight on the probability of returning to the previous node.
+        explore_weight: float,
+            Weight on the probability of visiting a node that is
+            not a neighbour of the previous node.
+        random_state: np.random.RandomState,
+            The random state to use for the sampling.
+
+        Returns
+        ---------------------------
+        The sampled neighbours.
+        """
+        maximal_weight = max(return_weight, explore_weight, 1.0)
+        neighbours = np.empty_like(nodes)
+        pending = np.arange(nodes.size)
+        for _ in range(CSRGraph.REJECTION_ROUNDS):
+            if pending.size == 0:
+                break
+            proposals = self.sample_neighbours(nodes[pending], random_state)
+            weights = np.where(
+                proposals == previous[pending],
+                return_weight,
+                np.where(
+                    self.has_edges(previous[pending], proposals),
+                    1.0,
+                    explore_weight
+                )
+            )
+            accepted = random_state.random_sample(pending.size) * maximal_weight < weights
+            neighbours[pending[accepted]] = proposals[accepted]
+            pending = pending[~accepted]
+        for walk in pending:
+            neighbours[walk] = self._sample_second_order_exactly(
+                nodes[walk],
+                previous[walk],
+                return_weight,
+                explore_weight,
+                random_state
+            )
+        return neighbours
+
+    def _sample_second_order_exactly(
+        self,
+        node: int,
+        previous: int,
+        return_weight: float,
+        explore_weight: float,
+        random_state: np.random.RandomState  # pylint: disable=no-member
+    ) -> int:
+        """Return the next node of a node2vec walk computing all the transition weights.
+
+        Parameters
+        ---------------------------
+        node: int,
+            The current node of the walk.
+        previous: int,
+            The previous node of the walk.
+        return_weight: float,
+            Weight on the probability of returning to the previous node.
+        explore_weight: float,
+            Weight on the probability of visiting a node that is
+            not a neighbour of the previous node.
+        random_state: np.random.RandomState,
+            The random state to use for the sampling.
+
+        Returns
+        ---------------------------
+        The sampled neighbour.
+        """
+        start, end = self._indptr[node], self._indptr[node + 1]
+        candidates = self._indices[start:end]
+        if self._cumulative_weights is None:
+            weights = np.ones(candidates.size)
+        else:
+            weights = np.diff(self._cumulative_weights[start:end + 1])
+        weights = weights * np.where(
+            candidates == previous,
+            return_weight,
+            np.where(
+                self.has_edges(np.full(candidates.size, previous), candidates),
+                1.0,
+                explore_weight
+            )
+        )
+        cumulative_weights = np.cumsum(weights)
+        if cumulative_weights[-1] <= 0:
+            return candidates[random_state.randint(candidates.size)]
+        return candidates[min(
+            np.searchsorted(
+                cumulative_weights,
+                random_state.random_sample() * cumulative_weights[-1],
+                side="right"
+            ),
+            candidates.size - 1
+        )]
+
+    def walk(
+        self,
+        start_nodes: np.ndarray,
+        walk_length: int,
+        iterations: int = 1,
+        return_weight: float = 1.0,
+        explore_weight: float = 1.0,
+        random_state: int = 42
+    ) -> np.ndarray:
+        """Return random walks starting from the given nodes.
+
+        Parameters
+        ---------------------------
+        start_nodes: np.ndarray,
+            The nodes from where to start the walks.
+        walk_length: int,
+            Length of the walks.
+        iterations: int = 1,
+            Number of walks to start from every node.
+            The walks of the same node are consecutive rows.
+        return_weight: float = 1.0,
+            Weight on the probability of returning to the same node the walk just came from.
+            Equal to the inverse of p in the Node2Vec paper.
+        explore_weight: float = 1.0,
+            Weight on the probability of visiting a neighbor node
+            to the one we're coming from in the random walk.
+            Equal to the inverse of q in the Node2Vec paper.
+        random_state: int = 42,
+            The random state to use to make the walks reproducible.
+
+        Raises
+        ---------------------------
+        ValueError,
+            If the return or explore weights are not strictly positive.
+
+        Returns
+        ---------------------------
+        Matrix of walks, padded with the number of nodes after traps.
+        """
+        CSRGraph.check_walk_weights(return_weight, explore_weight)
+        start_nodes = np.repeat(start_nodes, iterations)
+        numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+            seed=random_state
+        )
+        second_order = return_weight != 1.0 or explore_weight != 1.0
+        degrees = self.degrees
+        walks = np.full(
+            (len(start_nodes), walk_length),
+            self.nodes_number,
+            dtype=self._indices.dtype
+        )
+        walks[:, 0] = start_nodes
+        alive = np.flatnonzero(degrees[walks[:, 0]] > 0)
+        for step in range(1, walk_length):
+            if alive.size == 0:
+                break
+            nodes = walks[alive, step - 1].astype(np.int64)
+            if second_order and step > 1:
+                neighbours = self._sample_second_order(
+                    nodes,
+                    walks[alive, step - 2].astype(np.int64),
+                    return_weight,
+                    explore_weight,
+                    numpy_random_state
+                )
+            else:
+                neighbours = self.sample_neighbours(nodes, numpy_random_state)
+            walks[alive, step] = neighbours
+            alive = alive[degrees[neighbours] > 0]
+        return walks
+
+    def walk_windows(
+        self,
+        start_nodes: np.ndarray,
+        walk_length: int,
+        window_size: int,
+        iterations: int = 1,
+        return_weight: float = 1.0,
+        explore_weight: float = 1.0,
+        random_state: int = 42
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return contexts and central words of random walks from the given nodes.
+
+        Parameters
+        ---------------------------
+        start_nodes: np.ndarray,
+            The nodes from where to start the walks.
+        walk_length: int,
+            Length of the walks.
+        window_size: int,
+            Window size for the local context.
+        iterations: int = 1,
+            Number of walks to start from every node.
+        return_weight: float = 1.0,
+            Weight on the probability of returning to the same node the walk just came from.
+            Equal to the inverse of p in the Node2Vec paper.
+        explore_weight: float = 1.0,
+            Weight on the probability of visiting a neighbor node
+            to the one we're coming from in the random walk.
+            Equal to the inverse of q in the Node2Vec paper.
+        random_state: int = 42,
+            The random state to use to make the walks reproducible.
+
+        Raises
+        ---------------------------
+        ValueError,
+            If the return or explore weights are not strictly positive.
+
+        Returns
+        ---------------------------
+        Tuple with the contexts and central words.
+        """
+        return CSRGraph.get_windows(
+            self.walk(
+                start_nodes,
+                walk_length,
+                iterations=iterations,
+                return_weight=return_weight,
+                explore_weight=explore_weight,
+                random_state=random_state
+            ),
+            window_size,
+            self.nodes_number
+        )
+
+    @staticmethod
+    def get_windows(walks: np.ndarray, window_size: int, nodes_number: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return contexts and central words of the given walks.
+
+        Windows that include the padding of truncated walks are dropped.
+
+        Parameters
+        ---------------------------
+        walks: np.ndarray,
+            Matrix of walks.
+        window_size: int,
+            Window size for the local context.
+        nodes_number: int,
+            Number of nodes of the graph, used as padding value.
+
+        Returns
+        ---------------------------
+        Tuple with the contexts and central words.
+        """
+        span = window_size*2 + 1
+        if walks.shape[1] < span:
+            return (
+                np.empty((0, span - 1), dtype=walks.dtype),
+                np.empty(0, dtype=walks.dtype)
+            )
+        walks = np.ascontiguousarray(walks)
+        windows = np.lib.stride_tricks.as_strided(
+            walks,
+            shape=(walks.shape[0], walks.shape[1] - span + 1, span),
+            strides=(walks.strides[0], walks.strides[1], walks.strides[1]),
+            writeable=False
+        ).reshape(-1, span)
+        windows = windows[(windows < nodes_number).all(axis=1)]
+        return (
+            np.delete(windows, window_size, axis=1),
+            windows[:, window_size]
+        )
@@ -2,9 +2,15 @@
 from typing import Callable, Tuple, Union
 
 import numpy as np
+import tensorflow as tf
 from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
 from keras_mixed_sequence import Sequence
 
+from .csr_graph import CSRGraph
+from .negative_edge_pool import NegativeEdgePool
+from .seeds import get_batch_seed
+from .tf_dataset import to_tf_dataset
+
 
 class LinkPredictionSequence(Sequence):
     """Keras Sequence for running Neural Network on graph link prediction."""
@@ -12,7 +18,7 @@ class LinkPredictionSequence(Sequence):
     def __init__(
         self,
         graph: EnsmallenGraph,
-        embedding: np.ndarray,
+        embedding: np.ndarray = None,
         method: Union[str, Callable] = "Hadamard",
         batch_size: int = 2**10,
         negative_samples: float = 1.0,
@@ -20,7 +26,9 @@ class LinkPredictionSequence(Sequence):
         graph_to_avoid: EnsmallenGraph = None,
         batches_per_epoch: bool = 2**8,
         elapsed_epochs: int = 0,
-        seed: int = 42
+        seed: int = 42,
+        return_node_ids: bool = False,
+        negative_pool: NegativeEdgePool = None
     ):
         """Create new LinkPredictionSequence object.
 
@@ -28,12 +36,17 @@ class LinkPredictionSequence(Sequence):
         --------------------------------
         graph: EnsmallenGraph,
             The graph from which to sample the edges.
-        embedding: np.ndarray,
+        embedding: np.ndarray = None,
             This is a numpy array and NOT a pandas DataFrame because we need
             to quickly load the embedding for the nodes and a DataFrame is too slow.
+            It is not needed when the node IDs are returned.
         method: str = "Hadamard",
             Method to use for the embedding.
-            Can either be 'Hadamard', 'Average', 'L1', 'AbsoluteL1' or 'L2'.
+            Can either be 'Hadamard', 'Average', 'L1', 'AbsoluteL1', 'L2'
+            or 'Concatenate'.
+            It is ignored when the node IDs are returned, as the edge
+            embedding is then computed within the model, for instance by
+            the EdgeEmbedding layer with its own method.
         batch_size: int = 2**10,
             The batch size to use.
         negative_samples: float = 1.0,
@@ -56,9 +69,54 @@ class LinkPredictionSequence(Sequence):
             Number of elapsed epochs to init state of generator.
         seed: int = 42,
             The seed to use to make extraction reproducible.
+        return_node_ids: bool = False,
+            Whether to return the IDs of the source and destination nodes
+            of the edges instead of their embedding, so that the embedding
+            is computed within the model, for instance with the EdgeEmbedding
+            layer. The edges are then sampled from a CSRGraph built from
+            the given graph.
+        negative_pool: NegativeEdgePool = None,
+            Pool of negative edges prepared by a background thread, from
+            which the negative edges are drawn instead of being sampled
+            and checked while generating the batch.
+            It is only supported when the node IDs are returned: in the
+            default mode the batches, including their negative edges and
+            the checks against the graph to avoid, are generated within
+            Ensmallen's `link_prediction`, which cannot receive negative
+            edges sampled elsewhere. To use the pool with the embedding,
+            return the node IDs and compute the edge embedding within
+            the model with the EdgeEmbedding layer.
+
+        Raises
+        --------------------------------
+        ValueError,
+            If no embedding is given and the node IDs are not returned.
+        ValueError,
+            If a negative pool is given and the node IDs are not returned.
         """
+        if negative_pool is not None and not return_node_ids:
+            raise ValueError(
+                "The negative pool is only supported when the node IDs are returned."
+            )
         self._graph = graph
-        self._graph.set_embedding(embedding)
+        self._return_node_ids = return_node_ids
+        self._csr_graph = None
+        self._graphs_to_avoid = []
+        self._negative_pool = negative_pool
+        self._embedding_size = None
+        if return_node_ids:
+            self._csr_graph = CSRGraph.from_ensmallen(graph)
+            if avoid_false_negatives:
+                self._graphs_to_avoid.append(self._csr_graph)
+            if graph_to_avoid is not None:
+                self._graphs_to_avoid.append(CSRGraph.from_ensmallen(graph_to_avoid))
+        elif embedding is None:
+            raise ValueError(
+                "The embedding is required when the node IDs are not returned."
+            )
+        else:
+            self._graph.set_embedding(embedding)
+            self._embedding_size = embedding.shape[1]
         self._negative_samples = negative_samples
         self._avoid_false_negatives = avoid_false_negatives
         self._graph_to_avoid = graph_to_avoid
@@ -70,24 +128,127 @@ class LinkPredictionSequence(Sequence):
             batch_size=batch_size,
             elapsed_epochs=elapsed_epochs
         )
+        if negative_pool is not None:
+            self._negative_pool.setup(
+                self._csr_graph,
+                self._graphs_to_avoid,
+                self.steps_per_epoch
+            )
 
-    def __getitem__(self, idx: int) -> Tuple[np.ndarray, np.ndarray]:
-        """Return batch corresponding to given index.
+    @property
+    def output_signature(self) -> Tuple:
+        """Return the signature of the batches, as expected by Keras.
+
+        The inputs are either the sources and destinations IDs of the
+        edges or their edge embedding, and the outputs are their labels.
+        The edge embedding of the concatenation method is twice as wide
+        as the node embedding.
+        """
+        labels = tf.TensorSpec((None,), tf.float64)
+        if self._return_node_ids:
+            return (
+                tf.TensorSpec((None,), tf.int64),
+                tf.TensorSpec((None,), tf.int64)
+            ), labels
+        edge_embedding_size = self._embedding_size
+        if self._method == "Concatenate":
+            edge_embedding_size *= 2
+        return tf.TensorSpec((None, edge_embedding_size), tf.float64), labels
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return batch corresponding to given index and epoch.
 
         Parameters
         ---------------
         idx: int,
             Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
 
         Returns
         ---------------
         Return Tuple containing X and Y numpy arrays corresponding to given batch index.
         """
+        if self._return_node_ids:
+            return self._get_node_ids_batch(idx, epoch)
         return self._graph.link_prediction(
-            self._seed + idx + self.elapsed_epochs,
+            get_batch_seed(self._seed, epoch, idx),
             batch_size=self.batch_size,
             method=self._method,
             negative_samples=self._negative_samples,
             avoid_false_negatives=self._avoid_false_negatives,
             graph_to_avoid=self._graph_to_avoid,
         )
+
+    def _get_node_ids_batch(self, idx: int, epoch: int) -> Tuple[Tuple[np.ndarray, np.ndarray], np.ndarray]:
+        """Return batch of node IDs corresponding to given index and epoch.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple with the sources and destinations IDs and the labels of the edges.
+        """
+        numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+            seed=get_batch_seed(self._seed, epoch, idx)
+        )
+        positives_number = int(round(self.batch_size / (1 + self._negative_samples)))
+        positive_sources, positive_destinations = self._csr_graph.sample_edges(
+            positives_number,
+            numpy_random_state
+        )
+        if self._negative_pool is not None:
+            negative_sources, negative_destinations = self._negative_pool.get_negative_edges(
+                self.batch_size - positives_number,
+                idx,
+                epoch
+            )
+        else:
+            negative_sources, negative_destinations = self._csr_graph.sample_negative_edges(
+                self.batch_size - positives_number,
+                numpy_random_state,
+                self._graphs_to_avoid
+            )
+        labels = np.concatenate([
+            np.ones(positives_number),
+            np.zeros(self.batch_size - positives_number)
+        ])
+        permutation = numpy_random_state.permutation(self.batch_size)
+        return (
+            np.concatenate([positive_sources, negative_sources])[permutation],
+            np.concatenate([positive_destinations, negative_destinations])[permutation],
+        ), labels[permutation]
+
+    def __getitem__(self, idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return batch corresponding to given index.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Return Tuple containing X and Y numpy arrays corresponding to given batch index.
+        """
+        return self._get_batch(idx, self.elapsed_epochs)
+
+    def to_tf_dataset(self, epochs: int = None) -> tf.data.Dataset:
+        """Return TensorFlow dataset generating the batches of this sequence.
+
+        Parameters
+        -----------------------------
+        epochs: int = None,
+            Number of epochs to generate. By default the dataset is infinite,
+            and the number of steps per epoch must be given to the fit method.
+
+        Returns
+        -----------------------------
+        The TensorFlow dataset.
+        """
+        return to_tf_dataset(self, epochs)
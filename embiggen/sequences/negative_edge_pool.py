@@ -0,0 +1,188 @@
+"""Pool of negative edges prepared by a background thread."""
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .csr_graph import CSRGraph
+from .seeds import get_batch_seed
+
+
+class NegativeEdgePool:
+    """Pool of negative edges prepared by a background thread.
+
+    The negative edges of the batches are drawn from a pool of pairs of
+    nodes already checked against the graphs to avoid. The pool is replaced
+    every given number of batches by a new generation, which a background
+    thread prepares while the current generation is in use, so that the
+    batch generation does not depend on the density of the graphs.
+
+    Every generation is sampled with its own seed, and every batch draws
+    from the generation of its index with a seed derived from its index
+    and epoch, so the negatives of every batch are always the same,
+    independently of the timing of the background thread.
+
+    The pool is used by the LinkPredictionSequence only when it returns
+    the node IDs of the edges. In its default mode the batches are
+    generated by Ensmallen, which samples and checks the negative edges
+    internally, so the pool does not speed up that mode.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 2**16,
+        refresh_rate: int = 2**4,
+        random_state: int = 42
+    ):
+        """Create new NegativeEdgePool object.
+
+        Parameters
+        -----------------------------
+        pool_size: int = 2**16,
+            Number of negative edges in every generation of the pool.
+        refresh_rate: int = 2**4,
+            Number of batches drawing from the same generation of the pool.
+        random_state: int = 42,
+            The random state to use to make the sampling reproducible.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the given pool size or refresh rate are not strictly positive.
+        """
+        if pool_size < 1 or refresh_rate < 1:
+            raise ValueError((
+                "The given pool size ({}) and refresh rate ({}) "
+                "must be strictly positive."
+            ).format(pool_size, refresh_rate))
+        self._pool_size = pool_size
+        self._refresh_rate = refresh_rate
+        self._random_state = random_state
+        self._graph = None
+        self._graphs_to_avoid = None
+        self._steps_per_epoch = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._generations: Dict[int, Future] = {}
+        self._lock = Lock()
+
+    def setup(
+        self,
+        graph: CSRGraph,
+        graphs_to_avoid: List[CSRGraph],
+        steps_per_epoch: int
+    ):
+        """Setup the pool for the given graph.
+
+        Parameters
+        -----------------------------
+        graph: CSRGraph,
+            The graph whose nodes are to be sampled.
+        graphs_to_avoid: List[CSRGraph],
+            The graphs whose edges must not be sampled.
+        steps_per_epoch: int,
+            Number of batches of every epoch.
+        """
+        self._graph = graph
+        self._graphs_to_avoid = graphs_to_avoid
+        self._steps_per_epoch = steps_per_epoch
+        with self._lock:
+            self._generations = {}
+
+    def _sample_generation(self, generation: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the negative edges of the given generation.
+
+        Parameters
+        -----------------------------
+        generation: int,
+            The generation to sample.
+
+        Returns
+        -----------------------------
+        Tuple with the sources and destinations of the negative edges.
+        """
+        return self._graph.sample_negative_edges(
+            self._pool_size,
+            np.random.RandomState(  # pylint: disable=no-member
+                seed=(self._random_state, generation)
+            ),
+            self._graphs_to_avoid
+        )
+
+    def _get_generation(self, generation: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the given generation, submitting the preparation of the following one.
+
+        Parameters
+        -----------------------------
+        generation: int,
+            The generation to return.
+
+        Returns
+        -----------------------------
+        Tuple with the sources and destinations of the negative edges.
+        """
+        with self._lock:
+            for following in (generation, generation + 1):
+                if following not in self._generations:
+                    self._generations[following] = self._executor.submit(
+                        self._sample_generation,
+                        following
+                    )
+            # Generations older than the previous one will not be requested.
+            for old_generation in [g for g in self._generations if g < generation - 1]:
+                self._generations.pop(old_generation).cancel()
+            future = self._generations[generation]
+        return future.result()
+
+    def get_negative_edges(self, number: int, idx: int, epoch: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the negative edges of the given batch.
+
+        Parameters
+        -----------------------------
+        number: int,
+            Number of negative edges to return.
+        idx: int,
+            The index of the batch.
+        epoch: int,
+            The epoch of the batch.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the pool was not setup.
+
+        Returns
+        -----------------------------
+        Tuple with the sources and destinations of the negative edges.
+        """
+        if self._graph is None:
+            raise ValueError("The pool was not setup yet.")
+        sources, destinations = self._get_generation(
+            (epoch*self._steps_per_epoch + idx) // self._refresh_rate
+        )
+        edges = np.random.RandomState(  # pylint: disable=no-member
+            seed=get_batch_seed(self._random_state, epoch, idx)
+        ).randint(self._pool_size, size=number)
+        return sources[edges], destinations[edges]
+
+    def close(self):
+        """Stop the thread preparing the generations."""
+        with self._lock:
+            for future in self._generations.values():
+                future.cancel()
+            self._generations = {}
+        self._executor.shutdown(wait=True)
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle, without the thread and the generations."""
+        state = self.__dict__.copy()
+        del state["_executor"]
+        del state["_lock"]
+        state["_generations"] = {}
+        return state
+
+    def __setstate__(self, state: Dict):
+        """Restore the pickled state with a new thread."""
+        self.__dict__.update(state)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._lock = Lock()
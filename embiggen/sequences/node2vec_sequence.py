@@ -2,15 +2,30 @@
 from typing import Tuple
 
 import numpy as np  # type: ignore
+import tensorflow as tf
 
 from .abstract_node2vec_sequence import AbstractNode2VecSequence
+from .csr_graph import CSRGraph
+from .seeds import get_batch_seed
 
 
 class Node2VecSequence(AbstractNode2VecSequence):
     """Keras Sequence object for running CBOW and SkipGram on graph walks."""
 
-    def __getitem__(self, idx: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
-        """Return batch corresponding to given index.
+    @property
+    def output_signature(self) -> Tuple:
+        """Return the signature of the batches, as expected by Keras.
+
+        When the sequence returns the walks, the batches contain the
+        matrix of walks instead of the contexts and central words.
+        """
+        if not self._return_walks:
+            return super().output_signature
+        dtype = tf.float64 if self._support_mirror_strategy else tf.int64
+        return (tf.TensorSpec((None, self._walk_length), dtype),)
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
+        """Return batch corresponding to given index and epoch.
 
         The return tuple of tuples is composed of an inner tuple, containing
         the words vector and the vector of vectors of the contexts.
@@ -34,29 +49,136 @@ class Node2VecSequence(AbstractNode2VecSequence):
 
         different contexts.
 
+        When the sequence returns the walks, the batch is instead the matrix
+        of walks, padded with the number of nodes after traps, and the
+        windows are extracted within the model.
+
         Parameters
         ---------------
         idx: int,
             Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
 
         Returns
         ---------------
         Tuple of tuples with input data.
         """
-        words, contexts = self._graph.node2vec(
-            self._batch_size,
+        if self._return_walks:
+            walks = self._get_walks(idx, epoch)
+            if self._coverage is not None:
+                self._coverage.update(*CSRGraph.get_windows(
+                    walks,
+                    self._window_size,
+                    self._csr_graph.nodes_number
+                ))
+            if self._support_mirror_strategy:
+                return walks.astype(float), None
+            return walks, None
+
+        if self._scheduler is not None:
+            contexts, words = CSRGraph.get_windows(
+                self._get_walks(idx, epoch),
+                self._window_size,
+                self._csr_graph.nodes_number
+            )
+        else:
+            contexts, words = self._graph.node2vec(
+                self._batch_size,
+                self._walk_length,
+                iterations=self._iterations,
+                window_size=self._window_size,
+                return_weight=self._return_weight,
+                explore_weight=self._explore_weight,
+                change_node_type_weight=self._change_node_type_weight,
+                change_edge_type_weight=self._change_edge_type_weight,
+                dense_node_mapping=self._dense_node_mapping,
+                max_neighbours=self._max_neighbours,
+                random_state=get_batch_seed(self._random_state, epoch, idx)
+            )
+
+        if self._coverage is not None:
+            self._coverage.update(contexts, words)
+
+        if self._support_mirror_strategy:
+            return (contexts.astype(float), words.astype(float)), None
+        return (contexts, words), None
+
+    def _get_walks(self, idx: int, epoch: int) -> np.ndarray:
+        """Return walks of the batch executed on the CSRGraph.
+
+        The walks start from the scheduled nodes, when a scheduler is given,
+        and otherwise from the batch slice of a seeded permutation of the
+        nodes with outbound edges.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Matrix of walks, padded with the number of nodes after traps.
+        """
+        if self._scheduler is not None:
+            start_nodes = self._scheduler.get_start_nodes(idx, epoch)
+        else:
+            start_nodes = self._source_nodes[
+                self._get_permutation(epoch)[
+                    idx*self._batch_size:(idx + 1)*self._batch_size
+                ]
+            ]
+        walks = self._csr_graph.walk(
+            start_nodes,
             self._walk_length,
             iterations=self._iterations,
-            window_size=self._window_size,
             return_weight=self._return_weight,
             explore_weight=self._explore_weight,
-            change_node_type_weight=self._change_node_type_weight,
-            change_edge_type_weight=self._change_edge_type_weight,
-            dense_node_mapping=self._dense_node_mapping,
-            max_neighbours=self._max_neighbours,
-            random_state=self._random_state + idx + self.elapsed_epochs
+            random_state=get_batch_seed(self._random_state, epoch, idx)
         )
+        if self._scheduler is not None:
+            self._scheduler.update_visits(
+                walks[walks < self._csr_graph.nodes_number].astype(np.int64)
+            )
+        return walks
 
-        if self._support_mirror_strategy:
-            return (words.astype(float), contexts.astype(float)), None
-        return (words, contexts), None
+    def sample_windows(self, nodes: np.ndarray, random_state: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return contexts and central words of walks from the given nodes.
+
+        Differently from the batches, the walks are neither tracked by the
+        coverage nor by the scheduler, so the windows can be used to measure
+        the model, for instance to compute the losses of the nodes.
+
+        Parameters
+        ---------------
+        nodes: np.ndarray,
+            The nodes from where to start the walks.
+        random_state: int,
+            The random state to use for the walks.
+
+        Raises
+        ---------------
+        ValueError,
+            If the walks are not executed on the CSRGraph, that is
+            when neither a scheduler is given nor the walks are returned.
+
+        Returns
+        ---------------
+        Tuple with the contexts and central words.
+        """
+        if self._csr_graph is None:
+            raise ValueError(
+                "The windows can be sampled only when the walks are executed "
+                "on the CSRGraph, that is with a scheduler or returning the walks."
+            )
+        return self._csr_graph.walk_windows(
+            nodes,
+            self._walk_length,
+            self._window_size,
+            iterations=self._iterations,
+            return_weight=self._return_weight,
+            explore_weight=self._explore_weight,
+            random_state=random_state
+        )
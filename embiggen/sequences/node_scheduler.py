@@ -0,0 +1,258 @@
+"""Scheduler of the start nodes of the walks of every batch."""
+from threading import Lock
+
+import numpy as np
+
+from .seeds import get_batch_seed, get_epoch_seed
+
+
+class NodeScheduler:
+    """Scheduler of the start nodes of the walks of every batch.
+
+    Every epoch the start nodes are visited following a seeded permutation,
+    split across the batches of the epoch, so that every node starts at least
+    one walk per epoch. Optionally, every batch is extended with additional
+    nodes sampled proportionally to an importance weight, either favouring
+    the nodes that were visited the least or the nodes with the highest
+    recent loss. The importance weights of every epoch are frozen by the
+    method `freeze_importances`, which the Node2VecSequence calls at the end
+    of the previous epoch, so all the batches of an epoch sample from the
+    same cumulative distribution, independently of the order in which they
+    are generated. The importances of an epoch that was not frozen are taken
+    when its first batch is requested: when the batches are generated
+    concurrently, this may happen while the batches of the previous epoch
+    are still updating the visits, so the oversampled nodes are not
+    reproducible, and `parallel_batches` refuses sequences oversampling.
+    """
+
+    IMPORTANCES = ("visits", "loss")
+
+    def __init__(
+        self,
+        oversampling: float = 0.0,
+        importance: str = "visits",
+        loss_smoothing: float = 0.9,
+        random_state: int = 42
+    ):
+        """Create new NodeScheduler object.
+
+        Parameters
+        -----------------------------
+        oversampling: float = 0.0,
+            Fraction of the batch size to add to every batch as nodes
+            sampled according to their importance.
+            By default, no oversampling is executed.
+        importance: str = "visits",
+            The importance weight to use for the oversampling.
+            Can either be 'visits', where the importance is the inverse of
+            the number of times the node has appeared in the walks, or
+            'loss', where the importance is the exponential moving average
+            of the losses provided with the method `update_losses`.
+        loss_smoothing: float = 0.9,
+            Smoothing factor of the exponential moving average of the losses.
+        random_state: int = 42,
+            The random state to use to make the scheduling reproducible.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the given oversampling is negative.
+        ValueError,
+            If the given importance is not supported.
+        """
+        if oversampling < 0:
+            raise ValueError((
+                "The given oversampling ({}) is negative."
+            ).format(oversampling))
+        if importance not in NodeScheduler.IMPORTANCES:
+            raise ValueError((
+                "Given importance '{}' is not supported. "
+                "Supported importances are {}."
+            ).format(
+                importance, ", ".join(NodeScheduler.IMPORTANCES)
+            ))
+        self._oversampling = oversampling
+        self._importance = importance
+        self._loss_smoothing = loss_smoothing
+        self._random_state = random_state
+        self._start_nodes = None
+        self._batch_size = None
+        self._visits = None
+        self._losses = None
+        self._permutations = {}
+        self._cumulative_importances = {}
+        self._lock = Lock()
+
+    def setup(self, start_nodes: np.ndarray, nodes_number: int, batch_size: int):
+        """Setup the scheduler for the given nodes.
+
+        Parameters
+        -----------------------------
+        start_nodes: np.ndarray,
+            The nodes from where walks can start.
+        nodes_number: int,
+            The number of nodes of the graph.
+        batch_size: int,
+            Number of start nodes of a batch, before the oversampling.
+        """
+        self._start_nodes = start_nodes
+        self._batch_size = batch_size
+        self._visits = np.zeros(nodes_number, dtype=np.uint32)
+        self._losses = np.ones(nodes_number, dtype=np.float32)
+        self._permutations = {}
+        self._cumulative_importances = {}
+
+    @property
+    def steps_per_epoch(self) -> int:
+        """Return number of batches required to visit all the start nodes."""
+        return int(np.ceil(self._start_nodes.size / self._batch_size))
+
+    @property
+    def oversampling(self) -> float:
+        """Return the fraction of the batch size sampled according to the importance."""
+        return self._oversampling
+
+    @property
+    def start_nodes(self) -> np.ndarray:
+        """Return the nodes from where walks can start."""
+        return self._start_nodes
+
+    @property
+    def visits(self) -> np.ndarray:
+        """Return the number of times every node appeared in the walks."""
+        return self._visits
+
+    @property
+    def losses(self) -> np.ndarray:
+        """Return the moving average of the losses of every node."""
+        return self._losses
+
+    def _get_permutation(self, epoch: int) -> np.ndarray:
+        """Return the permutation of the start nodes of the given epoch.
+
+        The permutations of the two most recent epochs are kept, as batches
+        of consecutive epochs may be requested concurrently.
+        """
+        with self._lock:
+            if epoch not in self._permutations:
+                if len(self._permutations) > 1:
+                    self._permutations.pop(min(self._permutations))
+                numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+                    seed=get_epoch_seed(self._random_state, epoch)
+                )
+                self._permutations[epoch] = numpy_random_state.permutation(
+                    self._start_nodes
+                )
+            return self._permutations[epoch]
+
+    def _freeze_importances(self, epoch: int):
+        """Store the current cumulative importances as the ones of the given epoch.
+
+        As for the permutations, the cumulative importances of the two most
+        recent epochs are kept. The lock must be held by the caller.
+        """
+        if len(self._cumulative_importances) > 1:
+            self._cumulative_importances.pop(min(self._cumulative_importances))
+        if self._importance == "visits":
+            weights = 1.0 / (1.0 + self._visits[self._start_nodes])
+        else:
+            weights = self._losses[self._start_nodes].astype(np.float64)
+        self._cumulative_importances[epoch] = np.cumsum(weights)
+
+    def freeze_importances(self, epoch: int):
+        """Freeze the current importances as the ones of the given epoch.
+
+        Parameters
+        -----------------------------
+        epoch: int,
+            The epoch whose batches are to be sampled with the current
+            importances, usually the one about to start.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the scheduler was not setup.
+        """
+        if self._start_nodes is None:
+            raise ValueError("The scheduler was not setup yet.")
+        with self._lock:
+            self._freeze_importances(epoch)
+
+    def _get_cumulative_importances(self, epoch: int) -> np.ndarray:
+        """Return the cumulative importances of the start nodes of the given epoch.
+
+        The importances of an epoch that was not frozen are frozen now.
+        """
+        with self._lock:
+            if epoch not in self._cumulative_importances:
+                self._freeze_importances(epoch)
+            return self._cumulative_importances[epoch]
+
+    def get_start_nodes(self, idx: int, epoch: int) -> np.ndarray:
+        """Return the start nodes of the given batch.
+
+        Parameters
+        -----------------------------
+        idx: int,
+            The index of the batch.
+        epoch: int,
+            The epoch of the batch.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the scheduler was not setup.
+
+        Returns
+        -----------------------------
+        Array with the start nodes.
+        """
+        if self._start_nodes is None:
+            raise ValueError("The scheduler was not setup yet.")
+        nodes = self._get_permutation(epoch)[
+            idx*self._batch_size:(idx + 1)*self._batch_size
+        ]
+        oversampled_number = int(round(self._batch_size * self._oversampling))
+        if oversampled_number == 0:
+            return nodes
+        cumulative_importances = self._get_cumulative_importances(epoch)
+        numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+            seed=get_batch_seed(self._random_state, epoch, idx)
+        )
+        return np.concatenate([
+            nodes,
+            self._start_nodes[np.searchsorted(
+                cumulative_importances,
+                numpy_random_state.random_sample(oversampled_number) *
+                cumulative_importances[-1],
+                side="right"
+            )]
+        ])
+
+    def update_visits(self, nodes: np.ndarray):
+        """Update the visits counts with the given visited nodes.
+
+        Parameters
+        -----------------------------
+        nodes: np.ndarray,
+            The visited nodes. Nodes may be repeated.
+        """
+        counts = np.bincount(nodes, minlength=self._visits.size)
+        with self._lock:
+            self._visits += counts[:self._visits.size].astype(np.uint32)
+
+    def update_losses(self, nodes: np.ndarray, losses: np.ndarray):
+        """Update the moving average of the losses of the given nodes.
+
+        Parameters
+        -----------------------------
+        nodes: np.ndarray,
+            The nodes whose loss was measured.
+        losses: np.ndarray,
+            The losses of the nodes.
+        """
+        with self._lock:
+            self._losses[nodes] = (
+                self._loss_smoothing * self._losses[nodes] +
+                (1 - self._loss_smoothing) * losses
+            )
@@ -0,0 +1,109 @@
+"""Generator of the batches of a sequence computed by parallel workers."""
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import cpu_count
+from typing import Generator, Tuple
+
+from keras_mixed_sequence import Sequence
+
+# Sequence of the worker processes, set once when the processes start
+# so that it is not pickled with every batch request.
+_WORKER_SEQUENCE = None
+
+
+def _set_worker_sequence(sequence: Sequence):
+    """Set the sequence of the current worker process."""
+    global _WORKER_SEQUENCE  # pylint: disable=global-statement
+    _WORKER_SEQUENCE = sequence
+
+
+def _get_worker_batch(idx: int, epoch: int) -> Tuple:
+    """Return the batch with given index and epoch of the worker process sequence."""
+    return _WORKER_SEQUENCE._get_batch(idx, epoch)  # pylint: disable=protected-access
+
+
+def parallel_batches(
+    sequence: Sequence,
+    epochs: int = 1,
+    workers: int = None,
+    use_multiprocessing: bool = False,
+    prefetch: int = None
+) -> Generator[Tuple, None, None]:
+    """Yield the batches of the given sequence, computed by parallel workers.
+
+    The batches are yielded in order, starting from the elapsed epochs of
+    the sequence. Since the seed of every batch is derived from its index
+    and epoch, every worker can compute any batch, and the batches are
+    identical to the ones returned sequentially by the sequence.
+    The state updated while computing the batches within worker processes,
+    such as the visits of a NodeScheduler, is not shared with the sequence.
+    For the same reason, and since the epoch hooks of the sequence are not
+    run, the sequences whose scheduler oversamples the start nodes, which
+    depend on the visits of the previous batches, are not supported.
+
+    The generator can be given directly to the fit method of the
+    embedders, together with the number of steps per epoch.
+
+    Parameters
+    -----------------------------
+    sequence: Sequence,
+        The sequence whose batches are to be generated.
+        It must implement the method `_get_batch`.
+    epochs: int = 1,
+        Number of epochs to generate.
+    workers: int = None,
+        Number of workers computing the batches.
+        By default, the number of available CPUs.
+    use_multiprocessing: bool = False,
+        Whether to use processes instead of threads.
+        The sequence is passed to every process once, when it starts.
+    prefetch: int = None,
+        Maximum number of batches computed ahead.
+        By default, twice the number of workers.
+
+    Raises
+    -----------------------------
+    ValueError,
+        If the scheduler of the sequence oversamples the start nodes.
+
+    Yields
+    -----------------------------
+    The batches of the sequence.
+    """
+    scheduler = getattr(sequence, "scheduler", None)
+    if scheduler is not None and scheduler.oversampling > 0:
+        raise ValueError(
+            "The batches of sequences whose scheduler oversamples the start "
+            "nodes depend on the order of generation and cannot be "
+            "generated in parallel reproducibly."
+        )
+    workers = cpu_count() if workers is None else workers
+    prefetch = workers*2 if prefetch is None else prefetch
+    if use_multiprocessing:
+        executor: Executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_set_worker_sequence,
+            initargs=(sequence,)
+        )
+        get_batch = _get_worker_batch
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        get_batch = sequence._get_batch  # pylint: disable=protected-access
+
+    coordinates = (
+        (idx, sequence.elapsed_epochs + epoch)
+        for epoch in range(epochs)
+        for idx in range(sequence.steps_per_epoch)
+    )
+    futures = deque()
+    try:
+        for idx, epoch in coordinates:
+            futures.append(executor.submit(get_batch, idx, epoch))
+            if len(futures) >= prefetch:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
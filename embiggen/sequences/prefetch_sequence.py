@@ -0,0 +1,163 @@
+"""Keras Sequence wrapper that prepares the following batches in background threads."""
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, Tuple
+
+from keras_mixed_sequence import Sequence
+
+
+class PrefetchSequence(Sequence):
+    """Keras Sequence wrapper that prepares the following batches in background threads.
+
+    When a batch is requested, the following batches are submitted to a
+    thread pool, so that the batch generation, for instance the walks of
+    a Node2VecSequence or the edges of a LinkPredictionSequence, overlaps
+    with the training step. The number of batches prepared ahead is bounded
+    and every batch is computed by the wrapped sequence with its own index
+    and epoch, so the returned batches are the same as the wrapped sequence's
+    ones, also when they are requested out of order by multiple Keras workers.
+    At the end of every epoch, the first batches of the next one are
+    submitted, so that the start of the epoch is prefetched as well.
+
+    Since the batches are prepared in index order, the Keras fit method
+    should be called with `shuffle=False`, otherwise the prefetched batches
+    are not the requested ones: the embiggen sequences already randomize
+    their batches on their own.
+
+    The threads are stopped by the method `close`, when exiting the sequence
+    used as a context manager, or when the sequence is garbage collected.
+    """
+
+    def __init__(
+        self,
+        sequence: Sequence,
+        prefetch: int = 4,
+        workers: int = 2
+    ):
+        """Create new PrefetchSequence object.
+
+        Parameters
+        -----------------------------
+        sequence: Sequence,
+            The sequence whose batches are to be prefetched.
+            Its `_get_batch` method, returning the batch of the given index
+            and epoch, must be safe to call from multiple threads.
+        prefetch: int = 4,
+            Maximum number of batches to prepare ahead.
+        workers: int = 2,
+            Number of threads used to prepare the batches.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the given number of batches to prefetch is not strictly positive.
+        """
+        if prefetch < 1:
+            raise ValueError((
+                "The given number of batches to prefetch ({}) "
+                "is not strictly positive."
+            ).format(prefetch))
+        self._sequence = sequence
+        self._prefetch = prefetch
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures: Dict[Tuple[int, int], Future] = {}
+        self._lock = Lock()
+        self._ready = 0
+        self._starved = 0
+        self._missed = 0
+        super().__init__(
+            sample_number=sequence.steps_per_epoch*sequence.batch_size,
+            batch_size=sequence.batch_size,
+            elapsed_epochs=sequence.elapsed_epochs
+        )
+
+    @property
+    def prefetch_statistics(self) -> Dict[str, int]:
+        """Return the counters of the requested batches.
+
+        The counters are the number of batches that were ready when requested,
+        the number of batches that were still being prepared, hence the
+        queue was starved, and the number of batches that were not prefetched.
+        """
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "starved": self._starved,
+                "missed": self._missed
+            }
+
+    def _submit(self, epoch: int, idx: int):
+        """Submit the preparation of the given batch, if not already submitted."""
+        if (epoch, idx) not in self._futures and idx < self.steps_per_epoch:
+            self._futures[epoch, idx] = self._executor.submit(
+                self._sequence._get_batch,  # pylint: disable=protected-access
+                idx,
+                epoch
+            )
+
+    def __getitem__(self, idx: int) -> Tuple:
+        """Return batch corresponding to given index.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        The batch of the wrapped sequence.
+        """
+        with self._lock:
+            epoch = self.elapsed_epochs
+            future = self._futures.pop((epoch, idx), None)
+            if future is None:
+                self._missed += 1
+            elif future.done():
+                self._ready += 1
+            else:
+                self._starved += 1
+            # The batches before the requested one are kept, as with
+            # multiple Keras workers they may still be requested.
+            for next_idx in range(idx + 1, idx + 1 + self._prefetch):
+                self._submit(epoch, next_idx)
+        if future is None:
+            return self._sequence._get_batch(idx, epoch)  # pylint: disable=protected-access
+        return future.result()
+
+    def on_epoch_end(self):
+        """Move the wrapped sequence to the next epoch and prefetch its first batches.
+
+        The batches of the epoch that just ended which were not requested
+        are discarded.
+        """
+        self._sequence.on_epoch_end()
+        super().on_epoch_end()
+        with self._lock:
+            epoch = self.elapsed_epochs
+            stale = [key for key in self._futures if key[0] < epoch]
+            for key in stale:
+                self._futures[key].cancel()
+            for key in stale:
+                future = self._futures.pop(key)
+                if not future.cancelled():
+                    future.exception()
+            for idx in range(self._prefetch):
+                self._submit(epoch, idx)
+
+    def close(self):
+        """Stop the threads preparing the batches."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "PrefetchSequence":
+        """Return this sequence, whose threads are stopped on exit."""
+        return self
+
+    def __exit__(self, *args):
+        """Stop the threads preparing the batches."""
+        self.close()
+
+    def __del__(self):
+        """Release the threads preparing the batches without waiting for them."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
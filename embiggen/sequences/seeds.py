@@ -0,0 +1,60 @@
+"""Counter-based derivation of the seeds of the batches."""
+import numpy as np
+
+
+def get_batch_seed(random_state: int, epoch: int, idx: int, stream: int = 0) -> int:
+    """Return the seed of the given batch, derived by hashing its coordinates.
+
+    Differently from summing the random state, the epoch and the index,
+    which gives the same seed for instance to the batch 1 of the epoch 0
+    and to the batch 0 of the epoch 1, hashing them gives independent
+    streams to every batch. The seed only depends on the coordinates of
+    the batch, so any worker can generate any batch reproducibly.
+
+    Parameters
+    -----------------------------
+    random_state: int,
+        The random state of the sequence.
+    epoch: int,
+        The epoch of the batch.
+    idx: int,
+        The index of the batch within the epoch.
+    stream: int = 0,
+        Index of an independent stream within the same batch, for
+        instance for the positive and negative samples.
+
+    Returns
+    -----------------------------
+    The 32 bits seed of the batch.
+    """
+    return int(np.random.SeedSequence(
+        (random_state, epoch, idx, stream)
+    ).generate_state(1)[0])
+
+
+def get_epoch_seed(random_state: int, epoch: int, stream: int = 0) -> int:
+    """Return the seed of the given epoch, derived by hashing its coordinates.
+
+    The seed is used for the state shared by all the batches of the epoch,
+    such as the permutations. As for the batches, hashing avoids that the
+    epoch 1 of the random state 42 shares the seed of the epoch 0 of the
+    random state 43, and the spawn key keeps the epoch seeds independent
+    from the seeds of the batches.
+
+    Parameters
+    -----------------------------
+    random_state: int,
+        The random state of the sequence.
+    epoch: int,
+        The epoch.
+    stream: int = 0,
+        Index of an independent stream within the same epoch.
+
+    Returns
+    -----------------------------
+    The 32 bits seed of the epoch.
+    """
+    return int(np.random.SeedSequence(
+        (random_state, epoch, stream),
+        spawn_key=(1,)
+    ).generate_state(1)[0])
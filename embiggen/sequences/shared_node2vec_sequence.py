@@ -0,0 +1,145 @@
+"""Keras Sequence object for running CBOW and SkipGram with multiprocess workers."""
+import os
+from typing import Tuple, Union
+
+import numpy as np  # type: ignore
+from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
+
+from .abstract_sequence import AbstractSequence
+from .csr_graph import CSRGraph
+from .seeds import get_batch_seed
+
+
+class SharedNode2VecSequence(AbstractSequence):
+    """Keras Sequence object for running CBOW and SkipGram with multiprocess workers.
+
+    The graph is saved once as a CSRGraph in the given directory and loaded
+    back as memory maps, so that when the sequence is used with
+    `fit(workers=N, use_multiprocessing=True)` the workers attach to the
+    same pages of the graph instead of receiving a copy of it, both when
+    the workers are forked and when the sequence is pickled.
+
+    Every batch walks from a slice of a seeded permutation of the nodes
+    with outbound edges, using a seed derived from the epoch and the index
+    of the batch, so every batch is the same whichever worker computes it.
+    """
+
+    def __init__(
+        self,
+        graph: Union[EnsmallenGraph, CSRGraph],
+        directory: str,
+        walk_length: int,
+        batch_size: int,
+        iterations: int = 1,
+        window_size: int = 4,
+        return_weight: float = 1.0,
+        explore_weight: float = 1.0,
+        shuffle: bool = True,
+        elapsed_epochs: int = 0,
+        support_mirror_strategy: bool = False,
+        seed: int = 42
+    ):
+        """Create new SharedNode2VecSequence object.
+
+        Parameters
+        -----------------------------
+        graph: Union[EnsmallenGraph, CSRGraph],
+            The graph from from where to extract the walks.
+        directory: str,
+            Directory where to save the memory-mapped graph.
+            The graph is saved in a subdirectory named after its fingerprint,
+            and it is reused if already present.
+        walk_length: int,
+            Maximal length of the walks.
+            In directed graphs, when traps are present, walks may be shorter.
+        batch_size: int,
+            Number of nodes to include in a single batch.
+        iterations: int = 1,
+            Number of iterations of the single walks.
+        window_size: int = 4,
+            Window size for the local context.
+            On the borders the window size is trimmed.
+        return_weight: float = 1.0,
+            Weight on the probability of returning to the same node the walk just came from.
+            Equal to the inverse of p in the Node2Vec paper.
+        explore_weight: float = 1.0,
+            Weight on the probability of visiting a neighbor node
+            to the one we're coming from in the random walk.
+            Equal to the inverse of q in the Node2Vec paper.
+        shuffle: bool = True,
+            Whether to shuffle the start nodes at every epoch.
+        elapsed_epochs: int = 0,
+            Number of elapsed epochs to init state of generator.
+        support_mirror_strategy: bool = False,
+            Wethever to patch support for mirror strategy.
+            At the time of writing, TensorFlow's MirrorStrategy does not support
+            input values different from floats, therefore to support it we need
+            to convert the unsigned int 32 values that represent the indices of
+            the embedding layers we receive from Ensmallen to floats.
+            This will generally slow down performance, but in the context of
+            exploiting multiple GPUs it may be unnoticeable.
+        seed: int = 42,
+            The seed to use to make extraction reproducible.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the return or explore weights are not strictly positive.
+        """
+        CSRGraph.check_walk_weights(return_weight, explore_weight)
+        if isinstance(graph, EnsmallenGraph):
+            graph = CSRGraph.from_ensmallen(graph)
+        path = os.path.join(directory, graph.fingerprint)
+        if not CSRGraph.is_saved(path):
+            graph.save(path)
+        self._csr_graph = CSRGraph.load(path)
+        self._source_nodes = self._csr_graph.get_source_nodes()
+        self._walk_length = walk_length
+        self._iterations = iterations
+        self._return_weight = return_weight
+        self._explore_weight = explore_weight
+        super().__init__(
+            batch_size=batch_size,
+            sample_number=self._source_nodes.size,
+            window_size=window_size,
+            shuffle=shuffle,
+            elapsed_epochs=elapsed_epochs,
+            support_mirror_strategy=support_mirror_strategy,
+            random_state=seed
+        )
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
+        """Return batch corresponding to given index and epoch.
+
+        The return tuple of tuples is composed of an inner tuple, containing
+        the contexts and the words vectors, as returned by the Node2VecSequence.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple of tuples with input data.
+        """
+        batch = slice(idx*self._batch_size, (idx + 1)*self._batch_size)
+        if self._shuffle:
+            start_nodes = self._source_nodes[self._get_permutation(epoch)[batch]]
+        else:
+            start_nodes = self._source_nodes[batch]
+        contexts, words = self._csr_graph.walk_windows(
+            start_nodes,
+            self._walk_length,
+            self._window_size,
+            iterations=self._iterations,
+            return_weight=self._return_weight,
+            explore_weight=self._explore_weight,
+            random_state=get_batch_seed(self._random_state, epoch, idx)
+        )
+
+        if self._support_mirror_strategy:
+            return (contexts.astype(float), words.astype(float)), None
+        return (contexts, words), None
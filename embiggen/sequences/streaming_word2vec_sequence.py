@@ -0,0 +1,213 @@
+"""Keras Sequence object for running CBOW and SkipGram on corpora stored in shards."""
+import os
+from threading import Lock
+from typing import Dict, List, Tuple
+
+import numpy as np  # type: ignore
+
+from .abstract_sequence import AbstractSequence
+from .seeds import get_batch_seed, get_epoch_seed
+from .token_corpus import TokenCorpus
+
+
+class StreamingWord2VecSequence(AbstractSequence):
+    """Keras Sequence object for running CBOW and SkipGram on corpora stored in shards.
+
+    The corpus is a directory of shards, each one a saved TokenCorpus, as
+    written for instance by the method `transform_to_shards` of the
+    CorpusTransformer. Every epoch the shards are visited in a seeded
+    order, in groups of a bounded number of shards, and only the tokens of
+    the group being visited are read into memory, where their windows are
+    shuffled. The corpus can therefore be much larger than the memory.
+
+    The order of the shards and of the windows only depends on the seed
+    and on the epoch, so training can be resumed from any epoch through
+    the elapsed epochs, and the batches are the same whichever order they
+    are requested in.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        batch_size: int,
+        window_size: int = 4,
+        shuffle: bool = True,
+        buffer_shards: int = 4,
+        support_mirror_strategy: bool = False,
+        seed: int = 42,
+        elapsed_epochs: int = 0
+    ):
+        """Create new StreamingWord2VecSequence object.
+
+        Parameters
+        -----------------------------
+        directory: str,
+            Directory containing the shards of the corpus.
+        batch_size: int,
+            Maximum number of windows to include in a single batch.
+        window_size: int = 4,
+            Window size for the local context.
+            On the borders the window size is trimmed.
+        shuffle: bool = True,
+            Whether to shuffle the shards and their windows at every epoch.
+        buffer_shards: int = 4,
+            Number of shards read into memory and shuffled together.
+        support_mirror_strategy: bool = False,
+            Wethever to patch support for mirror strategy.
+            At the time of writing, TensorFlow's MirrorStrategy does not support
+            input values different from floats, therefore to support it we need
+            to convert the unsigned int 32 values that represent the indices of
+            the embedding layers we receive from Ensmallen to floats.
+            This will generally slow down performance, but in the context of
+            exploiting multiple GPUs it may be unnoticeable.
+        seed: int = 42,
+            The seed to use to make extraction reproducible.
+        elapsed_epochs: int = 0,
+            Number of elapsed epochs to init state of generator.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the given directory does not contain any shard.
+        """
+        self._shards = [
+            os.path.join(directory, name)
+            for name in sorted(os.listdir(directory))
+            if os.path.exists(os.path.join(directory, name, "offsets.npy"))
+        ]
+        if not self._shards:
+            raise ValueError((
+                "The given directory {} does not contain any shard."
+            ).format(directory))
+        self._buffer_shards = buffer_shards
+        self._context_offsets = np.concatenate([
+            np.arange(-window_size, 0),
+            np.arange(1, window_size + 1)
+        ])
+        # Every shard is split in its own batches, so that
+        # the batches never span two groups of shards.
+        self._shard_steps = np.array([
+            int(np.ceil(
+                TokenCorpus.load(shard).get_windows_number(window_size) / batch_size
+            ))
+            for shard in self._shards
+        ])
+        self._buffers: Dict[Tuple[int, int], Tuple[np.ndarray, List[np.ndarray]]] = {}
+        self._buffers_lock = Lock()
+        super().__init__(
+            batch_size=batch_size,
+            sample_number=int(self._shard_steps.sum())*batch_size,
+            window_size=window_size,
+            shuffle=shuffle,
+            elapsed_epochs=elapsed_epochs,
+            support_mirror_strategy=support_mirror_strategy,
+            random_state=seed
+        )
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle, without the buffers and their lock."""
+        state = super().__getstate__()
+        state["_buffers"] = {}
+        del state["_buffers_lock"]
+        return state
+
+    def __setstate__(self, state: Dict):
+        """Restore the pickled state with a new lock."""
+        super().__setstate__(state)
+        self._buffers_lock = Lock()
+
+    def _get_groups(self, epoch: int) -> List[np.ndarray]:
+        """Return the groups of shards visited in the given epoch.
+
+        Parameters
+        ---------------
+        epoch: int,
+            The epoch whose groups are to be returned.
+
+        Returns
+        ---------------
+        List of the arrays of the shards of every group.
+        """
+        if self._shuffle:
+            numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+                seed=get_epoch_seed(self._random_state, epoch)
+            )
+            shards = numpy_random_state.permutation(len(self._shards))
+        else:
+            shards = np.arange(len(self._shards))
+        return [
+            shards[start:start + self._buffer_shards]
+            for start in range(0, shards.size, self._buffer_shards)
+        ]
+
+    def _get_buffer(self, epoch: int, group: int, shards: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Return the tokens and the batches of windows of the given group.
+
+        The buffers of the two most recently requested groups are kept,
+        as batches of consecutive groups may be requested concurrently.
+
+        Parameters
+        ---------------
+        epoch: int,
+            The epoch of the group.
+        group: int,
+            The index of the group within the epoch.
+        shards: np.ndarray,
+            The shards of the group.
+
+        Returns
+        ---------------
+        Tuple with the tokens of the group and the centres of every batch.
+        """
+        with self._buffers_lock:
+            if (epoch, group) not in self._buffers:
+                corpora = [TokenCorpus.load(self._shards[shard], mmap_mode=None) for shard in shards]
+                first_tokens = np.cumsum([0] + [corpus.tokens.size for corpus in corpora])
+                centres = np.concatenate([
+                    corpus.get_window_centres(self._window_size) + first_token
+                    for corpus, first_token in zip(corpora, first_tokens)
+                ])
+                if self._shuffle:
+                    numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+                        seed=get_batch_seed(self._random_state, epoch, group)
+                    )
+                    centres = numpy_random_state.permutation(centres)
+                if len(self._buffers) > 1:
+                    self._buffers.pop(next(iter(self._buffers)))
+                self._buffers[(epoch, group)] = (
+                    np.concatenate([corpus.tokens for corpus in corpora]),
+                    np.array_split(centres, self._shard_steps[shards].sum())
+                )
+            return self._buffers[(epoch, group)]
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
+        """Return batch corresponding to given index and epoch.
+
+        The return tuple of tuples is composed of an inner tuple, containing
+        the contexts and the words vectors, as returned by the Word2VecSequence.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple of tuples with input data.
+        """
+        groups = self._get_groups(epoch)
+        first_steps = np.cumsum([0] + [
+            self._shard_steps[shards].sum()
+            for shards in groups
+        ])
+        group = int(np.searchsorted(first_steps, idx, side="right")) - 1
+        tokens, batches = self._get_buffer(epoch, group, groups[group])
+        centres = batches[idx - first_steps[group]]
+        contexts = tokens[centres[:, None] + self._context_offsets]
+        words = tokens[centres]
+
+        if self._support_mirror_strategy:
+            return (contexts.astype(float), words.astype(float)), None
+        return (contexts, words), None
@@ -0,0 +1,95 @@
+"""Adapter from the embiggen Keras Sequences to TensorFlow datasets."""
+from typing import Tuple
+
+import numpy as np  # type: ignore
+import tensorflow as tf
+from keras_mixed_sequence import Sequence
+
+
+def _get_structure(batch: Tuple) -> Tuple:
+    """Return the structure of a batch as expected by Keras.
+
+    The batches without true output values, that is with None as output,
+    are returned as single element tuples, which Keras interprets as input only.
+    """
+    inputs, outputs = batch
+    if outputs is None:
+        return (inputs,)
+    return (inputs, outputs)
+
+
+def to_tf_dataset(sequence: Sequence, epochs: int = None) -> tf.data.Dataset:
+    """Return TensorFlow dataset generating the batches of the given sequence.
+
+    The dataset enumerates the batches of consecutive epochs, starting from
+    the elapsed epochs of the sequence, and generates them with a parallel
+    map, preserving their order, followed by an autotuned prefetch.
+    Since every batch is computed from its index and epoch, the dataset
+    returns exactly the same batches as the sequence, independently of the
+    parallelism. The structure, dtypes and shapes of the batches are taken
+    from the output signature of the sequence, so no batch is generated
+    in advance, and the values are cast to the dtypes of the signature.
+
+    The method `on_epoch_end` of the sequence is called, sequentially, once
+    the last batch of every epoch is generated, so that the elapsed epochs,
+    the coverage statistics and the importances of the scheduler are updated
+    as when training on the sequence. Since the parallel map generates the
+    batches ahead, some batches of the next epoch may already be generated
+    when the hook runs, and they are then accounted in the ended epoch.
+
+    Parameters
+    -----------------------------
+    sequence: Sequence,
+        The sequence to adapt. It must implement the method `_get_batch`
+        and the property `output_signature`.
+    epochs: int = None,
+        Number of epochs to generate. By default the dataset is infinite,
+        and the number of steps per epoch must be given to the fit method.
+
+    Returns
+    -----------------------------
+    The TensorFlow dataset.
+    """
+    steps_per_epoch = sequence.steps_per_epoch
+    first_epoch = sequence.elapsed_epochs
+    structure = sequence.output_signature
+    signature = tf.nest.flatten(structure)
+
+    def generate_batch(counter: tf.Tensor):
+        epoch, idx = divmod(int(counter), steps_per_epoch)
+        return [
+            np.asarray(value, dtype=spec.dtype.as_numpy_dtype)
+            for value, spec in zip(tf.nest.flatten(_get_structure(
+                sequence._get_batch(idx, first_epoch + epoch)  # pylint: disable=protected-access
+            )), signature)
+        ]
+
+    def get_batch(counter: tf.Tensor):
+        values = tf.py_function(
+            generate_batch,
+            [counter],
+            [spec.dtype for spec in signature]
+        )
+        for value, spec in zip(values, signature):
+            value.set_shape(spec.shape)
+        return counter, tf.nest.pack_sequence_as(structure, values)
+
+    def end_epoch(counter: tf.Tensor) -> bool:
+        if int(counter) % steps_per_epoch == steps_per_epoch - 1:
+            sequence.on_epoch_end()
+        return True
+
+    def run_epoch_hooks(counter: tf.Tensor, batch: Tuple) -> Tuple:
+        done = tf.py_function(end_epoch, [counter], tf.bool)
+        with tf.control_dependencies([done]):
+            return tf.nest.map_structure(tf.identity, batch)
+
+    if epochs is None:
+        counters = tf.data.experimental.Counter()
+    else:
+        counters = tf.data.Dataset.range(steps_per_epoch*epochs)
+
+    return counters.map(
+        get_batch,
+        num_parallel_calls=tf.data.experimental.AUTOTUNE
+    ).map(run_epoch_hooks).prefetch(tf.data.experimental.AUTOTUNE)
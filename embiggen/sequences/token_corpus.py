@@ -0,0 +1,184 @@
+"""Compact corpus of tokenized sequences stored as a single flat array."""
+import os
+from typing import List
+
+import numpy as np
+
+
+class TokenCorpus:
+    """Compact corpus of tokenized sequences stored as a single flat array.
+
+    The tokens of all the sequences are concatenated in a single int32
+    array, and the sequence i is the slice between the offsets i and i + 1.
+    Differently from an object array of per-sequence arrays, the corpus has
+    no per-sequence overhead, and it can be saved to a directory and loaded
+    back as memory maps.
+    """
+
+    def __init__(self, tokens: np.ndarray, offsets: np.ndarray):
+        """Create new TokenCorpus object.
+
+        Parameters
+        ---------------------------
+        tokens: np.ndarray,
+            The tokens of all the sequences, concatenated.
+        offsets: np.ndarray,
+            Offsets of the sequences, of length sequences number + 1.
+
+        Raises
+        ---------------------------
+        ValueError,
+            If the last offset does not match the number of tokens.
+        """
+        if offsets[-1] != tokens.size:
+            raise ValueError((
+                "The last offset ({}) does not match the number of tokens ({})."
+            ).format(offsets[-1], tokens.size))
+        self._tokens = tokens
+        self._offsets = offsets
+
+    @staticmethod
+    def from_sequences(sequences: List[np.ndarray]) -> "TokenCorpus":
+        """Return new TokenCorpus built from the given sequences.
+
+        Parameters
+        ---------------------------
+        sequences: List[np.ndarray],
+            List of sequences of integers.
+
+        Raises
+        ---------------------------
+        ValueError,
+            If the tokens cannot be represented as 32 bits integers.
+
+        Returns
+        ---------------------------
+        The TokenCorpus object.
+        """
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        np.cumsum([len(sequence) for sequence in sequences], out=offsets[1:])
+        tokens = np.empty(offsets[-1], dtype=np.int32)
+        maximum = np.iinfo(np.int32).max
+        for start, end, sequence in zip(offsets[:-1], offsets[1:], sequences):
+            if len(sequence) > 0 and np.max(sequence) > maximum:
+                raise ValueError((
+                    "The tokens must be smaller than {}."
+                ).format(maximum))
+            tokens[start:end] = sequence
+        return TokenCorpus(tokens, offsets)
+
+    def save(self, directory: str):
+        """Save the arrays of the corpus to the given directory.
+
+        Parameters
+        ---------------------------
+        directory: str,
+            The directory where to save the corpus.
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "tokens.npy"), self._tokens)
+        np.save(os.path.join(directory, "offsets.npy"), self._offsets)
+
+    @staticmethod
+    def load(directory: str, mmap_mode: str = "r") -> "TokenCorpus":
+        """Return the TokenCorpus saved in the given directory.
+
+        Parameters
+        ---------------------------
+        directory: str,
+            The directory where the corpus was saved.
+        mmap_mode: str = "r",
+            The memory map mode to use to load the arrays.
+            If None, the arrays are read into memory.
+
+        Returns
+        ---------------------------
+        The TokenCorpus object.
+        """
+        return TokenCorpus(
+            np.load(os.path.join(directory, "tokens.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(directory, "offsets.npy"), mmap_mode=mmap_mode)
+        )
+
+    @property
+    def tokens(self) -> np.ndarray:
+        """Return the tokens of all the sequences, concatenated."""
+        return self._tokens
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Return the offsets of the sequences."""
+        return self._offsets
+
+    def __len__(self) -> int:
+        """Return number of sequences in the corpus."""
+        return self._offsets.size - 1
+
+    def __getitem__(self, idx: int) -> np.ndarray:
+        """Return the sequence with the given index."""
+        return self._tokens[self._offsets[idx]:self._offsets[idx + 1]]
+
+    def get_lengths(self, indices: np.ndarray) -> np.ndarray:
+        """Return the lengths of the sequences with the given indices.
+
+        Parameters
+        ---------------------------
+        indices: np.ndarray,
+            The indices of the sequences.
+
+        Returns
+        ---------------------------
+        The lengths of the sequences.
+        """
+        return self._offsets[indices + 1] - self._offsets[indices]
+
+    def get_sequences(self, indices: np.ndarray) -> List[np.ndarray]:
+        """Return the sequences with the given indices.
+
+        Parameters
+        ---------------------------
+        indices: np.ndarray,
+            The indices of the sequences.
+
+        Returns
+        ---------------------------
+        List of the sequences, as views of the tokens.
+        """
+        return [self[idx] for idx in indices]
+
+    def get_windows_number(self, window_size: int) -> int:
+        """Return the number of complete windows of the given size in the corpus.
+
+        Parameters
+        ---------------------------
+        window_size: int,
+            Window size for the local context.
+
+        Returns
+        ---------------------------
+        The number of windows.
+        """
+        return int(np.maximum(np.diff(self._offsets) - window_size*2, 0).sum())
+
+    def get_window_centres(self, window_size: int) -> np.ndarray:
+        """Return the positions in the tokens of the central words of all the windows.
+
+        Only complete windows are considered, so the first and last
+        `window_size` tokens of every sequence are never central words.
+
+        Parameters
+        ---------------------------
+        window_size: int,
+            Window size for the local context.
+
+        Returns
+        ---------------------------
+        The positions of the central words.
+        """
+        counts = np.maximum(np.diff(self._offsets) - window_size*2, 0)
+        first_windows = np.zeros(counts.size, dtype=np.int64)
+        np.cumsum(counts[:-1], out=first_windows[1:])
+        return np.arange(counts.sum(), dtype=np.int64) + np.repeat(
+            self._offsets[:-1] + window_size - first_windows,
+            counts
+        )
@@ -0,0 +1,205 @@
+"""On-disk cache of random walks shared across epochs and models."""
+import hashlib
+import json
+import os
+from threading import get_ident
+from typing import List, Tuple, Union
+
+import numpy as np
+from ensmallen_graph import EnsmallenGraph, preprocessing  # pylint: disable=no-name-in-module
+from tqdm.auto import tqdm
+
+from .csr_graph import CSRGraph
+from .seeds import get_batch_seed
+
+
+class WalkCache:
+    """On-disk cache of random walks shared across epochs and models.
+
+    The walks are generated once, starting the given number of iterations
+    from every node with outbound edges, and stored in a memory-mapped
+    npy file using the smallest unsigned integer type able to represent
+    the node IDs. The file name is derived from the fingerprint of the
+    graph and from the walk parameters, including the chunk size that
+    determines the seeds of the walks, so the same walks are reused by
+    every model trained on the same graph with the same parameters.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        walk_length: int,
+        iterations: int = 1,
+        return_weight: float = 1.0,
+        explore_weight: float = 1.0,
+        chunk_size: int = 2**16,
+        seed: int = 42,
+        verbose: bool = True
+    ):
+        """Create new WalkCache object.
+
+        Parameters
+        -----------------------------
+        directory: str,
+            Directory where to store the walks.
+        walk_length: int,
+            Length of the walks.
+            In directed graphs, when traps are present, walks are padded
+            with the number of nodes of the graph.
+        iterations: int = 1,
+            Number of walks to start from every node.
+        return_weight: float = 1.0,
+            Weight on the probability of returning to the same node the walk just came from.
+            Equal to the inverse of p in the Node2Vec paper.
+        explore_weight: float = 1.0,
+            Weight on the probability of visiting a neighbor node
+            to the one we're coming from in the random walk.
+            Equal to the inverse of q in the Node2Vec paper.
+        chunk_size: int = 2**16,
+            Number of walks to generate at once while writing the cache.
+        seed: int = 42,
+            The seed to use to make the walks reproducible.
+        verbose: bool = True,
+            Whether to show loading bars.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the return or explore weights are not strictly positive.
+        """
+        CSRGraph.check_walk_weights(return_weight, explore_weight)
+        self._directory = directory
+        self._walk_length = walk_length
+        self._iterations = iterations
+        self._return_weight = return_weight
+        self._explore_weight = explore_weight
+        self._chunk_size = chunk_size
+        self._seed = seed
+        self._verbose = verbose
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, graph: CSRGraph) -> str:
+        """Return path of the walks of the given graph.
+
+        Parameters
+        -----------------------------
+        graph: CSRGraph,
+            The graph whose walks path is to be returned.
+
+        Returns
+        -----------------------------
+        The path of the cached walks.
+        """
+        key = hashlib.sha256(json.dumps({
+            "graph": graph.fingerprint,
+            "walk_length": self._walk_length,
+            "iterations": self._iterations,
+            "return_weight": self._return_weight,
+            "explore_weight": self._explore_weight,
+            "chunk_size": self._chunk_size,
+            "seed": self._seed
+        }, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, "{}.npy".format(key))
+
+    def _write_walks(self, graph: CSRGraph, path: str):
+        """Generate the walks of the given graph and write them to the given path.
+
+        Parameters
+        -----------------------------
+        graph: CSRGraph,
+            The graph to walk.
+        path: str,
+            The path where to write the walks.
+        """
+        start_nodes = np.tile(graph.get_source_nodes(), self._iterations)
+        temporary_path = "{}.{}.{}.tmp.npy".format(path, os.getpid(), get_ident())
+        walks = np.lib.format.open_memmap(
+            temporary_path,
+            mode="w+",
+            dtype=np.min_scalar_type(graph.nodes_number),
+            shape=(start_nodes.size, self._walk_length)
+        )
+        for chunk, start in enumerate(tqdm(
+            range(0, start_nodes.size, self._chunk_size),
+            desc="Caching walks",
+            disable=not self._verbose
+        )):
+            walks[start:start + self._chunk_size] = graph.walk(
+                start_nodes[start:start + self._chunk_size],
+                self._walk_length,
+                return_weight=self._return_weight,
+                explore_weight=self._explore_weight,
+                random_state=get_batch_seed(self._seed, 0, chunk)
+            )
+        walks.flush()
+        del walks
+        # The file is moved only once complete, so that concurrent
+        # processes never read partially written walks.
+        os.replace(temporary_path, path)
+
+    def get_walks(self, graph: Union[EnsmallenGraph, CSRGraph]) -> np.ndarray:
+        """Return the memory-mapped walks of the given graph.
+
+        The walks are generated if they are not already cached.
+
+        Parameters
+        -----------------------------
+        graph: Union[EnsmallenGraph, CSRGraph],
+            The graph whose walks are to be returned.
+
+        Returns
+        -----------------------------
+        Read-only memory-mapped matrix of walks.
+        """
+        if isinstance(graph, EnsmallenGraph):
+            graph = CSRGraph.from_ensmallen(graph)
+        path = self.get_path(graph)
+        if not os.path.exists(path):
+            self._write_walks(graph, path)
+        return np.load(path, mmap_mode="r")
+
+    @staticmethod
+    def to_sequences(walks: np.ndarray, nodes_number: int) -> List[np.ndarray]:
+        """Return the given walks as a list of arrays without the padding.
+
+        Parameters
+        -----------------------------
+        walks: np.ndarray,
+            The matrix of walks.
+        nodes_number: int,
+            The number of nodes of the graph, used as padding value.
+
+        Returns
+        -----------------------------
+        List of walks.
+        """
+        return [
+            walk[walk < nodes_number].astype(np.uint64)
+            for walk in walks
+        ]
+
+    def cooccurence_matrix(
+        self,
+        graph: Union[EnsmallenGraph, CSRGraph],
+        window_size: int = 4
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return cooccurrence matrix of the cached walks, for instance to train GloVe.
+
+        Parameters
+        -----------------------------
+        graph: Union[EnsmallenGraph, CSRGraph],
+            The graph whose walks are to be used.
+        window_size: int = 4,
+            Window size for the local context.
+
+        Returns
+        -----------------------------
+        Tuple with the words, the contexts and their frequencies.
+        """
+        if isinstance(graph, EnsmallenGraph):
+            graph = CSRGraph.from_ensmallen(graph)
+        return preprocessing.cooccurence_matrix(
+            WalkCache.to_sequences(self.get_walks(graph), graph.nodes_number),
+            window_size=window_size,
+            verbose=self._verbose
+        )
@@ -0,0 +1,109 @@
+"""Accumulator of how often each node appears in the walks."""
+from threading import Lock
+from typing import Dict
+
+import numpy as np
+
+
+class WalkCoverage:
+    """Accumulator of how often each node appears in the walks.
+
+    The visits are stored in two compact arrays of unsigned integers, one
+    for the appearances as central node and one for the appearances as
+    context node, which are used to compute the coverage statistics.
+    """
+
+    def __init__(self, nodes_number: int):
+        """Create new WalkCoverage object.
+
+        Parameters
+        -----------------------------
+        nodes_number: int,
+            Number of nodes of the graph.
+        """
+        self._centres = np.zeros(nodes_number, dtype=np.uint32)
+        self._contexts = np.zeros(nodes_number, dtype=np.uint32)
+        self._lock = Lock()
+
+    @property
+    def centres(self) -> np.ndarray:
+        """Return how often each node appeared as central node."""
+        return self._centres
+
+    @property
+    def contexts(self) -> np.ndarray:
+        """Return how often each node appeared as context node."""
+        return self._contexts
+
+    def update(self, contexts: np.ndarray, words: np.ndarray):
+        """Update the visits with the given batch.
+
+        Parameters
+        -----------------------------
+        contexts: np.ndarray,
+            The contexts of the batch.
+        words: np.ndarray,
+            The central words of the batch.
+        """
+        nodes_number = self._centres.size
+        centres = np.bincount(
+            np.asarray(words, dtype=np.int64).flatten(),
+            minlength=nodes_number
+        )[:nodes_number].astype(np.uint32)
+        contexts = np.bincount(
+            np.asarray(contexts, dtype=np.int64).flatten(),
+            minlength=nodes_number
+        )[:nodes_number].astype(np.uint32)
+        with self._lock:
+            self._centres += centres
+            self._contexts += contexts
+
+    def reset(self):
+        """Reset the visits."""
+        with self._lock:
+            self._centres[:] = 0
+            self._contexts[:] = 0
+
+    @staticmethod
+    def gini(visits: np.ndarray) -> float:
+        """Return the Gini coefficient of the given visits.
+
+        The coefficient is 0 when all nodes are visited equally and gets
+        closer to 1 as the visits concentrate on fewer nodes.
+
+        Parameters
+        -----------------------------
+        visits: np.ndarray,
+            The visits of every node.
+
+        Returns
+        -----------------------------
+        The Gini coefficient.
+        """
+        total = visits.sum(dtype=np.float64)
+        if total == 0:
+            return 0.0
+        sorted_visits = np.sort(visits).astype(np.float64)
+        ranks = np.arange(1, visits.size + 1)
+        return float(
+            2 * (ranks * sorted_visits).sum() / (visits.size * total) -
+            (visits.size + 1) / visits.size
+        )
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Return the coverage statistics of the accumulated visits.
+
+        Returns
+        -----------------------------
+        Dictionary with the fraction of nodes never seen, never seen as
+        central node, never seen as context node and the Gini coefficient
+        of all the visits.
+        """
+        with self._lock:
+            visits = self._centres.astype(np.uint64) + self._contexts
+            return {
+                "never_seen": float((visits == 0).mean()),
+                "never_seen_as_centre": float((self._centres == 0).mean()),
+                "never_seen_as_context": float((self._contexts == 0).mean()),
+                "gini": WalkCoverage.gini(visits)
+            }
@@ -1,7 +1,8 @@
 """Keras Sequence object for running CBOW and SkipGram on texts."""
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy as np  # type: ignore
+import tensorflow as tf
 from ensmallen_graph import preprocessing  # pylint: disable=no-name-in-module
 
 from .abstract_word2vec_sequence import AbstractWord2VecSequence
@@ -10,8 +11,53 @@ from .abstract_word2vec_sequence import AbstractWord2VecSequence
 class Word2VecSequence(AbstractWord2VecSequence):
     """Keras Sequence object for running CBOW and SkipGram on texts."""
 
-    def __getitem__(self, idx: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
-        """Return batch corresponding to given index.
+    # Value used to pad the rows of the sequences, never a valid word ID.
+    PADDING = np.iinfo(np.uint32).max
+
+    @property
+    def output_signature(self) -> Tuple:
+        """Return the signature of the batches, as expected by Keras.
+
+        When the walk length is given, the batches contain the matrix of
+        the padded rows instead of the contexts and central words.
+        """
+        if self._walk_length is None:
+            return super().output_signature
+        dtype = tf.float64 if self._support_mirror_strategy else tf.int64
+        return (tf.TensorSpec((None, self._walk_length), dtype),)
+
+    def _get_walks(self, sequences: List[np.ndarray]) -> np.ndarray:
+        """Return the given sequences split into padded rows of the walk length.
+
+        Consecutive rows of the same sequence overlap by twice the window
+        size, so that every window of the sequence is in exactly one row.
+
+        Parameters
+        ---------------
+        sequences: List[np.ndarray],
+            The sequences to split.
+
+        Returns
+        ---------------
+        Matrix of rows, padded with Word2VecSequence.PADDING.
+        """
+        span = self._window_size*2
+        rows = [
+            sequence[start:start + self._walk_length]
+            for sequence in sequences
+            for start in range(0, len(sequence) - span, self._walk_length - span)
+        ]
+        walks = np.full(
+            (len(rows), self._walk_length),
+            Word2VecSequence.PADDING,
+            dtype=np.uint64
+        )
+        for walk, row in zip(walks, rows):
+            walk[:len(row)] = row
+        return walks
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
+        """Return batch corresponding to given index and epoch.
 
         The return tuple of tuples is composed of an inner tuple, containing
         the words vector and the vector of vectors of the contexts.
@@ -27,17 +73,29 @@ class Word2VecSequence(AbstractWord2VecSequence):
         the speed of the training process since it does not require to allocate
         empty vectors of considerable size for the one-hot encoding process.
 
+        When the walk length is given, the batch is instead the matrix of
+        the sequences split into padded rows, and the windows are extracted
+        within the model.
+
         Parameters
         ---------------
         idx: int,
             Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
 
         Returns
         ---------------
         Tuple of tuples with input data.
         """
+        if self._walk_length is not None:
+            walks = self._get_walks(self._get_sequences(idx, epoch))
+            if self._support_mirror_strategy:
+                return walks.astype(float), None
+            return walks, None
+
         words, contexts = preprocessing.word2vec(
-            self._sequences[idx],
+            self._get_sequences(idx, epoch),
             window_size=self._window_size,
         )
 
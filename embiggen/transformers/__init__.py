@@ -4,11 +4,17 @@ from .node_transformer import NodeTransformer
 from .graph_transformer import GraphTransformer
 from .corpus_transformer import CorpusTransformer
 from .link_prediction_transformer import LinkPredictionTransformer
+from .edge_embedding_sequence import EdgeEmbeddingSequence
+from .edge_embedding_shard_sequence import EdgeEmbeddingShardSequence
+from .edge_feature_cache import EdgeFeatureCache
 
 __all__ = [
     "EdgeTransformer",
     "NodeTransformer",
     "GraphTransformer",
     "CorpusTransformer",
-    "LinkPredictionTransformer"
+    "LinkPredictionTransformer",
+    "EdgeEmbeddingSequence",
+    "EdgeEmbeddingShardSequence",
+    "EdgeFeatureCache"
 ]
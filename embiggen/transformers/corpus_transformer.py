@@ -1,9 +1,11 @@
 """Module offers basic Corpus Transformer object, a simple class to tekenize textual corpuses."""
 import math
+import os
 import string
 from collections import Counter
+from itertools import islice
 from multiprocessing import Pool, cpu_count
-from typing import Dict, Generator, List, Set
+from typing import Dict, Generator, Iterable, List, Set, Union
 
 import numpy as np
 import pandas as pd
@@ -14,6 +16,8 @@ from tensorflow.keras.preprocessing.text import \
     Tokenizer  # pylint: disable=import-error
 from tqdm.auto import tqdm
 
+from ..sequences import TokenCorpus
+
 
 class CorpusTransformer:
     """Simple class to tekenize textual corpuses."""
@@ -340,13 +344,17 @@ class CorpusTransformer:
         """
         return self._tokenizer.word_index[word] - 1
 
-    def transform(self, texts: List[str]) -> np.ndarray:
+    def transform(self, texts: List[str], return_corpus: bool = False) -> Union[np.ndarray, TokenCorpus]:
         """Transform given text.
 
         Parameters
         --------------------------
         texts: List[str],
             The texts to encode as digits.
+        return_corpus: bool = False,
+            Whether to return the tokens as a TokenCorpus, a single flat
+            array with the offsets of the sequences, instead of an array
+            of arrays. The corpus can be saved and memory-mapped.
 
         Raises
         ----------------------------
@@ -357,7 +365,7 @@ class CorpusTransformer:
 
         Returns
         --------------------------
-        Numpy array with numpy arrays of tokens.
+        Numpy array with numpy arrays of tokens, or the TokenCorpus.
         """
         if pd.isna(texts).any():
             raise ValueError(
@@ -367,7 +375,7 @@ class CorpusTransformer:
             raise ValueError(
                 "There are not string values within the given texts."
             )
-        return np.array([
+        sequences = [
             np.array(tokens, dtype=np.uint64) - 1
             for tokens in self._tokenizer.texts_to_sequences((
                 " ".join(tokens)
@@ -379,4 +387,42 @@ class CorpusTransformer:
                 )
                 if len(tokens) >= self._min_sequence_length
             ))
-        ], dtype=object)
+        ]
+        if return_corpus:
+            return TokenCorpus.from_sequences(sequences)
+        return np.array(sequences, dtype=object)
+
+    def transform_to_shards(
+        self,
+        texts: Iterable[str],
+        directory: str,
+        shard_size: int = 2**16
+    ) -> List[str]:
+        """Transform given texts and save them as shards of a corpus.
+
+        The texts are consumed lazily, so they can be for instance the
+        lines of a file larger than the memory. The shards can be used
+        to train models with the StreamingWord2VecSequence.
+
+        Parameters
+        --------------------------
+        texts: Iterable[str],
+            The texts to encode as digits.
+        directory: str,
+            The directory where to save the shards.
+        shard_size: int = 2**16,
+            Number of texts to include in every shard.
+
+        Returns
+        --------------------------
+        The list of the paths of the shards.
+        """
+        texts = iter(texts)
+        paths = []
+        while True:
+            chunk = list(islice(texts, shard_size))
+            if not chunk:
+                return paths
+            path = os.path.join(directory, "shard_{:06d}".format(len(paths)))
+            self.transform(chunk, return_corpus=True).save(path)
+            paths.append(path)
@@ -0,0 +1,105 @@
+"""Keras Sequence object computing the edge embedding of the batches on demand."""
+from typing import Tuple
+
+import numpy as np  # type: ignore
+import tensorflow as tf
+
+from ..sequences.abstract_sequence import AbstractSequence
+from .edge_transformer import EdgeTransformer
+
+
+class EdgeEmbeddingSequence(AbstractSequence):
+    """Keras Sequence object computing the edge embedding of the batches on demand.
+
+    Only the rows of the embedding of the nodes of the edges and their
+    labels are kept, and the edge embedding of every batch is computed when
+    the batch is requested, so the features of all the edges never need to
+    be in memory at the same time.
+    """
+
+    def __init__(
+        self,
+        transformer: EdgeTransformer,
+        edges: np.ndarray,
+        labels: np.ndarray,
+        batch_size: int = 2**10,
+        shuffle: bool = True,
+        elapsed_epochs: int = 0,
+        seed: int = 42
+    ):
+        """Create new EdgeEmbeddingSequence object.
+
+        Parameters
+        -----------------------------
+        transformer: EdgeTransformer,
+            The fitted transformer to use to compute the edge embedding.
+        edges: np.ndarray,
+            The rows of the embedding of the sources and destinations
+            of the edges, with shape (edges number, 2).
+        labels: np.ndarray,
+            The labels of the edges.
+        batch_size: int = 2**10,
+            Number of edges to include in a single batch.
+        shuffle: bool = True,
+            Whether to shuffle the edges at every epoch.
+        elapsed_epochs: int = 0,
+            Number of elapsed epochs to init state of generator.
+        seed: int = 42,
+            The seed to use to make the shuffling reproducible.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the number of edges and labels do not match.
+        """
+        if edges.shape[0] != labels.shape[0]:
+            raise ValueError((
+                "The number of edges ({}) does not match "
+                "the number of labels ({})."
+            ).format(edges.shape[0], labels.shape[0]))
+        self._transformer = transformer
+        self._edges = edges
+        self._labels = labels
+        super().__init__(
+            batch_size=batch_size,
+            sample_number=edges.shape[0],
+            shuffle=shuffle,
+            elapsed_epochs=elapsed_epochs,
+            random_state=seed
+        )
+
+    @property
+    def output_signature(self) -> Tuple:
+        """Return the signature of the batches, as expected by Keras."""
+        return (
+            tf.TensorSpec((None, self._transformer.embedding_size), tf.float32),
+            tf.TensorSpec((None, *self._labels.shape[1:]), tf.as_dtype(self._labels.dtype))
+        )
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return batch corresponding to given index and epoch.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple with the edge embedding and the labels of the batch.
+        """
+        batch = slice(idx*self._batch_size, (idx + 1)*self._batch_size)
+        if self._shuffle:
+            indices = self._get_permutation(epoch)[batch]
+            edges = self._edges[indices]
+            labels = self._labels[indices]
+        else:
+            edges = self._edges[batch]
+            labels = self._labels[batch]
+        return self._transformer.transform(
+            edges[:, 0],
+            edges[:, 1],
+            aligned_node_mapping=True
+        ), labels
@@ -0,0 +1,239 @@
+"""Keras Sequence object reading edge embeddings and labels from shards."""
+import json
+import os
+from typing import Dict, Generator, Tuple
+
+import numpy as np  # type: ignore
+import tensorflow as tf
+
+from ..sequences.abstract_sequence import AbstractSequence
+from ..sequences.seeds import get_epoch_seed
+
+
+class EdgeEmbeddingShardSequence(AbstractSequence):
+    """Keras Sequence object reading edge embeddings and labels from shards.
+
+    The shards are the directories written by the method
+    `transform_to_shards` of the LinkPredictionTransformer, each one
+    containing the already shuffled edge embeddings and labels of a
+    group of edges. Every batch is a contiguous slice of a single shard,
+    so the shards are read sequentially from the disk. Only the shards
+    listed in the manifest of the directory are read.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(
+        self,
+        directory: str,
+        batch_size: int = 2**10,
+        shuffle: bool = True,
+        elapsed_epochs: int = 0,
+        seed: int = 42
+    ):
+        """Create new EdgeEmbeddingShardSequence object.
+
+        Parameters
+        -----------------------------
+        directory: str,
+            Directory containing the shards.
+        batch_size: int = 2**10,
+            Maximum number of edges to include in a single batch.
+        shuffle: bool = True,
+            Whether to shuffle the order of the batches at every epoch.
+        elapsed_epochs: int = 0,
+            Number of elapsed epochs to init state of generator.
+        seed: int = 42,
+            The seed to use to make the shuffling reproducible.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the given directory does not contain the manifest of the
+            shards, as they were not completely written.
+        ValueError,
+            If the given directory does not contain any shard.
+        """
+        manifest = os.path.join(directory, EdgeEmbeddingShardSequence.MANIFEST)
+        if not os.path.exists(manifest):
+            raise ValueError((
+                "The given directory {} does not contain the manifest of "
+                "completely written shards."
+            ).format(directory))
+        with open(manifest) as f:
+            self._shards = [
+                os.path.join(directory, name)
+                for name in json.load(f)["shards"]
+            ]
+        if not self._shards:
+            raise ValueError((
+                "The given directory {} does not contain any shard."
+            ).format(directory))
+        features = np.load(
+            os.path.join(self._shards[0], "features.npy"),
+            mmap_mode="r"
+        )
+        self._embedding_size = features.shape[1]
+        # Every shard is split in its own batches, so that
+        # the batches never span two shards.
+        shard_steps = np.array([
+            int(np.ceil(np.load(
+                os.path.join(shard, "labels.npy"),
+                mmap_mode="r"
+            ).size / batch_size))
+            for shard in self._shards
+        ])
+        self._first_steps = np.zeros(shard_steps.size + 1, dtype=np.int64)
+        np.cumsum(shard_steps, out=self._first_steps[1:])
+        # Memory maps of the shards, opened when first read.
+        self._memmaps = {}
+        super().__init__(
+            batch_size=batch_size,
+            sample_number=int(self._first_steps[-1])*batch_size,
+            shuffle=shuffle,
+            elapsed_epochs=elapsed_epochs,
+            random_state=seed
+        )
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle, without the memory maps of the shards."""
+        state = super().__getstate__()
+        state["_memmaps"] = {}
+        return state
+
+    @property
+    def output_signature(self) -> Tuple:
+        """Return the signature of the batches, as expected by Keras."""
+        return (
+            tf.TensorSpec((None, self._embedding_size), tf.float32),
+            tf.TensorSpec((None,), tf.float32)
+        )
+
+    def _get_shard(self, shard: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the memory maps of the given shard, opening them once.
+
+        Parameters
+        ---------------
+        shard: int,
+            The index of the shard.
+
+        Returns
+        ---------------
+        Tuple with the memory maps of the edge embedding and of the labels.
+        """
+        if shard not in self._memmaps:
+            self._memmaps[shard] = (
+                np.load(os.path.join(self._shards[shard], "features.npy"), mmap_mode="r"),
+                np.load(os.path.join(self._shards[shard], "labels.npy"), mmap_mode="r")
+            )
+        return self._memmaps[shard]
+
+    def _get_permutation(self, epoch: int) -> np.ndarray:
+        """Return seeded permutation of the batches of the given epoch.
+
+        The batches are shuffled instead of the edges, which were
+        already shuffled when the shards were written.
+
+        Parameters
+        ---------------
+        epoch: int,
+            The epoch whose permutation is to be returned.
+
+        Returns
+        ---------------
+        The permutation of the batches.
+        """
+        with self._permutations_lock:
+            if epoch not in self._permutations:
+                if len(self._permutations) > 1:
+                    self._permutations.pop(min(self._permutations))
+                numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+                    seed=get_epoch_seed(self._random_state, epoch)
+                )
+                self._permutations[epoch] = numpy_random_state.permutation(
+                    self.steps_per_epoch
+                )
+            return self._permutations[epoch]
+
+    def _get_batch(self, idx: int, epoch: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return batch corresponding to given index and epoch.
+
+        Parameters
+        ---------------
+        idx: int,
+            Index corresponding to batch to be returned.
+        epoch: int,
+            Epoch corresponding to batch to be returned.
+
+        Returns
+        ---------------
+        Tuple with the edge embedding and the labels of the batch.
+        """
+        if self._shuffle:
+            idx = self._get_permutation(epoch)[idx]
+        shard = int(np.searchsorted(self._first_steps, idx, side="right")) - 1
+        batch = slice(
+            (idx - self._first_steps[shard])*self._batch_size,
+            (idx - self._first_steps[shard] + 1)*self._batch_size
+        )
+        features, labels = self._get_shard(shard)
+        return np.array(features[batch]), np.array(labels[batch])
+
+    def _read_shard(self, path: bytes) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
+        """Yield the batches of the given shard, in order.
+
+        Parameters
+        ---------------
+        path: bytes,
+            The path of the shard, as passed by TensorFlow.
+
+        Yields
+        ---------------
+        Tuples with the edge embedding and the labels of the batches.
+        """
+        path = path.decode()
+        features = np.load(os.path.join(path, "features.npy"), mmap_mode="r")
+        labels = np.load(os.path.join(path, "labels.npy"), mmap_mode="r")
+        for start in range(0, labels.size, self._batch_size):
+            yield (
+                np.array(features[start:start + self._batch_size]),
+                np.array(labels[start:start + self._batch_size])
+            )
+
+    def to_tf_dataset(self, epochs: int = None, cycle_length: int = 4) -> tf.data.Dataset:
+        """Return TensorFlow dataset reading the shards in parallel.
+
+        Differently from the sequence, the dataset reads the batches of
+        multiple shards at once, interleaving them, and the order of the
+        shards, rather than of the batches, is shuffled at every epoch.
+
+        Parameters
+        -----------------------------
+        epochs: int = None,
+            Number of epochs to generate. By default the dataset is infinite,
+            and the number of steps per epoch must be given to the fit method.
+        cycle_length: int = 4,
+            Number of shards read concurrently.
+
+        Returns
+        -----------------------------
+        The TensorFlow dataset.
+        """
+        shards = tf.data.Dataset.from_tensor_slices(self._shards)
+        if self._shuffle:
+            shards = shards.shuffle(
+                len(self._shards),
+                seed=self._random_state,
+                reshuffle_each_iteration=True
+            )
+        signature = self.output_signature
+        return shards.repeat(epochs).interleave(
+            lambda path: tf.data.Dataset.from_generator(
+                self._read_shard,
+                output_types=tuple(spec.dtype for spec in signature),
+                output_shapes=tuple(spec.shape for spec in signature),
+                args=(path,)
+            ),
+            cycle_length=cycle_length,
+            num_parallel_calls=tf.data.experimental.AUTOTUNE
+        ).prefetch(tf.data.experimental.AUTOTUNE)
@@ -0,0 +1,130 @@
+"""Cache of edge embeddings stored as memory-mapped files."""
+import os
+from threading import get_ident
+from typing import Callable, Tuple
+
+import numpy as np  # type: ignore
+
+
+class EdgeFeatureCache:
+    """Cache of edge embeddings stored as memory-mapped files.
+
+    Every edge embedding is saved in the cache directory as an npy file
+    named after the key identifying it, which the transformers derive from
+    the content of the embedding, of the edges and from the method, so the
+    same edge embedding is served again without computing it, also by
+    other processes sharing the directory. When the files in the directory
+    exceed the given size, the least recently used ones are removed.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2**34):
+        """Create new EdgeFeatureCache object.
+
+        Parameters
+        -----------------------------
+        directory: str,
+            The directory where to store the edge embeddings.
+        max_bytes: int = 2**34,
+            Maximum size in bytes of the stored edge embeddings.
+            The most recently used edge embedding is kept even when larger.
+
+        Raises
+        -----------------------------
+        ValueError,
+            If the given maximum size is not strictly positive.
+        """
+        if max_bytes < 1:
+            raise ValueError((
+                "The given maximum size ({}) must be strictly positive."
+            ).format(max_bytes))
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+    def get_or_create(
+        self,
+        key: str,
+        shape: Tuple[int, int],
+        compute: Callable[[np.ndarray], None]
+    ) -> np.ndarray:
+        """Return the edge embedding with the given key, computing it if missing.
+
+        Parameters
+        -----------------------------
+        key: str,
+            The key identifying the edge embedding.
+        shape: Tuple[int, int],
+            The shape of the edge embedding.
+        compute: Callable[[np.ndarray], None],
+            Function writing the edge embedding in the given float32 array.
+
+        Returns
+        -----------------------------
+        Read-only memory map of the edge embedding.
+        """
+        path = os.path.join(self._directory, "{}.npy".format(key))
+        try:
+            # The modification time of the files is their last use.
+            os.utime(path)
+            return np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            pass
+        temporary_path = "{}.{}.{}.tmp".format(path, os.getpid(), get_ident())
+        features = np.lib.format.open_memmap(
+            temporary_path,
+            mode="w+",
+            dtype=np.float32,
+            shape=shape
+        )
+        try:
+            compute(features)
+            features.flush()
+        except Exception:
+            # The partially written embedding must not be left in the directory.
+            del features
+            os.remove(temporary_path)
+            raise
+        del features
+        os.replace(temporary_path, path)
+        self._evict(path)
+        return np.load(path, mmap_mode="r")
+
+    def _evict(self, keep: str):
+        """Remove the least recently used edge embeddings exceeding the maximum size.
+
+        Parameters
+        -----------------------------
+        keep: str,
+            Path of the edge embedding that must not be removed.
+        """
+        files = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(".npy"):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_bytes <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # The file was already removed or is still mapped.
+                continue
+            total_bytes -= size
+
+    def clear(self):
+        """Remove all the stored edge embeddings."""
+        for name in os.listdir(self._directory):
+            if name.endswith(".npy"):
+                try:
+                    os.remove(os.path.join(self._directory, name))
+                except OSError:
+                    continue
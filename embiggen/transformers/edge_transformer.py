@@ -1,9 +1,13 @@
 """EdgeTransformer class to convert edges to edge embeddings."""
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
+from typing import Callable, Dict, List, Union
 
 import numpy as np
 import pandas as pd
 
+from ..embedders.embedder import Embedder
+from ..embedders.multilevel_embedder import MultilevelEmbedder
 from .node_transformer import NodeTransformer
 
 
@@ -19,8 +23,11 @@ class EdgeTransformer:
         "L2": lambda x1, x2: np.power(np.subtract(x1, x2, out=x1), 2, out=x1),
         "Concatenate": lambda x1, x2: np.hstack((x1, x2)),
     }
+    # Size in bytes of the output of the chunks of edges processed by
+    # every thread, small enough for the gathered rows to stay in cache.
+    CHUNK_BYTES = 2**18
 
-    def __init__(self, method: str = "Hadamard"):
+    def __init__(self, method: str = "Hadamard", n_jobs: int = 1):
         """Create new EdgeTransformer object.
 
         Parameters
@@ -28,7 +35,25 @@ class EdgeTransformer:
         method: str = "Hadamard",
             Method to use for the embedding.
             Can either be 'Hadamard', 'Sum', 'Average', 'L1', 'AbsoluteL1', 'L2' or 'Concatenate'.
+        n_jobs: int = 1,
+            Number of threads computing the edge embedding.
+            If different from 1, the edges are split in chunks of about
+            `CHUNK_BYTES` bytes of output, which are processed by a pool of
+            threads writing into the same output array.
+            Use -1 to use all the available CPUs.
+
+        Raises
+        ------------------------
+        ValueError,
+            If the given method is not supported.
+        ValueError,
+            If the given number of jobs is not a strictly positive integer or -1.
         """
+        if n_jobs != -1 and n_jobs < 1:
+            raise ValueError((
+                "The given number of jobs ({}) is not "
+                "a strictly positive integer or -1."
+            ).format(n_jobs))
         if isinstance(method, str) and method not in EdgeTransformer.methods:
             raise ValueError((
                 "Given method '{}' is not supported. "
@@ -36,25 +61,190 @@ class EdgeTransformer:
             ).format(
                 method, ", ".join(list(EdgeTransformer.methods.keys()))
             ))
+        self._method_name = method
         self._method = EdgeTransformer.methods[method]
+        self._n_jobs = cpu_count() if n_jobs == -1 else n_jobs
         self._transformer = NodeTransformer()
 
-    def fit(self, embedding: pd.DataFrame):
+    def fit(
+        self,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
+        node_names: List[str] = None
+    ):
         """Fit the model.
 
         Parameters
         -------------------------
-        embedding: pd.DataFrame,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
             Embedding to use to fit the transformer.
-            This is a pandas DataFrame and NOT a numpy array because we need
-            to be able to remap correctly the vector embeddings in case of
-            graphs that do not respect the same internal node mapping but have
-            the same node set. It is possible to remap such graphs using
-            Ensmallen's remap method but it may be less intuitive to users.
+            It can either be a pandas DataFrame indexed by the node names,
+            a numpy array or memory map, or a trained embedding model.
+            The names of the nodes are needed to be able to remap correctly
+            the vector embeddings in case of graphs that do not respect the
+            same internal node mapping but have the same node set.
+            It is possible to remap such graphs using Ensmallen's remap
+            method but it may be less intuitive to users.
+        node_names: List[str] = None,
+            The names of the nodes of the rows of the embedding.
+            It is ignored when the embedding is a DataFrame.
+            If not given, only the aligned node mapping can be used.
+        """
+        self._transformer.fit(embedding, node_names)
+
+    def get_node_ids(self, nodes: List[str]) -> np.ndarray:
+        """Return the rows of the embedding of the given node names.
+
+        Parameters
+        --------------------------
+        nodes: List[str],
+            List of nodes whose rows are to be returned.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+        ValueError,
+            If some of the given nodes are not in the embedding.
+
+        Returns
+        --------------------------
+        Numpy array of the rows of the nodes.
+        """
+        return self._transformer.get_node_ids(nodes)
+
+    @property
+    def embedding_size(self) -> int:
+        """Return the dimension of the edge embedding.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+        """
+        if self._method_name == "Concatenate":
+            return self._transformer.embedding_size*2
+        return self._transformer.embedding_size
+
+    @property
+    def fingerprint(self) -> str:
+        """Return hash identifying the fitted embedding and the method.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+        """
+        return "{}-{}".format(self._method_name, self._transformer.fingerprint)
+
+    def _run_chunks(self, function: Callable[[slice], None], edges_number: int, row_bytes: int):
+        """Apply the given function to the chunks of the edges.
+
+        Parameters
+        --------------------------
+        function: Callable[[slice], None],
+            Function computing the chunk of edges of the given slice.
+        edges_number: int,
+            Number of edges.
+        row_bytes: int,
+            Size in bytes of the output of every edge.
         """
-        self._transformer.fit(embedding)
+        if self._n_jobs == 1:
+            function(slice(0, edges_number))
+            return
+        chunk_size = max(1, EdgeTransformer.CHUNK_BYTES // row_bytes)
+        # The NumPy calls release the GIL, so the chunks run in parallel.
+        with ThreadPoolExecutor(max_workers=self._n_jobs) as executor:
+            futures = [
+                executor.submit(function, slice(start, start + chunk_size))
+                for start in range(0, edges_number, chunk_size)
+            ]
+            for future in futures:
+                future.result()
+
+    def _transform_into(
+        self,
+        sources: np.ndarray,
+        destinations: np.ndarray,
+        out: np.ndarray,
+        buffer: np.ndarray = None
+    ) -> np.ndarray:
+        """Write the embedding of the given edges into the given array.
+
+        Parameters
+        --------------------------
+        sources: np.ndarray,
+            Rows of the embedding of the source nodes.
+        destinations: np.ndarray,
+            Rows of the embedding of the destination nodes.
+        out: np.ndarray,
+            Float32 array where to write the edge embedding.
+        buffer: np.ndarray = None,
+            Float32 array where to gather the destination nodes embedding.
+            If not given, new arrays are allocated.
 
-    def transform(self, sources: List[str], destinations: List[str], aligned_node_mapping: bool = False) -> np.ndarray:
+        Returns
+        --------------------------
+        The given output array.
+        """
+        sources = np.asarray(sources)
+        destinations = np.asarray(destinations)
+        self._run_chunks(
+            lambda chunk: self._transform_chunk(
+                sources[chunk],
+                destinations[chunk],
+                out[chunk],
+                None if buffer is None else buffer[chunk]
+            ),
+            sources.size,
+            out.shape[1]*out.itemsize
+        )
+        return out
+
+    def _transform_chunk(
+        self,
+        sources: np.ndarray,
+        destinations: np.ndarray,
+        out: np.ndarray,
+        buffer: np.ndarray = None
+    ) -> np.ndarray:
+        """Write the embedding of the given chunk of edges into the given array.
+
+        Parameters
+        --------------------------
+        sources: np.ndarray,
+            Rows of the embedding of the source nodes.
+        destinations: np.ndarray,
+            Rows of the embedding of the destination nodes.
+        out: np.ndarray,
+            Float32 array where to write the edge embedding.
+        buffer: np.ndarray = None,
+            Float32 array where to gather the destination nodes embedding.
+            If not given, a new array is allocated.
+
+        Returns
+        --------------------------
+        The given output array.
+        """
+        if self._method_name == "Concatenate":
+            size = out.shape[1] // 2
+            self._transformer.transform(sources, True, out=out[:, :size])
+            self._transformer.transform(destinations, True, out=out[:, size:])
+            return out
+        # The sources are gathered directly in the output array,
+        # where the method combines them with the destinations.
+        self._method(
+            self._transformer.transform(sources, True, out=out),
+            self._transformer.transform(destinations, True, out=buffer)
+        )
+        return out
+
+    def transform(
+        self,
+        sources: List[str],
+        destinations: List[str],
+        aligned_node_mapping: bool = False,
+        out: np.ndarray = None
+    ) -> np.ndarray:
         """Return embedding for given edges using provided method.
 
         Parameters
@@ -68,6 +258,9 @@ class EdgeTransformer:
             matches the internal node mapping of the given graph.
             If these two mappings do not match, the generated edge embedding
             will be meaningless.
+        out: np.ndarray = None,
+            Float32 array where to write the edge embedding.
+            If not given, a new array is allocated.
 
         Raises
         --------------------------
@@ -78,13 +271,123 @@ class EdgeTransformer:
         --------------------------
         Numpy array of embeddings.
         """
-        return self._method(
-            self._transformer.transform(
-                sources,
-                aligned_node_mapping
-            ),
-            self._transformer.transform(
-                destinations,
-                aligned_node_mapping
+        if not aligned_node_mapping:
+            sources = self.get_node_ids(sources)
+            destinations = self.get_node_ids(destinations)
+        if out is None:
+            out = np.empty(
+                (len(sources), self.embedding_size),
+                dtype=np.float32
             )
+        return self._transform_into(sources, destinations, out)
+
+    def transform_methods(
+        self,
+        sources: List[str],
+        destinations: List[str],
+        methods: List[str] = None,
+        aligned_node_mapping: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """Return embedding for given edges using all the given methods.
+
+        The embeddings of the source and destination nodes are gathered
+        only once, and the edge embeddings of all the methods are computed
+        into a single preallocated array, of which views are returned.
+
+        Parameters
+        --------------------------
+        sources: List[str],
+            List of source nodes whose embedding is to be returned.
+        destinations: List[str],
+            List of destination nodes whose embedding is to be returned.
+        methods: List[str] = None,
+            Methods to use for the embedding.
+            By default, all the supported methods.
+        aligned_node_mapping: bool = False,
+            This parameter specifies wheter the mapping of the embeddings nodes
+            matches the internal node mapping of the given graph.
+            If these two mappings do not match, the generated edge embedding
+            will be meaningless.
+
+        Raises
+        --------------------------
+        ValueError,
+            If some of the given methods are not supported.
+        ValueError,
+            If embedding is not fitted.
+
+        Returns
+        --------------------------
+        Dictionary with the edge embedding of every method.
+        """
+        methods = list(dict.fromkeys(
+            EdgeTransformer.methods if methods is None else methods
+        ))
+        for method in methods:
+            if method not in EdgeTransformer.methods:
+                raise ValueError((
+                    "Given method '{}' is not supported. "
+                    "Supported methods are {}."
+                ).format(
+                    method, ", ".join(list(EdgeTransformer.methods.keys()))
+                ))
+        if not aligned_node_mapping:
+            sources = self.get_node_ids(sources)
+            destinations = self.get_node_ids(destinations)
+        sources = np.asarray(sources)
+        destinations = np.asarray(destinations)
+        size = self._transformer.embedding_size
+        widths = [
+            size*2 if method == "Concatenate" else size
+            for method in methods
+        ]
+        block = np.empty(sources.size*sum(widths), dtype=np.float32)
+        embeddings = {}
+        offset = 0
+        for method, width in zip(methods, widths):
+            embeddings[method] = block[offset:offset + sources.size*width].reshape(
+                sources.size,
+                width
+            )
+            offset += sources.size*width
+        self._run_chunks(
+            lambda chunk: self._transform_methods_chunk(
+                sources[chunk],
+                destinations[chunk],
+                {
+                    method: embedding[chunk]
+                    for method, embedding in embeddings.items()
+                }
+            ),
+            sources.size,
+            sum(widths)*block.itemsize
         )
+        return embeddings
+
+    def _transform_methods_chunk(
+        self,
+        sources: np.ndarray,
+        destinations: np.ndarray,
+        embeddings: Dict[str, np.ndarray]
+    ):
+        """Write the embedding of the given edges for every method.
+
+        Parameters
+        --------------------------
+        sources: np.ndarray,
+            Rows of the embedding of the source nodes.
+        destinations: np.ndarray,
+            Rows of the embedding of the destination nodes.
+        embeddings: Dict[str, np.ndarray],
+            Arrays where to write the edge embedding of every method.
+        """
+        source_embedding = self._transformer.transform(sources, True)
+        destination_embedding = self._transformer.transform(destinations, True)
+        size = source_embedding.shape[1]
+        for method, embedding in embeddings.items():
+            if method == "Concatenate":
+                embedding[:, :size] = source_embedding
+                embedding[:, size:] = destination_embedding
+            else:
+                np.copyto(embedding, source_embedding)
+                EdgeTransformer.methods[method](embedding, destination_embedding)
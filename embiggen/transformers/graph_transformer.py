@@ -1,16 +1,25 @@
 """GraphTransformer class to convert graphs to edge embeddings."""
-from typing import List, Union
+import hashlib
+from typing import Dict, Generator, List, Union
 import pandas as pd
 import numpy as np
 from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
 
+from ..embedders.embedder import Embedder
+from ..embedders.multilevel_embedder import MultilevelEmbedder
+from .edge_feature_cache import EdgeFeatureCache
 from .edge_transformer import EdgeTransformer
 
 
 class GraphTransformer:
     """GraphTransformer class to convert graphs to edge embeddings."""
 
-    def __init__(self, method: str = "Hadamard"):
+    def __init__(
+        self,
+        method: str = "Hadamard",
+        n_jobs: int = 1,
+        cache: EdgeFeatureCache = None
+    ):
         """Create new GraphTransformer object.
 
         Parameters
@@ -18,25 +27,113 @@ class GraphTransformer:
         method: str = "hadamard",
             Method to use for the embedding.
             Can either be 'Hadamard', 'Sum', 'Average', 'L1', 'AbsoluteL1', 'L2' or 'Concatenate'.
+        n_jobs: int = 1,
+            Number of threads computing the edge embedding.
+            Use -1 to use all the available CPUs.
+        cache: EdgeFeatureCache = None,
+            Cache where to store the edge embeddings returned by the
+            transform method, which are then returned as read-only memory
+            maps. The edge embedding of the same embedding, edges and method
+            is computed only once. By default, no cache is used.
+            The embedding is identified by its fingerprint, computed once
+            after every fit, so an array fitted without copies must not be
+            modified in place while the transformer is in use, or the
+            edge embedding of its previous values would be returned.
         """
-        self._transformer = EdgeTransformer(method=method)
+        self._transformer = EdgeTransformer(method=method, n_jobs=n_jobs)
+        self._cache = cache
+        self._alignment = None
 
-    def fit(self, embedding: pd.DataFrame):
+    def fit(
+        self,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
+        node_names: List[str] = None
+    ):
         """Fit the model.
 
         Parameters
         -------------------------
-        embedding: pd.DataFrame,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
             Embedding to use to fit the transformer.
-            This is a pandas DataFrame and NOT a numpy array because we need
-            to be able to remap correctly the vector embeddings in case of
-            graphs that do not respect the same internal node mapping but have
-            the same node set. It is possible to remap such graphs using
-            Ensmallen's remap method but it may be less intuitive to users.
+            It can either be a pandas DataFrame indexed by the node names,
+            a numpy array or memory map, or a trained embedding model.
+            The names of the nodes are needed to be able to remap correctly
+            the vector embeddings in case of graphs that do not respect the
+            same internal node mapping but have the same node set.
+            It is possible to remap such graphs using Ensmallen's remap
+            method but it may be less intuitive to users.
+        node_names: List[str] = None,
+            The names of the nodes of the rows of the embedding.
+            It is ignored when the embedding is a DataFrame.
+            If not given, only the aligned node mapping can be used.
         """
-        self._transformer.fit(embedding)
+        self._transformer.fit(embedding, node_names)
+        self._alignment = None
 
-    def transform(self, graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]], aligned_node_mapping: bool = False) -> np.ndarray:
+    def _get_alignment(self, graph: EnsmallenGraph) -> np.ndarray:
+        """Return the rows of the embedding of the nodes of the given graph.
+
+        The alignment of the last transformed graph is kept, so that
+        transforming again the same graph does not look up its node names.
+
+        Parameters
+        --------------------------
+        graph: EnsmallenGraph,
+            The graph whose nodes are to be aligned to the embedding.
+
+        Returns
+        --------------------------
+        Numpy array with the row of the embedding of every node ID of the graph.
+        """
+        if self._alignment is None or self._alignment[0] is not graph:
+            self._alignment = (
+                graph,
+                self._transformer.get_node_ids(graph.get_node_names())
+            )
+        return self._alignment[1]
+
+    def _get_edges(
+        self,
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        aligned_node_mapping: bool
+    ) -> np.ndarray:
+        """Return the rows of the embedding of the nodes of the given edges.
+
+        Parameters
+        --------------------------
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+            The graph whose edges are to embed.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        aligned_node_mapping: bool,
+            Whether the mapping of the embeddings nodes matches the node
+            IDs of the given graph.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+
+        Returns
+        --------------------------
+        Numpy array with the rows of the sources and destinations of the edges.
+        """
+        if isinstance(graph, EnsmallenGraph):
+            edges = graph.get_edges(directed=False)
+            if aligned_node_mapping:
+                return edges
+            # The node IDs of the graph are mapped to the rows of the
+            # embedding, so the names of the edges are never built.
+            return self._get_alignment(graph)[edges]
+        graph = np.asarray(graph)
+        if aligned_node_mapping:
+            return graph
+        return self._transformer.get_node_ids(graph.ravel()).reshape(graph.shape)
+
+    def transform(
+        self,
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        aligned_node_mapping: bool = False
+    ) -> np.ndarray:
         """Return edge embedding for given graph using provided method.
 
         Parameters
@@ -57,16 +154,178 @@ class GraphTransformer:
 
         Returns
         --------------------------
-        Numpy array of embeddings.
+        Numpy array of embeddings, or read-only memory map if a cache is used.
         """
-        if isinstance(graph, EnsmallenGraph):
-            if aligned_node_mapping:
-                graph = graph.get_edges(directed=False)
-            else:
-                graph = graph.get_edge_names(directed=False)
-        if isinstance(graph, List):
-            graph = np.array(graph)
-        if isinstance(graph, np.ndarray):
-            sources = graph[:, 0]
-            destinations = graph[:, 1]
-        return self._transformer.transform(sources, destinations, aligned_node_mapping)
+        edges = self._get_edges(graph, aligned_node_mapping)
+        if self._cache is None or edges.shape[0] == 0:
+            return self._transformer.transform(
+                edges[:, 0],
+                edges[:, 1],
+                aligned_node_mapping=True
+            )
+        edges = np.ascontiguousarray(edges)
+        key = hashlib.sha256(self._transformer.fingerprint.encode("utf-8"))
+        key.update(str((edges.dtype, edges.shape)).encode("utf-8"))
+        key.update(edges)
+        return self._cache.get_or_create(
+            key.hexdigest(),
+            (edges.shape[0], self._transformer.embedding_size),
+            lambda out: self._transformer._transform_into(  # pylint: disable=protected-access
+                edges[:, 0],
+                edges[:, 1],
+                out
+            )
+        )
+
+    def transform_methods(
+        self,
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        methods: List[str] = None,
+        aligned_node_mapping: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """Return edge embedding for given graph using all the given methods.
+
+        The embeddings of the nodes of the edges are gathered only once
+        for all the methods.
+
+        Parameters
+        --------------------------
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+            The graph whose edges are to embed.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        methods: List[str] = None,
+            Methods to use for the embedding.
+            By default, all the supported methods.
+        aligned_node_mapping: bool = False,
+            This parameter specifies wheter the mapping of the embeddings nodes
+            matches the internal node mapping of the given graph.
+            If these two mappings do not match, the generated edge embedding
+            will be meaningless.
+
+        Raises
+        --------------------------
+        ValueError,
+            If some of the given methods are not supported.
+        ValueError,
+            If embedding is not fitted.
+
+        Returns
+        --------------------------
+        Dictionary with the edge embedding of every method.
+        """
+        edges = self._get_edges(graph, aligned_node_mapping)
+        return self._transformer.transform_methods(
+            edges[:, 0],
+            edges[:, 1],
+            methods=methods,
+            aligned_node_mapping=True
+        )
+
+    def transform_iter(
+        self,
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        chunk_size: int = 2**16,
+        aligned_node_mapping: bool = False
+    ) -> Generator[np.ndarray, None, None]:
+        """Yield the edge embedding of the given graph in chunks of edges.
+
+        The chunks are computed in the same preallocated arrays, so the
+        memory used does not depend on the number of edges, and every
+        yielded chunk is overwritten by the following one: it must be
+        copied if it has to be kept.
+
+        Parameters
+        --------------------------
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+            The graph whose edges are to embed.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        chunk_size: int = 2**16,
+            Maximum number of edges of every chunk.
+        aligned_node_mapping: bool = False,
+            This parameter specifies wheter the mapping of the embeddings nodes
+            matches the internal node mapping of the given graph.
+            If these two mappings do not match, the generated edge embedding
+            will be meaningless.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+
+        Yields
+        --------------------------
+        Numpy array of embeddings of the chunks of edges, in order.
+        """
+        edges = self._get_edges(graph, aligned_node_mapping)
+        out = np.empty(
+            (min(chunk_size, edges.shape[0]), self._transformer.embedding_size),
+            dtype=np.float32
+        )
+        buffer = np.empty_like(out)
+        for start in range(0, edges.shape[0], chunk_size):
+            chunk = edges[start:start + chunk_size]
+            yield self._transformer._transform_into(  # pylint: disable=protected-access
+                chunk[:, 0],
+                chunk[:, 1],
+                out[:len(chunk)],
+                buffer[:len(chunk)]
+            )
+
+    def transform_to(
+        self,
+        path: str,
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        chunk_size: int = 2**16,
+        aligned_node_mapping: bool = False
+    ) -> np.memmap:
+        """Write the edge embedding of the given graph to the given npy file.
+
+        The file is preallocated and the chunks of edges are computed
+        directly into its memory map, so the edge embedding can be larger
+        than the available memory.
+
+        Parameters
+        --------------------------
+        path: str,
+            Path of the npy file where to write the edge embedding.
+        graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+            The graph whose edges are to embed.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        chunk_size: int = 2**16,
+            Maximum number of edges of every chunk.
+        aligned_node_mapping: bool = False,
+            This parameter specifies wheter the mapping of the embeddings nodes
+            matches the internal node mapping of the given graph.
+            If these two mappings do not match, the generated edge embedding
+            will be meaningless.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+
+        Returns
+        --------------------------
+        Memory map of the written edge embedding.
+        """
+        edges = self._get_edges(graph, aligned_node_mapping)
+        out = np.lib.format.open_memmap(
+            path,
+            mode="w+",
+            dtype=np.float32,
+            shape=(edges.shape[0], self._transformer.embedding_size)
+        )
+        buffer = np.empty(
+            (min(chunk_size, edges.shape[0]), out.shape[1]),
+            dtype=np.float32
+        )
+        for start in range(0, edges.shape[0], chunk_size):
+            chunk = edges[start:start + chunk_size]
+            self._transformer._transform_into(  # pylint: disable=protected-access
+                chunk[:, 0],
+                chunk[:, 1],
+                out[start:start + len(chunk)],
+                buffer[:len(chunk)]
+            )
+        out.flush()
+        return out
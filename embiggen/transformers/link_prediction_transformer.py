@@ -1,16 +1,29 @@
 """LinkPredictionTransformer class to convert graphs to edge embeddings to execute link prediction."""
+import json
+import os
+from threading import get_ident
 from typing import Tuple, Union, List
 import pandas as pd
 import numpy as np
 from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
 
+from ..embedders.embedder import Embedder
+from ..embedders.multilevel_embedder import MultilevelEmbedder
+from .edge_embedding_sequence import EdgeEmbeddingSequence
+from .edge_embedding_shard_sequence import EdgeEmbeddingShardSequence
+from .edge_feature_cache import EdgeFeatureCache
 from .graph_transformer import GraphTransformer
 
 
 class LinkPredictionTransformer:
     """LinkPredictionTransformer class to convert graphs to edge embeddings."""
 
-    def __init__(self, method: str = "Hadamard"):
+    def __init__(
+        self,
+        method: str = "Hadamard",
+        n_jobs: int = 1,
+        cache: EdgeFeatureCache = None
+    ):
         """Create new LinkPredictionTransformer object.
 
         Parameters
@@ -18,23 +31,42 @@ class LinkPredictionTransformer:
         method: str = "hadamard",
             Method to use for the embedding.
             Can either be 'Hadamard', 'Sum', 'Average', 'L1', 'AbsoluteL1', 'L2' or 'Concatenate'.
+        n_jobs: int = 1,
+            Number of threads computing the edge embedding.
+            Use -1 to use all the available CPUs.
+        cache: EdgeFeatureCache = None,
+            Cache where to store the edge embeddings of the positive and
+            negative graphs, which are then computed only once for the same
+            embedding, edges and method. By default, no cache is used.
+            As for the GraphTransformer, an array fitted without copies
+            must not be modified in place while the transformer is in use.
         """
-        self._transformer = GraphTransformer(method=method)
+        self._transformer = GraphTransformer(method=method, n_jobs=n_jobs, cache=cache)
 
-    def fit(self, embedding: pd.DataFrame):
+    def fit(
+        self,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
+        node_names: List[str] = None
+    ):
         """Fit the model.
 
         Parameters
         -------------------------
-        embedding: pd.DataFrame,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
             Embedding to use to fit the transformer.
-            This is a pandas DataFrame and NOT a numpy array because we need
-            to be able to remap correctly the vector embeddings in case of
-            graphs that do not respect the same internal node mapping but have
-            the same node set. It is possible to remap such graphs using
-            Ensmallen's remap method but it may be less intuitive to users.
+            It can either be a pandas DataFrame indexed by the node names,
+            a numpy array or memory map, or a trained embedding model.
+            The names of the nodes are needed to be able to remap correctly
+            the vector embeddings in case of graphs that do not respect the
+            same internal node mapping but have the same node set.
+            It is possible to remap such graphs using Ensmallen's remap
+            method but it may be less intuitive to users.
+        node_names: List[str] = None,
+            The names of the nodes of the rows of the embedding.
+            It is ignored when the embedding is a DataFrame.
+            If not given, only the aligned node mapping can be used.
         """
-        self._transformer.fit(embedding)
+        self._transformer.fit(embedding, node_names)
 
     def transform(
         self,
@@ -86,3 +118,190 @@ class LinkPredictionTransformer:
         indices = numpy_random_state.permutation(edge_labels.size)
 
         return edge_embeddings[indices], edge_labels[indices]
+
+    def _get_edges_and_labels(
+        self,
+        positive_graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        negative_graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        aligned_node_mapping: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the rows of the nodes of the positive and negative edges and their labels.
+
+        Parameters
+        --------------------------
+        positive_graph: Union[EnsmallenGraph, List[List[str]], List[List[int]]],
+            The graph whose edges are to be labeled as positives.
+        negative_graph: Union[EnsmallenGraph, List[List[str]], List[List[int]]],
+            The graph whose edges are to be labeled as negatives.
+        aligned_node_mapping: bool,
+            Whether the mapping of the embeddings nodes matches the node
+            IDs of the given graphs.
+
+        Returns
+        --------------------------
+        Tuple with the rows of the nodes of the edges and the labels.
+        """
+        positive_edges = self._transformer._get_edges(  # pylint: disable=protected-access
+            positive_graph,
+            aligned_node_mapping
+        )
+        negative_edges = self._transformer._get_edges(  # pylint: disable=protected-access
+            negative_graph,
+            aligned_node_mapping
+        )
+        labels = np.zeros(
+            positive_edges.shape[0] + negative_edges.shape[0],
+            dtype=np.float32
+        )
+        labels[:positive_edges.shape[0]] = 1
+        return np.vstack([positive_edges, negative_edges]), labels
+
+    def to_sequence(
+        self,
+        positive_graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        negative_graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        batch_size: int = 2**10,
+        aligned_node_mapping: bool = False,
+        seed: int = 42
+    ) -> EdgeEmbeddingSequence:
+        """Return Keras Sequence of the shuffled edge embeddings and labels.
+
+        Differently from the transform method, the edge embedding is not
+        computed in advance: only the rows of the nodes of the edges are
+        kept, and the edge embedding of every batch is computed on demand,
+        so the sequence can be used to train a model on edge sets whose
+        features do not fit in memory.
+
+        Parameters
+        --------------------------
+        positive_graph: Union[EnsmallenGraph, List[List[str]], List[List[int]]],
+            The graph whose edges are to be embedded and labeled as positives.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        negative_graph: Union[EnsmallenGraph, List[List[str]], List[List[int]]],
+            The graph whose edges are to be embedded and labeled as negatives.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        batch_size: int = 2**10,
+            Number of edges to include in a single batch.
+        aligned_node_mapping: bool = False,
+            This parameter specifies wheter the mapping of the embeddings nodes
+            matches the internal node mapping of the given graph.
+            If these two mappings do not match, the generated edge embedding
+            will be meaningless.
+        seed: int = 42,
+            The seed to use to shuffle the edges at every epoch.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+
+        Returns
+        --------------------------
+        The Keras Sequence of the edge embeddings and labels.
+        """
+        edges, labels = self._get_edges_and_labels(
+            positive_graph,
+            negative_graph,
+            aligned_node_mapping
+        )
+        return EdgeEmbeddingSequence(
+            self._transformer._transformer,  # pylint: disable=protected-access
+            edges,
+            labels,
+            batch_size=batch_size,
+            seed=seed
+        )
+
+    def transform_to_shards(
+        self,
+        positive_graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        negative_graph: Union[EnsmallenGraph, np.ndarray, List[List[str]], List[List[int]]],
+        directory: str,
+        shard_size: int = 2**16,
+        aligned_node_mapping: bool = False,
+        random_state: int = 42
+    ) -> List[str]:
+        """Save the shuffled edge embeddings and labels as shards.
+
+        The edges are shuffled once, and the edge embedding of every shard
+        is computed directly in its memory-mapped file, so the shards can
+        be larger than the memory. The shards can be read back with the
+        EdgeEmbeddingShardSequence, to train repeatedly on the same edges
+        without computing their embedding again. The manifest listing the
+        shards is written last, so the shards of an interrupted call are
+        never read.
+
+        Parameters
+        --------------------------
+        positive_graph: Union[EnsmallenGraph, List[List[str]], List[List[int]]],
+            The graph whose edges are to be embedded and labeled as positives.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        negative_graph: Union[EnsmallenGraph, List[List[str]], List[List[int]]],
+            The graph whose edges are to be embedded and labeled as negatives.
+            It can either be an EnsmallenGraph or a list of lists of edges.
+        directory: str,
+            The directory where to save the shards.
+            It is created if missing, and it must be empty.
+        shard_size: int = 2**16,
+            Number of edges to include in every shard.
+        aligned_node_mapping: bool = False,
+            This parameter specifies wheter the mapping of the embeddings nodes
+            matches the internal node mapping of the given graph.
+            If these two mappings do not match, the generated edge embedding
+            will be meaningless.
+        random_state: int = 42,
+            The random state to use to shuffle the edges.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+        ValueError,
+            If the given directory is not empty.
+
+        Returns
+        --------------------------
+        The list of the paths of the shards.
+        """
+        os.makedirs(directory, exist_ok=True)
+        if os.listdir(directory):
+            raise ValueError((
+                "The given directory {} is not empty, and the shards "
+                "already in it would be mixed with the new ones."
+            ).format(directory))
+        edges, labels = self._get_edges_and_labels(
+            positive_graph,
+            negative_graph,
+            aligned_node_mapping
+        )
+        edge_transformer = self._transformer._transformer  # pylint: disable=protected-access
+        numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
+            seed=random_state
+        )
+        indices = numpy_random_state.permutation(labels.size)
+        names = []
+        for start in range(0, labels.size, shard_size):
+            shard = indices[start:start + shard_size]
+            names.append("shard_{:06d}".format(len(names)))
+            path = os.path.join(directory, names[-1])
+            os.makedirs(path)
+            features = np.lib.format.open_memmap(
+                os.path.join(path, "features.npy"),
+                mode="w+",
+                dtype=np.float32,
+                shape=(shard.size, edge_transformer.embedding_size)
+            )
+            edge_transformer._transform_into(  # pylint: disable=protected-access
+                edges[shard, 0],
+                edges[shard, 1],
+                features
+            )
+            features.flush()
+            del features
+            np.save(os.path.join(path, "labels.npy"), labels[shard])
+        manifest = os.path.join(directory, EdgeEmbeddingShardSequence.MANIFEST)
+        temporary_path = "{}.{}.{}.tmp".format(manifest, os.getpid(), get_ident())
+        with open(temporary_path, "w") as f:
+            json.dump({"shards": names}, f)
+        os.replace(temporary_path, manifest)
+        return [os.path.join(directory, name) for name in names]
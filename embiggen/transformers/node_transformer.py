@@ -1,36 +1,173 @@
 """NodeTransformer class to convert nodes to edge embeddings."""
+import hashlib
 from typing import List, Union
 import numpy as np
 import pandas as pd
 
+from ..embedders.embedder import Embedder
+from ..embedders.multilevel_embedder import MultilevelEmbedder
+
 
 class NodeTransformer:
     """NodeTransformer class to convert nodes to edge embeddings."""
 
     def __init__(self):
         """Create new NodeTransformer object."""
-        self._embedding = None
         self._embedding_numpy = None
+        self._node_index = None
+        self._fingerprint = None
 
-    def fit(self, embedding: pd.DataFrame):
+    def fit(
+        self,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
+        node_names: List[str] = None
+    ):
         """Fit the model.
 
         Parameters
         -------------------------
-        embedding: pd.DataFrame,
+        embedding: Union[pd.DataFrame, np.ndarray, Embedder, MultilevelEmbedder],
             Embedding to use to fit the transformer.
-            This is a pandas DataFrame and NOT a numpy array because we need
-            to be able to remap correctly the vector embeddings in case of
-            graphs that do not respect the same internal node mapping but have
-            the same node set. It is possible to remap such graphs using
-            Ensmallen's remap method but it may be less intuitive to users.
+            It can either be a pandas DataFrame indexed by the node names,
+            a numpy array or memory map, or a trained embedding model.
+            The names of the nodes are needed to be able to remap correctly
+            the vector embeddings in case of graphs that do not respect the
+            same internal node mapping but have the same node set.
+            It is possible to remap such graphs using Ensmallen's remap
+            method but it may be less intuitive to users.
+            Float32 contiguous arrays, such as the embedding of the models,
+            are used without being copied, through a read-only view: they
+            must not be modified in place after the fit, as the fingerprint
+            of the embedding is not computed again until the next fit.
+        node_names: List[str] = None,
+            The names of the nodes of the rows of the embedding.
+            It is ignored when the embedding is a DataFrame.
+            If not given, only the aligned node mapping can be used.
+
+        Raises
+        -------------------------
+        ValueError,
+            If the given embedding is not a supported type.
+        ValueError,
+            If the number of node names does not match the embedding.
+        ValueError,
+            If the given embedding has duplicated node names.
         """
-        if not isinstance(embedding, pd.DataFrame):
-            raise ValueError("Given embedding is not a pandas DataFrame.")
-        self._embedding = embedding
-        self._embedding_numpy = embedding.to_numpy()
+        if isinstance(embedding, pd.DataFrame):
+            node_names = embedding.index
+            embedding = embedding.to_numpy(dtype=np.float32)
+        elif isinstance(embedding, (Embedder, MultilevelEmbedder)):
+            embedding = embedding.embedding
+        elif not isinstance(embedding, np.ndarray):
+            raise ValueError((
+                "Given embedding of type {} is not a pandas DataFrame, "
+                "a numpy array or an embedding model."
+            ).format(type(embedding)))
+        if node_names is not None:
+            if len(node_names) != embedding.shape[0]:
+                raise ValueError((
+                    "The number of given node names ({}) does not match "
+                    "the number of rows of the embedding ({})."
+                ).format(len(node_names), embedding.shape[0]))
+            # The hash table of the index is built once, and the lookups of
+            # the node names become vectorized gathers of the row IDs.
+            node_names = pd.Index(node_names)
+            if not node_names.is_unique:
+                raise ValueError("Given embedding has duplicated node names.")
+        self._node_index = node_names
+        self._fingerprint = None
+        self._embedding_numpy = np.ascontiguousarray(
+            embedding,
+            dtype=np.float32
+        ).view()
+        self._embedding_numpy.setflags(write=False)
 
-    def transform(self, nodes: Union[List[str], List[int]], aligned_node_mapping: bool = False) -> np.ndarray:
+    def get_node_ids(self, nodes: List[str]) -> np.ndarray:
+        """Return the rows of the embedding of the given node names.
+
+        The returned rows can be reused across multiple calls to the
+        transform method, using the aligned node mapping.
+
+        Parameters
+        --------------------------
+        nodes: List[str],
+            List of nodes whose rows are to be returned.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+        ValueError,
+            If the embedding was fitted without the node names.
+        ValueError,
+            If some of the given nodes are not in the embedding.
+
+        Returns
+        --------------------------
+        Numpy array of the rows of the nodes.
+        """
+        if self._embedding_numpy is None:
+            raise ValueError(
+                "Transformer was not fitted yet."
+            )
+        if self._node_index is None:
+            raise ValueError((
+                "The transformer was fitted without the node names, "
+                "so only the aligned node mapping can be used."
+            ))
+        node_ids = self._node_index.get_indexer(nodes)
+        missing = node_ids < 0
+        if missing.any():
+            raise ValueError((
+                "The {} given nodes including {} are not in the embedding."
+            ).format(
+                missing.sum(),
+                ", ".join(str(node) for node in np.asarray(nodes)[missing][:5])
+            ))
+        return node_ids
+
+    @property
+    def embedding_size(self) -> int:
+        """Return the dimension of the embedding.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+        """
+        if self._embedding_numpy is None:
+            raise ValueError(
+                "Transformer was not fitted yet."
+            )
+        return self._embedding_numpy.shape[1]
+
+    @property
+    def fingerprint(self) -> str:
+        """Return hash identifying the fitted embedding.
+
+        The hash is computed once after every fit.
+
+        Raises
+        --------------------------
+        ValueError,
+            If embedding is not fitted.
+        """
+        if self._embedding_numpy is None:
+            raise ValueError(
+                "Transformer was not fitted yet."
+            )
+        if self._fingerprint is None:
+            fingerprint = hashlib.sha256(str(self._embedding_numpy.shape).encode("utf-8"))
+            fingerprint.update(self._embedding_numpy)
+            self._fingerprint = fingerprint.hexdigest()
+        return self._fingerprint
+
+    def transform(
+        self,
+        nodes: Union[List[str], List[int]],
+        aligned_node_mapping: bool = False,
+        out: np.ndarray = None
+    ) -> np.ndarray:
         """Return embeddings from given node.
 
         Parameters
@@ -39,12 +176,15 @@ class NodeTransformer:
             List of nodes whose embedding is to be returned.
             By default this should be a list of strings, if the
             aligned_node_mapping is setted, then this methods also accepts
-            a list of ints.
+            a list of ints, such as the rows returned by `get_node_ids`.
         aligned_node_mapping: bool = False,
             This parameter specifies wheter the mapping of the embeddings nodes
             matches the internal node mapping of the given graph.
             If these two mappings do not match, the generated edge embedding
             will be meaningless.
+        out: np.ndarray = None,
+            Float32 array where to write the embeddings.
+            If not given, a new array is allocated.
 
         Raises
         --------------------------
@@ -53,14 +193,14 @@ class NodeTransformer:
 
         Returns
         --------------------------
-        Numpy array of embeddings.
+        Numpy array of float32 embeddings.
         """
-        if self._embedding is None:
+        if self._embedding_numpy is None:
             raise ValueError(
                 "Transformer was not fitted yet."
             )
 
-        if aligned_node_mapping:
-            return self._embedding_numpy[nodes]
+        if not aligned_node_mapping:
+            nodes = self.get_node_ids(nodes)
 
-        return self._embedding.loc[nodes].to_numpy()
+        return self._embedding_numpy.take(nodes, axis=0, out=out)
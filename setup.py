@@ -48,6 +48,7 @@ setup(
     install_requires=[
         'numpy',
         'pandas',
+        'scipy',
         "nltk",
         'tensorflow>=2.0.1',
         "keras_mixed_sequence>=1.0.20",
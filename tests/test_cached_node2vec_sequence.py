@@ -0,0 +1,87 @@
+"""Unit test for testing that CachedNode2VecSequence works as expected."""
+import os
+from tempfile import TemporaryDirectory
+import numpy as np
+from embiggen import CachedNode2VecSequence, WalkCache, CBOW, GloVe
+from .test_node_sequences import TestNodeSequences
+
+
+class TestCachedNode2VecSequence(TestNodeSequences):
+    """Unit test for testing that CachedNode2VecSequence works as expected."""
+
+    def setUp(self):
+        """Setup objects to test the cached Node2Vec sequence."""
+        super().setUp()
+        self._window_size = 2
+        self._directory = TemporaryDirectory()
+        self._cache = WalkCache(
+            self._directory.name,
+            walk_length=20,
+            iterations=2,
+            return_weight=2.0,
+            verbose=False
+        )
+        self._sequence = CachedNode2VecSequence(
+            self._graph,
+            self._cache,
+            batch_size=32,
+            window_size=self._window_size
+        )
+
+    def tearDown(self):
+        """Remove the cached walks."""
+        self._directory.cleanup()
+
+    def test_output_shape(self):
+        """Test that object produced by sequence has correct shape."""
+        (context_vector, words_vector), _ = self._sequence[0]
+        self.assertEqual(context_vector.shape[1], self._window_size*2)
+        self.assertEqual(context_vector.shape[0], words_vector.shape[0])
+        self.assertTrue(self.check_nodes_range(words_vector))
+
+    def test_shared_walks(self):
+        """Test that the walks are generated only once for the same graph."""
+        walks = self._cache.get_walks(self._graph)
+        self.assertEqual(
+            walks.shape,
+            (self._graph.get_unique_sources_number()*2, 20)
+        )
+        self.assertEqual(len(os.listdir(self._directory.name)), 1)
+
+    def test_chunk_size(self):
+        """Test that walks generated in chunks of different size are not shared."""
+        cache = WalkCache(
+            self._directory.name,
+            walk_length=20,
+            iterations=2,
+            return_weight=2.0,
+            chunk_size=100,
+            verbose=False
+        )
+        cache.get_walks(self._graph)
+        self.assertEqual(len(os.listdir(self._directory.name)), 2)
+
+    def test_fit(self):
+        """Test that models can be trained on the cached walks."""
+        model = CBOW(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=10,
+            window_size=self._window_size
+        )
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertFalse(np.isnan(model.embedding).any())
+        words, contexts, frequencies = self._cache.cooccurence_matrix(
+            self._graph,
+            window_size=self._window_size
+        )
+        model = GloVe(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=10
+        )
+        model.fit((words, contexts), frequencies, epochs=1, verbose=False)
+        self.assertEqual(len(os.listdir(self._directory.name)), 1)
@@ -0,0 +1,69 @@
+"""Unit test for testing that CachedWord2VecSequence works as expected."""
+import os
+from tempfile import TemporaryDirectory
+import numpy as np
+from embiggen import CachedWord2VecSequence, SkipGram
+from .test_word_sequences import TestWordSequences
+
+
+class TestCachedWord2VecSequence(TestWordSequences):
+    """Unit test for testing that CachedWord2VecSequence works as expected."""
+
+    def setUp(self):
+        """Setup the sequence of the cached windows."""
+        super().setUp()
+        self._directory = TemporaryDirectory()
+        self._sequence = CachedWord2VecSequence(
+            self._tokens,
+            batch_size=self._batch_size,
+            window_size=self._window_size,
+            directory=self._directory.name
+        )
+
+    def tearDown(self):
+        """Remove the cached windows."""
+        self._directory.cleanup()
+
+    def test_windows(self):
+        """Test that the cached windows are all the windows of the sequences."""
+        expected_windows = sorted(
+            tuple(tokens[i - self._window_size:i + self._window_size + 1])
+            for tokens in self._tokens
+            for i in range(self._window_size, len(tokens) - self._window_size)
+        )
+        windows = []
+        for idx in range(self._sequence.steps_per_epoch):
+            (contexts, words), _ = self._sequence[idx]
+            self.assertEqual(contexts.shape, (words.size, self._window_size*2))
+            windows.extend(
+                tuple(np.insert(context, self._window_size, word))
+                for context, word in zip(contexts, words)
+            )
+        self.assertEqual(sorted(windows), expected_windows)
+        self.assertEqual(len(os.listdir(self._directory.name)), 1)
+
+    def test_subsampling(self):
+        """Test that the subsampling drops part of the windows."""
+        sequence = CachedWord2VecSequence(
+            self._tokens,
+            batch_size=self._batch_size,
+            window_size=self._window_size,
+            subsampling_threshold=1e-3
+        )
+        (_, words), _ = sequence[0]
+        self.assertTrue(words.size < self._batch_size)
+
+    def test_fit(self):
+        """Test that models can be trained on the cached windows."""
+        model = SkipGram(
+            self._transformer.vocabulary_size,
+            embedding_size=10,
+            window_size=self._window_size
+        )
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertFalse(np.isnan(model.embedding).any())
@@ -0,0 +1,69 @@
+"""Unit test for testing that the EdgeEmbedding layer works as expected."""
+import numpy as np
+import pytest
+from tensorflow.keras.layers import Dense, Input   # pylint: disable=import-error
+from tensorflow.keras.models import Model   # pylint: disable=import-error
+from embiggen import EdgeTransformer, LinkPredictionSequence
+from embiggen.embedders.layers import EdgeEmbedding
+from .test_node_sequences import TestNodeSequences
+
+
+class TestEdgeEmbedding(TestNodeSequences):
+    """Unit test for testing that the EdgeEmbedding layer works as expected."""
+
+    def setUp(self):
+        """Setup the embedding and the sequence of node IDs."""
+        super().setUp()
+        self._embedding = np.random.random_sample(
+            (self._graph.get_nodes_number(), 10)
+        ).astype(np.float32)
+        self._sequence = LinkPredictionSequence(
+            self._graph,
+            batch_size=128,
+            batches_per_epoch=4,
+            avoid_false_negatives=True,
+            return_node_ids=True
+        )
+
+    def test_methods(self):
+        """Test that the layer matches the EdgeTransformer methods."""
+        sources = np.arange(20)
+        destinations = np.arange(20, 40)
+        for method, function in EdgeTransformer.methods.items():
+            edges = EdgeEmbedding(self._embedding, method=method)((sources, destinations))
+            expected_edges = function(
+                self._embedding[sources],
+                self._embedding[destinations]
+            )
+            self.assertTrue(np.allclose(edges.numpy(), expected_edges, atol=1e-6))
+        with pytest.raises(ValueError):
+            EdgeEmbedding(self._embedding, method="not supported")
+
+    def test_node_ids_batch(self):
+        """Test that the sequence returns the node IDs and the labels."""
+        (sources, destinations), labels = self._sequence[0]
+        self.assertEqual(sources.shape, (128,))
+        self.assertEqual(destinations.shape, (128,))
+        self.assertEqual(labels.sum(), 64)
+        self.assertTrue(self.check_nodes_range(sources))
+        self.assertTrue(self.check_nodes_range(destinations))
+        with pytest.raises(ValueError):
+            LinkPredictionSequence(self._graph)
+
+    def test_fit(self):
+        """Test that the embedding can be fine-tuned end to end."""
+        sources = Input((1,))
+        destinations = Input((1,))
+        layer = EdgeEmbedding(self._embedding, trainable=True)
+        model = Model(
+            inputs=(sources, destinations),
+            outputs=Dense(1, activation="sigmoid")(layer((sources, destinations)))
+        )
+        model.compile(loss="binary_crossentropy", optimizer="nadam")
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertFalse(np.allclose(layer.get_weights()[0], self._embedding))
@@ -0,0 +1,64 @@
+"""Unit test class for the sequences of edge embeddings of LinkPredictionTransformer."""
+import numpy as np
+from tensorflow.keras.layers import Dense  # pylint: disable=import-error
+from tensorflow.keras.models import Sequential  # pylint: disable=import-error
+from embiggen import LinkPredictionTransformer, GloVe
+from .test_node_sequences import TestNodeSequences
+
+
+class TestEdgeEmbeddingSequence(TestNodeSequences):
+    """Unit test class for the sequences of edge embeddings of LinkPredictionTransformer."""
+
+    def setUp(self):
+        """Setup the sequence of the edge embeddings of the graph."""
+        super().setUp()
+        self._batch_size = 128
+        self._transformer = LinkPredictionTransformer()
+        self._transformer.fit(GloVe(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=50
+        ).get_embedding_dataframe(self._graph.get_node_names()))
+        self._negative_edges = np.random.RandomState(  # pylint: disable=no-member
+            seed=42
+        ).randint(self._graph.get_nodes_number(), size=(1000, 2))
+        self._sequence = self._transformer.to_sequence(
+            self._graph,
+            self._negative_edges,
+            batch_size=self._batch_size,
+            aligned_node_mapping=True
+        )
+
+    def test_batches(self):
+        """Test that the batches contain all the edges with their labels."""
+        positives = self._graph.get_undirected_edges_number()
+        self.assertEqual(self._sequence.sample_number, positives + 1000)
+        features, labels = zip(*[
+            self._sequence[idx]
+            for idx in range(self._sequence.steps_per_epoch)
+        ])
+        features = np.vstack(features)
+        labels = np.concatenate(labels)
+        self.assertEqual(features.shape, (positives + 1000, 50))
+        self.assertEqual(labels.sum(), positives)
+        expected, _ = self._transformer.transform(
+            self._graph,
+            self._negative_edges,
+            aligned_node_mapping=True
+        )
+        self.assertTrue(np.allclose(
+            np.sort(features, axis=0),
+            np.sort(expected, axis=0)
+        ))
+
+    def test_fit(self):
+        """Test that the sequence can be used to train a Keras model."""
+        model = Sequential([
+            Dense(1, activation="sigmoid")
+        ])
+        model.compile(loss="binary_crossentropy")
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
@@ -0,0 +1,73 @@
+"""Unit test class for the shards of edge embeddings of LinkPredictionTransformer."""
+import os
+import pickle
+from tempfile import TemporaryDirectory
+import numpy as np
+import pytest
+from embiggen import EdgeEmbeddingShardSequence
+from .test_edge_embedding_sequence import TestEdgeEmbeddingSequence
+
+
+class TestEdgeEmbeddingShardSequence(TestEdgeEmbeddingSequence):
+    """Unit test class for the shards of edge embeddings of LinkPredictionTransformer."""
+
+    def setUp(self):
+        """Setup the sequence reading the shards of the edge embeddings."""
+        super().setUp()
+        self._directory = TemporaryDirectory()
+        paths = self._transformer.transform_to_shards(
+            self._graph,
+            self._negative_edges,
+            self._directory.name,
+            shard_size=1000,
+            aligned_node_mapping=True
+        )
+        self.assertEqual(
+            len(paths),
+            int(np.ceil((self._graph.get_undirected_edges_number() + 1000)/1000))
+        )
+        self._sequence = EdgeEmbeddingShardSequence(
+            self._directory.name,
+            batch_size=self._batch_size
+        )
+
+    def tearDown(self):
+        """Remove the shards."""
+        self._directory.cleanup()
+
+    def test_batches(self):
+        """Test that the sequence and the dataset read all the edges."""
+        positives = self._graph.get_undirected_edges_number()
+        for batches in (
+            [self._sequence[idx] for idx in range(self._sequence.steps_per_epoch)],
+            list(self._sequence.to_tf_dataset(epochs=1).as_numpy_iterator())
+        ):
+            self.assertEqual(len(batches), self._sequence.steps_per_epoch)
+            features, labels = zip(*batches)
+            self.assertEqual(np.vstack(features).shape, (positives + 1000, 50))
+            self.assertEqual(np.concatenate(labels).sum(), positives)
+
+    def test_directory(self):
+        """Test that the shards are neither mixed nor read without manifest."""
+        with pytest.raises(ValueError):
+            self._transformer.transform_to_shards(
+                self._graph,
+                self._negative_edges,
+                self._directory.name,
+                aligned_node_mapping=True
+            )
+        os.remove(os.path.join(
+            self._directory.name,
+            EdgeEmbeddingShardSequence.MANIFEST
+        ))
+        with pytest.raises(ValueError):
+            EdgeEmbeddingShardSequence(self._directory.name)
+
+    def test_pickle(self):
+        """Test that the memory maps are opened once and not pickled."""
+        first = self._sequence[0]
+        self.assertTrue(self._sequence._memmaps)  # pylint: disable=protected-access
+        sequence = pickle.loads(pickle.dumps(self._sequence))
+        self.assertFalse(sequence._memmaps)  # pylint: disable=protected-access
+        for expected, batch in zip(first, sequence[0]):
+            self.assertTrue(np.array_equal(expected, batch))
@@ -0,0 +1,69 @@
+"""Unit test class for EdgeFeatureCache objects."""
+import os
+from tempfile import TemporaryDirectory
+import numpy as np
+import pytest
+from embiggen import EdgeFeatureCache, GraphTransformer, GloVe
+from .test_node_sequences import TestNodeSequences
+
+
+class TestEdgeFeatureCache(TestNodeSequences):
+    """Unit test class for EdgeFeatureCache objects."""
+
+    def setUp(self):
+        """Setup the embedding of the graph."""
+        super().setUp()
+        self._embedding = GloVe(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=50
+        ).get_embedding_dataframe(self._graph.get_node_names())
+
+    def test_cached_graph_transformer(self):
+        """Test that the edge embeddings are stored and served from the cache."""
+        expected = GraphTransformer()
+        expected.fit(self._embedding)
+        with TemporaryDirectory() as directory:
+            transformer = GraphTransformer(cache=EdgeFeatureCache(directory))
+            transformer.fit(self._embedding)
+            first = transformer.transform(self._graph)
+            self.assertTrue(np.allclose(first, expected.transform(self._graph)))
+            self.assertEqual(len(os.listdir(directory)), 1)
+            second = transformer.transform(self._graph)
+            self.assertIsInstance(second, np.memmap)
+            self.assertTrue(np.allclose(first, second))
+            self.assertEqual(len(os.listdir(directory)), 1)
+            transformer.fit(self._embedding*2)
+            self.assertTrue(np.allclose(
+                transformer.transform(self._graph),
+                first*4
+            ))
+            self.assertEqual(len(os.listdir(directory)), 2)
+            del first, second
+
+    def test_eviction(self):
+        """Test that the least recently used edge embeddings are removed."""
+        with TemporaryDirectory() as directory:
+            cache = EdgeFeatureCache(directory, max_bytes=1)
+            for key in ("first", "second"):
+                features = cache.get_or_create(
+                    key,
+                    (10, 5),
+                    lambda out: out.fill(1)
+                )
+                self.assertTrue((features == 1).all())
+                del features
+            self.assertEqual(os.listdir(directory), ["second.npy"])
+            cache.clear()
+            self.assertEqual(os.listdir(directory), [])
+        with pytest.raises(ValueError):
+            EdgeFeatureCache(directory, max_bytes=0)
+
+    def test_failed_compute(self):
+        """Test that the temporary file is removed when the computation fails."""
+        def compute(_out: np.ndarray):
+            raise RuntimeError("The computation failed.")
+        with TemporaryDirectory() as directory:
+            cache = EdgeFeatureCache(directory)
+            with pytest.raises(RuntimeError):
+                cache.get_or_create("failed", (10, 5), compute)
+            self.assertEqual(os.listdir(directory), [])
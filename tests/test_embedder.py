@@ -9,6 +9,8 @@ def test_illegal_arguments():
         Embedder(0, 5)
     with pytest.raises(ValueError):
         Embedder(5, 0)
+    with pytest.raises(ValueError):
+        Embedder(5, 5, precision="float8")
 
 
 def test_not_implemented_methods():
@@ -1,7 +1,10 @@
 """Unit test class for GraphTransformer objects."""
+import os
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+import numpy as np
 from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
-from embiggen import GraphTransformer, GloVe
+from embiggen import EdgeTransformer, GraphTransformer, GloVe
 
 
 class TestGraphTransformer(TestCase):
@@ -32,3 +35,60 @@ class TestGraphTransformer(TestCase):
             embedded_nodes.shape,
             (self._graph.get_undirected_edges_number(), self._embedding_size)
         )
+
+    def test_unaligned_graph_transformer(self):
+        """Test that the unaligned embedding is remapped to the graph node IDs."""
+        self._transfomer = GraphTransformer()
+        self._transfomer.fit(self._embedding.iloc[::-1])
+        unaligned = self._transfomer.transform(self._graph)
+        self.assertIs(
+            self._transfomer._alignment[0],  # pylint: disable=protected-access
+            self._graph
+        )
+        self._transfomer.fit(self._embedding)
+        aligned = self._transfomer.transform(self._graph, aligned_node_mapping=True)
+        self.assertTrue(np.allclose(unaligned, aligned))
+
+    def test_chunked_graph_transformer(self):
+        """Test that the chunked transforms match the dense one."""
+        for method in ("Hadamard", "Concatenate"):
+            self._transfomer = GraphTransformer(method=method)
+            self._transfomer.fit(self._embedding)
+            expected = self._transfomer.transform(self._graph)
+            chunks = np.vstack([
+                chunk.copy()
+                for chunk in self._transfomer.transform_iter(self._graph, chunk_size=100)
+            ])
+            self.assertTrue(np.allclose(chunks, expected))
+            with TemporaryDirectory() as directory:
+                path = os.path.join(directory, "edges.npy")
+                self._transfomer.transform_to(path, self._graph, chunk_size=100)
+                self.assertTrue(np.allclose(np.load(path), expected))
+
+    def test_fused_graph_transformer(self):
+        """Test that the fused methods match the single method transforms."""
+        self._transfomer = GraphTransformer()
+        self._transfomer.fit(self._embedding)
+        embeddings = self._transfomer.transform_methods(self._graph)
+        self.assertEqual(set(embeddings), set(EdgeTransformer.methods))
+        for method, embedding in embeddings.items():
+            transformer = GraphTransformer(method=method)
+            transformer.fit(self._embedding)
+            self.assertTrue(np.allclose(
+                embedding,
+                transformer.transform(self._graph)
+            ))
+
+    def test_parallel_graph_transformer(self):
+        """Test that the multi-threaded transforms match the serial ones."""
+        self._transfomer = GraphTransformer(method="L2")
+        self._transfomer.fit(self._embedding)
+        transformer = GraphTransformer(method="L2", n_jobs=4)
+        transformer.fit(self._embedding)
+        self.assertTrue(np.allclose(
+            transformer.transform(self._graph),
+            self._transfomer.transform(self._graph)
+        ))
+        expected = self._transfomer.transform_methods(self._graph)
+        for method, embedding in transformer.transform_methods(self._graph).items():
+            self.assertTrue(np.allclose(embedding, expected[method]))
@@ -0,0 +1,46 @@
+"""Test to validate that the MultilevelEmbedder works properly on graphs."""
+import os
+import numpy as np
+import pytest
+from embiggen import MultilevelEmbedder, CBOW
+from .test_node_sequences import TestNodeSequences
+
+
+class TestMultilevelEmbedder(TestNodeSequences):
+    """Unit test to validate that the MultilevelEmbedder works properly on graphs."""
+
+    def setUp(self):
+        """Setting up objects to test the MultilevelEmbedder."""
+        super().setUp()
+        self._embedding_size = 20
+        self._model = MultilevelEmbedder(
+            model=CBOW,
+            embedding_size=self._embedding_size,
+            walk_length=20,
+            batch_size=32,
+            max_levels=3,
+            min_nodes_number=10,
+            model_kwargs=dict(window_size=2),
+            sequence_kwargs=dict(window_size=2),
+            verbose=False
+        )
+
+    def test_fit(self):
+        """Test that the embedding of the finest graph has the correct shape."""
+        with pytest.raises(ValueError):
+            self._model.embedding
+        history = self._model.fit(self._graph, epochs=2)
+        self.assertIn("level", history.columns)
+        self.assertEqual(
+            self._model.embedding.shape,
+            (self._graph.get_nodes_number(), self._embedding_size)
+        )
+        self.assertFalse(np.isnan(self._model.embedding).any())
+        self._model.save_embedding(
+            self._embedding_path, self._graph.get_node_names())
+        os.remove(self._embedding_path)
+
+    def test_illegal_arguments(self):
+        """Test that illegal arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            MultilevelEmbedder(max_levels=-1)
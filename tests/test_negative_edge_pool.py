@@ -0,0 +1,68 @@
+"""Unit test for testing that NegativeEdgePool works as expected."""
+import numpy as np
+import pytest
+from embiggen import LinkPredictionSequence, NegativeEdgePool
+from embiggen.sequences.csr_graph import CSRGraph
+from .test_node_sequences import TestNodeSequences
+
+
+class TestNegativeEdgePool(TestNodeSequences):
+    """Unit test for testing that NegativeEdgePool works as expected."""
+
+    def setUp(self):
+        """Setup the sequence drawing from the pool."""
+        super().setUp()
+        self._pool = NegativeEdgePool(pool_size=512, refresh_rate=2)
+        self._sequence = LinkPredictionSequence(
+            self._graph,
+            batch_size=128,
+            batches_per_epoch=8,
+            avoid_false_negatives=True,
+            return_node_ids=True,
+            negative_pool=self._pool
+        )
+
+    def tearDown(self):
+        """Stop the thread of the pool."""
+        self._pool.close()
+
+    def test_negatives(self):
+        """Test that the negatives are deterministic and not edges of the graph."""
+        csr_graph = CSRGraph.from_ensmallen(self._graph)
+        for idx in reversed(range(self._sequence.steps_per_epoch)):
+            (sources, destinations), labels = self._sequence[idx]
+            negatives = labels == 0
+            self.assertFalse(csr_graph.has_edges(
+                sources[negatives],
+                destinations[negatives]
+            ).any())
+            (expected_sources, expected_destinations), _ = self._sequence[idx]
+            self.assertTrue(np.array_equal(sources, expected_sources))
+            self.assertTrue(np.array_equal(destinations, expected_destinations))
+
+    def test_illegal_arguments(self):
+        """Test that illegal arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            NegativeEdgePool(refresh_rate=0)
+        with pytest.raises(ValueError):
+            NegativeEdgePool().get_negative_edges(10, 0, 0)
+        with pytest.raises(ValueError):
+            LinkPredictionSequence(
+                self._graph,
+                embedding=np.zeros((self._graph.get_nodes_number(), 10)),
+                negative_pool=NegativeEdgePool()
+            )
+
+    def test_complete_graph(self):
+        """Test that sampling the negatives of a complete graph raises."""
+        nodes = np.arange(4)
+        graph = CSRGraph.from_edges(
+            np.array(np.meshgrid(nodes, nodes)).reshape(2, -1).T,
+            nodes.size
+        )
+        with pytest.raises(ValueError):
+            graph.sample_negative_edges(
+                10,
+                np.random.RandomState(seed=42),  # pylint: disable=no-member
+                graphs_to_avoid=[graph]
+            )
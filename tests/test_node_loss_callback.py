@@ -0,0 +1,48 @@
+"""Unit test for testing that NodeLossCallback works as expected."""
+import numpy as np
+import pytest
+from embiggen import Node2VecSequence, NodeLossCallback, NodeScheduler, SkipGram
+from .test_node_sequences import TestNodeSequences
+
+
+class TestNodeLossCallback(TestNodeSequences):
+    """Unit test for testing that NodeLossCallback works as expected."""
+
+    def setUp(self):
+        """Setup objects to test the losses fed to the scheduler."""
+        super().setUp()
+        self._scheduler = NodeScheduler(oversampling=0.5, importance="loss")
+        self._sequence = Node2VecSequence(
+            self._graph,
+            walk_length=20,
+            batch_size=32,
+            window_size=2,
+            scheduler=self._scheduler
+        )
+
+    def test_fit(self):
+        """Test that the losses of the nodes are updated while fitting."""
+        model = SkipGram(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=10,
+            window_size=2
+        )
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False,
+            callbacks=[NodeLossCallback(self._sequence, nodes_number=64)]
+        )
+        losses = self._scheduler.losses
+        self.assertTrue((losses != 1).any())
+        self.assertTrue(np.isfinite(losses).all())
+
+    def test_illegal_arguments(self):
+        """Test that a sequence without scheduler raises ValueError."""
+        with pytest.raises(ValueError):
+            NodeLossCallback(Node2VecSequence(
+                self._graph,
+                walk_length=20,
+                batch_size=32
+            ))
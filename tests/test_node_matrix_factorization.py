@@ -0,0 +1,50 @@
+"""Test to validate that the model MatrixFactorization works properly with graph walks."""
+import os
+import numpy as np
+import pytest
+from embiggen import MatrixFactorization
+from .test_node_sequences import TestNodeSequences
+
+
+class TestNodeMatrixFactorization(TestNodeSequences):
+    """Unit test for model MatrixFactorization on graph walks."""
+
+    def setUp(self):
+        """Setting up objects to test MatrixFactorization model on graph walks."""
+        super().setUp()
+        self._embedding_size = 50
+        self._words, self._ctxs, self._freq = self._graph.cooccurence_matrix(
+            80,
+            window_size=4,
+            iterations=20
+        )
+        self._model = MatrixFactorization(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=self._embedding_size
+        )
+        self.assertEqual("MatrixFactorization", self._model.name)
+        self._model.summary()
+
+    def test_fit(self):
+        """Test that model fitting behaves correctly and produced embedding has correct shape."""
+        history = self._model.fit((self._words, self._ctxs), self._freq)
+        self.assertEqual(len(history), self._embedding_size)
+        self.assertEqual(
+            self._model.embedding.shape,
+            (self._graph.get_nodes_number(), self._embedding_size)
+        )
+        self.assertFalse(np.isnan(self._model.embedding).any())
+
+        self._model.save_weights(self._weights_path)
+        self._model.load_weights(self._weights_path)
+        self._model.save_embedding(
+            self._embedding_path, self._graph.get_node_names())
+        os.remove(self._weights_path)
+        os.remove(self._embedding_path)
+
+    def test_illegal_arguments(self):
+        """Test that illegal arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            MatrixFactorization(10, 10)
+        with pytest.raises(ValueError):
+            MatrixFactorization(10, 5, negative_samples=0)
@@ -0,0 +1,76 @@
+"""Unit test for testing that Node2VecSequence with a NodeScheduler works as expected."""
+import numpy as np
+import pytest
+from embiggen import Node2VecSequence, NodeScheduler
+from embiggen.sequences.csr_graph import CSRGraph
+from .test_node_sequences import TestNodeSequences
+
+
+class TestNodeScheduler(TestNodeSequences):
+    """Unit test for testing that Node2VecSequence with a NodeScheduler works as expected."""
+
+    def setUp(self):
+        """Setup objects to test the scheduled Node2Vec sequence."""
+        super().setUp()
+        self._window_size = 2
+        self._batch_size = 32
+        self._scheduler = NodeScheduler(oversampling=0.5)
+        self._sequence = Node2VecSequence(
+            self._graph,
+            walk_length=20,
+            batch_size=self._batch_size,
+            window_size=self._window_size,
+            return_weight=2.0,
+            explore_weight=0.5,
+            scheduler=self._scheduler
+        )
+
+    def test_full_coverage(self):
+        """Test that every start node is scheduled once per epoch."""
+        start_nodes = np.concatenate([
+            self._scheduler.get_start_nodes(idx, 0)[:self._batch_size]
+            for idx in range(self._scheduler.steps_per_epoch)
+        ])
+        self.assertEqual(start_nodes.size, np.unique(start_nodes).size)
+        self.assertEqual(
+            start_nodes.size,
+            self._graph.get_unique_sources_number()
+        )
+
+    def test_output_shape(self):
+        """Test that object produced by sequence has correct shape."""
+        (context_vector, words_vector), _ = self._sequence[0]
+        self.assertEqual(context_vector.shape[1], self._window_size*2)
+        self.assertEqual(context_vector.shape[0], words_vector.shape[0])
+        self.assertTrue(self.check_nodes_range(words_vector))
+        self.assertTrue(self._scheduler.visits.sum() > 0)
+
+    def test_low_walk_weights(self):
+        """Test that walks whose proposals are always rejected still complete."""
+        graph = CSRGraph.from_edges(np.array([[0, 1], [1, 0]]), 2)
+        walks = graph.walk(np.array([0, 1]), 10, return_weight=1e-12)
+        self.assertTrue((walks[:, ::2] == [[0], [1]]).all())
+        self.assertTrue((walks[:, 1::2] == [[1], [0]]).all())
+
+    def test_illegal_arguments(self):
+        """Test that illegal arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            Node2VecSequence(
+                self._graph,
+                walk_length=20,
+                batch_size=self._batch_size,
+                return_weight=0,
+                scheduler=NodeScheduler()
+            )
+        with pytest.raises(ValueError):
+            NodeScheduler(oversampling=-1)
+        with pytest.raises(ValueError):
+            NodeScheduler(importance="unsupported")
+        with pytest.raises(ValueError):
+            Node2VecSequence(
+                self._graph,
+                walk_length=20,
+                batch_size=self._batch_size,
+                max_neighbours=10,
+                scheduler=NodeScheduler()
+            )
@@ -1,6 +1,9 @@
 """Test to validate that the SkipGram model works properly on Graph walks."""
 import os
+import numpy as np
+import tensorflow as tf
 from embiggen import SkipGram
+from embiggen.embedders.layers import MixedPrecisionEmbedding
 from .test_node2vec_sequence import TestNode2VecSequence
 
 
@@ -32,3 +35,25 @@ class TestNodeSkipGram(TestNode2VecSequence):
         self._model.save_weights(self._weights_path)
         self._model.load_weights(self._weights_path)
         os.remove(self._weights_path)
+
+    def test_fit_mixed_precision(self):
+        model = SkipGram(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=self._embedding_size,
+            precision="mixed_bfloat16"
+        )
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertEqual(model.embedding.dtype, np.float32)
+        self.assertFalse(np.isnan(model.embedding).any())
+        layer = next(
+            layer
+            for layer in model._model.layers  # pylint: disable=protected-access
+            if isinstance(layer, MixedPrecisionEmbedding)
+        )
+        self.assertEqual(layer.embeddings.dtype, tf.float32)
+        self.assertEqual(layer(np.array([[0], [1]])).dtype, tf.bfloat16)
@@ -1,5 +1,6 @@
 """Unit test class to verfy that NodeTransformer object behaves correctly."""
 from unittest import TestCase
+import numpy as np
 import pytest
 from embiggen import NodeTransformer, GloVe
 from ensmallen_graph import EnsmallenGraph  # pylint: disable=no-name-in-module
@@ -20,10 +21,11 @@ class TestNodeTransformer(TestCase):
             weights_column="weight"
         )
         self._node_names = self._graph.get_node_names()
-        self._embedding = GloVe(
+        self._model = GloVe(
             vocabulary_size=self._graph.get_nodes_number(),
             embedding_size=self._embedding_size
-        ).get_embedding_dataframe(self._node_names)
+        )
+        self._embedding = self._model.get_embedding_dataframe(self._node_names)
         self._transfomer = NodeTransformer()
 
     def test_node_transformer(self):
@@ -36,6 +38,59 @@ class TestNodeTransformer(TestCase):
             (sample_number, self._embedding_size)
         )
 
+    def test_node_ids(self):
+        """Test that the rows of the nodes match the embedding."""
+        self._transfomer.fit(self._embedding)
+        nodes = self._node_names[::-7]
+        node_ids = self._transfomer.get_node_ids(nodes)
+        expected = self._embedding.loc[nodes].to_numpy()
+        self.assertTrue(np.allclose(self._transfomer.transform(nodes), expected))
+        self.assertTrue(np.allclose(
+            self._transfomer.transform(node_ids, aligned_node_mapping=True),
+            expected
+        ))
+        with pytest.raises(ValueError):
+            self._transfomer.get_node_ids(["not a node"])
+
+    def test_writable_dataframe(self):
+        """Test that the embedding DataFrame does not share the read-only snapshot."""
+        embedding = self._model.get_embedding_dataframe(self._node_names)
+        embedding.iloc[0, 0] += 1
+        self.assertFalse(np.shares_memory(embedding.to_numpy(), self._model.embedding))
+        self.assertFalse(np.allclose(embedding.to_numpy(), self._model.embedding))
+
+    def test_fit_without_copies(self):
+        """Test fitting from the model and from arrays with the node names."""
+        embedding = self._model.embedding
+        self.assertIs(embedding, self._model.embedding)
+        self.assertFalse(embedding.flags.writeable)
+        expected = self._embedding.loc[self._node_names[:10]].to_numpy()
+        for fitted in (self._model, embedding):
+            self._transfomer.fit(fitted, self._node_names)
+            self.assertTrue(np.shares_memory(
+                self._transfomer._embedding_numpy,  # pylint: disable=protected-access
+                embedding
+            ))
+            self.assertFalse(
+                self._transfomer._embedding_numpy.flags.writeable  # pylint: disable=protected-access
+            )
+            self.assertTrue(np.allclose(
+                self._transfomer.transform(self._node_names[:10]),
+                expected
+            ))
+        self._transfomer.fit(self._model)
+        self.assertTrue(np.allclose(
+            self._transfomer.transform(np.arange(10), aligned_node_mapping=True),
+            expected
+        ))
+        with pytest.raises(ValueError):
+            self._transfomer.transform(self._node_names[:10])
+        with pytest.raises(ValueError):
+            self._transfomer.fit(embedding, self._node_names[:10])
+        self._model.embedding = np.zeros_like(embedding)
+        self.assertIsNot(embedding, self._model.embedding)
+        self.assertFalse(self._model.embedding.any())
+
     def test_illegale_node_transformer(self):
         """Test that proper exception is raised when passing illegal parameters."""
         with pytest.raises(ValueError):
@@ -0,0 +1,89 @@
+"""Unit test for testing that the batches generated in parallel are reproducible."""
+import numpy as np
+import pytest
+from embiggen import Node2VecSequence, NodeScheduler, LinkPredictionSequence, SkipGram, parallel_batches
+from embiggen.sequences.seeds import get_batch_seed, get_epoch_seed
+from .test_node_sequences import TestNodeSequences
+
+
+class TestParallelBatches(TestNodeSequences):
+    """Unit test for testing that the batches generated in parallel are reproducible."""
+
+    def setUp(self):
+        """Setup the sequences whose batches are generated in parallel."""
+        super().setUp()
+        self._sequence = Node2VecSequence(
+            self._graph,
+            walk_length=20,
+            batch_size=32,
+            window_size=2
+        )
+
+    def test_seeds(self):
+        """Test that consecutive batches of consecutive epochs have different seeds."""
+        self.assertNotEqual(get_batch_seed(42, 0, 1), get_batch_seed(42, 1, 0))
+        self.assertEqual(get_batch_seed(42, 3, 5), get_batch_seed(42, 3, 5))
+        self.assertNotEqual(get_epoch_seed(42, 1), get_epoch_seed(43, 0))
+        self.assertNotEqual(get_epoch_seed(42, 1), get_batch_seed(42, 1, 0))
+
+    def test_identical_batches(self):
+        """Test that the parallel batches are identical to the sequential ones."""
+        sequence = LinkPredictionSequence(
+            self._graph,
+            batch_size=64,
+            batches_per_epoch=8,
+            return_node_ids=True
+        )
+        for use_multiprocessing in (False, True):
+            batches = parallel_batches(
+                sequence,
+                epochs=2,
+                workers=3,
+                use_multiprocessing=use_multiprocessing
+            )
+            for i, ((sources, destinations), labels) in enumerate(batches):
+                epoch, idx = divmod(i, sequence.steps_per_epoch)
+                (expected_sources, expected_destinations), expected_labels = sequence._get_batch(idx, epoch)
+                self.assertTrue(np.array_equal(sources, expected_sources))
+                self.assertTrue(np.array_equal(destinations, expected_destinations))
+                self.assertTrue(np.array_equal(labels, expected_labels))
+
+    def test_scheduled_batches(self):
+        """Test that the oversampled batches do not depend on the order of generation."""
+        batches = []
+        for order in (1, -1):
+            sequence = Node2VecSequence(
+                self._graph,
+                walk_length=20,
+                batch_size=32,
+                window_size=2,
+                scheduler=NodeScheduler(oversampling=0.5)
+            )
+            for _ in range(2):
+                epoch_batches = {
+                    idx: sequence[idx]
+                    for idx in range(sequence.steps_per_epoch)[::order]
+                }
+                sequence.on_epoch_end()
+            batches.append(epoch_batches)
+        for idx, ((contexts, words), _) in batches[0].items():
+            (expected_contexts, expected_words), _ = batches[1][idx]
+            self.assertTrue(np.array_equal(contexts, expected_contexts))
+            self.assertTrue(np.array_equal(words, expected_words))
+        with pytest.raises(ValueError):
+            next(parallel_batches(sequence, workers=2))
+
+    def test_fit(self):
+        """Test that the parallel batches can be used to fit a model."""
+        model = SkipGram(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=10,
+            window_size=2
+        )
+        model.fit(
+            parallel_batches(self._sequence, epochs=2, workers=2),
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertFalse(np.isnan(model.embedding).any())
@@ -0,0 +1,84 @@
+"""Unit test for testing that PrefetchSequence works as expected."""
+import numpy as np
+import pytest
+from embiggen import Node2VecSequence, PrefetchSequence, SkipGram
+from .test_node_sequences import TestNodeSequences
+
+
+class TestPrefetchSequence(TestNodeSequences):
+    """Unit test for testing that PrefetchSequence works as expected."""
+
+    def setUp(self):
+        """Setup objects to test the prefetched Node2Vec sequence."""
+        super().setUp()
+        self._walks = Node2VecSequence(
+            self._graph,
+            walk_length=20,
+            batch_size=32,
+            window_size=2
+        )
+        self._sequence = PrefetchSequence(self._walks, prefetch=2)
+
+    def tearDown(self):
+        """Stop the prefetching threads."""
+        self._sequence.close()
+
+    def test_deterministic_batches(self):
+        """Test that the prefetched batches match the wrapped sequence ones."""
+        for idx in range(self._sequence.steps_per_epoch):
+            (contexts, words), _ = self._sequence[idx]
+            (expected_contexts, expected_words), _ = self._walks[idx]
+            self.assertTrue(np.array_equal(contexts, expected_contexts))
+            self.assertTrue(np.array_equal(words, expected_words))
+        statistics = self._sequence.prefetch_statistics
+        self.assertEqual(statistics["missed"], 1)
+        self.assertEqual(sum(statistics.values()), self._sequence.steps_per_epoch)
+        self._sequence.on_epoch_end()
+        self.assertEqual(self._walks.elapsed_epochs, 1)
+
+    def test_next_epoch(self):
+        """Test that the first batches of the next epoch are prefetched."""
+        self._sequence[0]  # pylint: disable=pointless-statement
+        self._sequence.on_epoch_end()
+        for idx in range(self._sequence.steps_per_epoch):
+            (contexts, words), _ = self._sequence[idx]
+            (expected_contexts, expected_words), _ = self._walks._get_batch(idx, 1)  # pylint: disable=protected-access
+            self.assertTrue(np.array_equal(contexts, expected_contexts))
+            self.assertTrue(np.array_equal(words, expected_words))
+        self.assertEqual(self._sequence.prefetch_statistics["missed"], 1)
+
+    def test_out_of_order(self):
+        """Test that the batches skipped by a request are still prefetched."""
+        for idx in (0, 2, 1):
+            (contexts, words), _ = self._sequence[idx]
+            (expected_contexts, expected_words), _ = self._walks[idx]
+            self.assertTrue(np.array_equal(contexts, expected_contexts))
+            self.assertTrue(np.array_equal(words, expected_words))
+        self.assertEqual(self._sequence.prefetch_statistics["missed"], 1)
+
+    def test_context_manager(self):
+        """Test that the threads are stopped when exiting the context."""
+        with PrefetchSequence(self._walks, prefetch=2) as sequence:
+            sequence[0]  # pylint: disable=pointless-statement
+        with pytest.raises(RuntimeError):
+            sequence.on_epoch_end()
+
+    def test_fit(self):
+        """Test that the prefetched sequence can be used to fit a model."""
+        model = SkipGram(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=10,
+            window_size=2
+        )
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            shuffle=False,
+            verbose=False
+        )
+
+    def test_illegal_arguments(self):
+        """Test that illegal arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            PrefetchSequence(self._walks, prefetch=0)
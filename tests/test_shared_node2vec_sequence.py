@@ -0,0 +1,101 @@
+"""Unit test for testing that SharedNode2VecSequence works as expected."""
+import os
+import pickle
+from tempfile import TemporaryDirectory
+import numpy as np
+import pytest
+from embiggen import SharedNode2VecSequence, SkipGram
+from embiggen.sequences.csr_graph import CSRGraph
+from .test_node_sequences import TestNodeSequences
+
+
+class TestSharedNode2VecSequence(TestNodeSequences):
+    """Unit test for testing that SharedNode2VecSequence works as expected."""
+
+    def setUp(self):
+        """Setup objects to test the shared Node2Vec sequence."""
+        super().setUp()
+        self._window_size = 2
+        self._directory = TemporaryDirectory()
+        self._sequence = SharedNode2VecSequence(
+            self._graph,
+            self._directory.name,
+            walk_length=20,
+            batch_size=32,
+            window_size=self._window_size,
+            return_weight=2.0
+        )
+
+    def tearDown(self):
+        """Remove the memory-mapped graph."""
+        self._directory.cleanup()
+
+    def test_output_shape(self):
+        """Test that object produced by sequence has correct shape."""
+        (context_vector, words_vector), _ = self._sequence[0]
+        self.assertEqual(context_vector.shape[1], self._window_size*2)
+        self.assertEqual(context_vector.shape[0], words_vector.shape[0])
+        self.assertTrue(self.check_nodes_range(words_vector))
+
+    def test_pickle(self):
+        """Test that the pickled sequence attaches to the graph and returns the same batches."""
+        sequence = pickle.loads(pickle.dumps(self._sequence))
+        self.assertIsInstance(sequence._csr_graph._indices, np.memmap)
+        for idx in range(3):
+            (contexts, words), _ = sequence[idx]
+            (expected_contexts, expected_words), _ = self._sequence[idx]
+            self.assertTrue(np.array_equal(contexts, expected_contexts))
+            self.assertTrue(np.array_equal(words, expected_words))
+
+    def test_walk_windows(self):
+        """Test that the batches are the windows of the repeated walks of the start nodes."""
+        graph = self._sequence._csr_graph
+        nodes = graph.get_source_nodes()[:8]
+        walks = graph.walk(nodes, 20, iterations=2, random_state=7)
+        self.assertTrue(np.array_equal(walks[::2, 0], nodes))
+        self.assertTrue(np.array_equal(walks[1::2, 0], nodes))
+        contexts, words = graph.walk_windows(nodes, 20, self._window_size, iterations=2, random_state=7)
+        expected_contexts, expected_words = CSRGraph.get_windows(walks, self._window_size, graph.nodes_number)
+        self.assertTrue(np.array_equal(contexts, expected_contexts))
+        self.assertTrue(np.array_equal(words, expected_words))
+
+    def test_partial_graph(self):
+        """Test that graphs without the completion marker are not loaded."""
+        path = os.path.join(self._directory.name, self._sequence._csr_graph.fingerprint)
+        self.assertTrue(CSRGraph.is_saved(path))
+        os.remove(os.path.join(path, CSRGraph.COMPLETE))
+        with pytest.raises(ValueError):
+            CSRGraph.load(path)
+
+    def test_has_edges(self):
+        """Test that the edges are found in the memory-mapped graph."""
+        graph = self._sequence._csr_graph
+        random_state = np.random.RandomState(seed=42)  # pylint: disable=no-member
+        sources, destinations = graph.sample_edges(1000, random_state)
+        self.assertTrue(graph.has_edges(sources, destinations).all())
+        edges = set(zip(sources.tolist(), destinations.tolist()))
+        sources = random_state.randint(graph.nodes_number, size=1000)
+        destinations = random_state.randint(graph.nodes_number, size=1000)
+        found = graph.has_edges(sources, destinations)
+        for source, destination, is_found in zip(sources, destinations, found):
+            if (source, destination) in edges:
+                self.assertTrue(is_found)
+            start, end = graph._indptr[source], graph._indptr[source + 1]
+            self.assertEqual(is_found, destination in graph._indices[start:end])
+
+    def test_fit(self):
+        """Test that the sequence can be used with multiprocess workers."""
+        model = SkipGram(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=10,
+            window_size=self._window_size
+        )
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            workers=2,
+            use_multiprocessing=True,
+            verbose=False
+        )
+        self.assertFalse(np.isnan(model.embedding).any())
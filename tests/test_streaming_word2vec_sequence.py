@@ -0,0 +1,83 @@
+"""Unit test for testing that StreamingWord2VecSequence works as expected."""
+from tempfile import TemporaryDirectory
+import numpy as np
+import pytest
+from embiggen import StreamingWord2VecSequence, SkipGram
+from .test_word_sequences import TestWordSequences
+
+
+class TestStreamingWord2VecSequence(TestWordSequences):
+    """Unit test for testing that StreamingWord2VecSequence works as expected."""
+
+    def setUp(self):
+        """Setup the shards of the corpus and the sequence streaming them."""
+        super().setUp()
+        self._directory = TemporaryDirectory()
+        with open("./tests/data/short_bible.txt") as bible_file:
+            self._shards = self._transformer.transform_to_shards(
+                bible_file,
+                self._directory.name,
+                shard_size=100
+            )
+        self._sequence = StreamingWord2VecSequence(
+            self._directory.name,
+            batch_size=self._batch_size,
+            window_size=self._window_size,
+            buffer_shards=2
+        )
+
+    def tearDown(self):
+        """Remove the shards."""
+        self._directory.cleanup()
+
+    def test_windows(self):
+        """Test that every window of the corpus is returned once per epoch."""
+        self.assertTrue(len(self._shards) > 2)
+        windows_number = sum(
+            max(len(tokens) - self._window_size*2, 0)
+            for tokens in self._tokens
+        )
+        returned_windows = 0
+        for idx in range(self._sequence.steps_per_epoch):
+            (contexts, words), _ = self._sequence[idx]
+            self.assertEqual(contexts.shape, (words.size, self._window_size*2))
+            self.assertTrue(words.size <= self._batch_size)
+            returned_windows += words.size
+        self.assertEqual(returned_windows, windows_number)
+
+    def test_resume(self):
+        """Test that a sequence resumed at a later epoch returns the same batches."""
+        resumed = StreamingWord2VecSequence(
+            self._directory.name,
+            batch_size=self._batch_size,
+            window_size=self._window_size,
+            buffer_shards=2,
+            elapsed_epochs=1
+        )
+        self._sequence.on_epoch_end()
+        for idx in reversed(range(self._sequence.steps_per_epoch)):
+            (contexts, words), _ = self._sequence[idx]
+            (expected_contexts, expected_words), _ = resumed[idx]
+            self.assertTrue(np.array_equal(contexts, expected_contexts))
+            self.assertTrue(np.array_equal(words, expected_words))
+
+    def test_fit(self):
+        """Test that models can be trained on the streamed corpus."""
+        model = SkipGram(
+            self._transformer.vocabulary_size,
+            embedding_size=10,
+            window_size=self._window_size
+        )
+        model.fit(
+            self._sequence,
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertFalse(np.isnan(model.embedding).any())
+
+    def test_illegal_arguments(self):
+        """Test that illegal arguments raise ValueError."""
+        with TemporaryDirectory() as directory:
+            with pytest.raises(ValueError):
+                StreamingWord2VecSequence(directory, batch_size=self._batch_size)
@@ -0,0 +1,73 @@
+"""Unit test for testing that the TensorFlow datasets work as expected."""
+import numpy as np
+from embiggen import GloVe, LinkPredictionSequence, Node2VecSequence, SkipGram
+from .test_node_sequences import TestNodeSequences
+
+
+class TestTfDataset(TestNodeSequences):
+    """Unit test for testing that the TensorFlow datasets work as expected."""
+
+    def setUp(self):
+        """Setup objects to test the TensorFlow datasets."""
+        super().setUp()
+        self._sequence = Node2VecSequence(
+            self._graph,
+            walk_length=20,
+            batch_size=32,
+            window_size=2
+        )
+
+    def test_deterministic_batches(self):
+        """Test that the dataset batches match the sequence ones."""
+        dataset = self._sequence.to_tf_dataset(epochs=1)
+        for idx, ((contexts, words),) in enumerate(dataset):
+            # The epoch hook runs before the last batch is returned.
+            (expected_contexts, expected_words), _ = self._sequence._get_batch(idx, 0)  # pylint: disable=protected-access
+            self.assertTrue(np.array_equal(contexts.numpy(), expected_contexts))
+            self.assertTrue(np.array_equal(words.numpy(), expected_words))
+        self.assertEqual(idx + 1, self._sequence.steps_per_epoch)
+
+    def test_fit(self):
+        """Test that the dataset can be used to fit a model."""
+        model = SkipGram(
+            vocabulary_size=self._graph.get_nodes_number(),
+            embedding_size=10,
+            window_size=2
+        )
+        model.fit(
+            self._sequence.to_tf_dataset(),
+            steps_per_epoch=self._sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+
+    def test_link_prediction(self):
+        """Test the dataset of the link prediction sequence."""
+        sequence = LinkPredictionSequence(
+            self._graph,
+            embedding=GloVe(
+                self._graph.get_nodes_number(),
+                10
+            ).get_embedding_dataframe(self._graph.get_node_names()).to_numpy(),
+            batch_size=64,
+            batches_per_epoch=4
+        )
+        for x, y in sequence.to_tf_dataset(epochs=1):
+            self.assertEqual(x.shape[1], 10)
+            self.assertEqual(x.shape[0], y.shape[0])
+
+    def test_concatenated_link_prediction(self):
+        """Test the signature of the link prediction sequence with concatenation."""
+        sequence = LinkPredictionSequence(
+            self._graph,
+            embedding=GloVe(
+                self._graph.get_nodes_number(),
+                10
+            ).get_embedding_dataframe(self._graph.get_node_names()).to_numpy(),
+            method="Concatenate",
+            batch_size=64,
+            batches_per_epoch=4
+        )
+        x, _ = sequence[0]
+        self.assertEqual(sequence.output_signature[0].shape[1], x.shape[1])
+        self.assertEqual(x.shape[1], 20)
@@ -0,0 +1,97 @@
+"""Unit test for testing that TokenCorpus works as expected."""
+from tempfile import TemporaryDirectory
+import numpy as np
+import pytest
+from embiggen import TokenCorpus, Word2VecSequence, CBOW
+from .test_word_sequences import TestWordSequences
+
+
+class TestTokenCorpus(TestWordSequences):
+    """Unit test for testing that TokenCorpus works as expected."""
+
+    def setUp(self):
+        """Setup the corpus of the tokens."""
+        super().setUp()
+        self._corpus = TokenCorpus.from_sequences(self._tokens)
+
+    def test_sequences(self):
+        """Test that the corpus returns the original sequences."""
+        self.assertEqual(len(self._corpus), len(self._tokens))
+        for sequence, tokens in zip(self._corpus.get_sequences(range(len(self._corpus))), self._tokens):
+            self.assertTrue(np.array_equal(sequence, tokens))
+        with TemporaryDirectory() as directory:
+            self._corpus.save(directory)
+            corpus = TokenCorpus.load(directory)
+            self.assertIsInstance(corpus.tokens, np.memmap)
+            self.assertTrue(np.array_equal(corpus[3], self._tokens[3]))
+        with pytest.raises(ValueError):
+            TokenCorpus(self._corpus.tokens, self._corpus.offsets[:-1])
+
+    def test_balanced_batches(self):
+        """Test that every sequence is in a batch and batches have similar windows."""
+        sequence = Word2VecSequence(
+            self._corpus,
+            batch_size=16,
+            window_size=self._window_size,
+            bucket_size=8
+        )
+        windows = []
+        sequences_number = 0
+        for idx in range(sequence.steps_per_epoch):
+            sequences = sequence._get_sequences(idx, 0)
+            sequences_number += len(sequences)
+            windows.append(sum(
+                max(len(tokens) - self._window_size*2, 0)
+                for tokens in sequences
+            ))
+        self.assertEqual(sequences_number, len(self._corpus))
+        # Within a bucket, batches differ at most by the windows of two sequences.
+        maximal_windows = max(
+            len(tokens) - self._window_size*2
+            for tokens in self._tokens
+        )
+        self.assertTrue(max(windows[:8]) - min(windows[:8]) <= 2*maximal_windows)
+
+    def test_skewed_lengths(self):
+        """Test that no batch is empty when few sequences have all the windows."""
+        random_state = np.random.RandomState(seed=42)  # pylint: disable=no-member
+        for long_length in (1000, 3):
+            corpus = TokenCorpus.from_sequences([
+                random_state.randint(100, size=long_length if i % 50 == 0 else 3)
+                for i in range(200)
+            ])
+            sequence = Word2VecSequence(
+                corpus,
+                batch_size=4,
+                window_size=self._window_size,
+                bucket_size=8
+            )
+            sequences_number = 0
+            for idx in range(sequence.steps_per_epoch):
+                sequences = sequence._get_sequences(idx, 0)  # pylint: disable=protected-access
+                self.assertTrue(len(sequences) > 0)
+                sequences_number += len(sequences)
+            self.assertEqual(sequences_number, len(corpus))
+
+    def test_fit(self):
+        """Test that models can be trained on the corpus."""
+        sequence = Word2VecSequence(
+            self._transformer.transform(
+                open("./tests/data/short_bible.txt").readlines(),
+                return_corpus=True
+            ),
+            batch_size=self._batch_size,
+            window_size=self._window_size
+        )
+        model = CBOW(
+            self._transformer.vocabulary_size,
+            embedding_size=10,
+            window_size=self._window_size
+        )
+        model.fit(
+            sequence,
+            steps_per_epoch=sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertFalse(np.isnan(model.embedding).any())
@@ -0,0 +1,63 @@
+"""Unit test for testing the walk coverage instrumentation of Node2VecSequence."""
+import numpy as np
+import pytest
+from embiggen import Node2VecSequence
+from embiggen.sequences.walk_coverage import WalkCoverage
+from .test_node_sequences import TestNodeSequences
+
+
+class TestWalkCoverage(TestNodeSequences):
+    """Unit test for testing the walk coverage instrumentation of Node2VecSequence."""
+
+    def setUp(self):
+        """Setup objects to test the walk coverage."""
+        super().setUp()
+        self._sequence = Node2VecSequence(
+            self._graph,
+            walk_length=20,
+            batch_size=32,
+            window_size=2,
+            track_coverage=True
+        )
+
+    def test_coverage_history(self):
+        """Test that the coverage statistics are stored at the end of every epoch."""
+        for _ in range(2):
+            for idx in range(self._sequence.steps_per_epoch):
+                self._sequence[idx]
+            self.assertTrue(self._sequence.coverage.centres.sum() > 0)
+            self._sequence.on_epoch_end()
+        history = self._sequence.coverage_history
+        self.assertEqual(len(history), 2)
+        self.assertTrue(((history.gini >= 0) & (history.gini <= 1)).all())
+        self.assertTrue((history.never_seen <= history.never_seen_as_centre).all())
+        self.assertEqual(self._sequence.coverage.centres.sum(), 0)
+
+    def test_gini(self):
+        """Test the Gini coefficient on known distributions."""
+        self.assertAlmostEqual(WalkCoverage.gini(np.ones(10)), 0.0)
+        self.assertAlmostEqual(WalkCoverage.gini(np.array([0, 0, 0, 4])), 0.75)
+
+    def test_untracked_coverage(self):
+        """Test that the history is not available when not tracked."""
+        with pytest.raises(ValueError):
+            Node2VecSequence(
+                self._graph,
+                walk_length=20,
+                batch_size=32
+            ).coverage_history
+
+    def test_dataset(self):
+        """Test that creating the dataset does not generate any batch."""
+        dataset = self._sequence.to_tf_dataset(epochs=1)
+        self.assertEqual(self._sequence.coverage.centres.sum(), 0)
+        for (contexts, words), in dataset.take(1):
+            self.assertEqual(contexts.shape[1], 4)
+            self.assertEqual(contexts.shape[0], words.shape[0])
+
+    def test_dataset_epochs(self):
+        """Test that the dataset runs the epoch hooks of the sequence."""
+        for _ in self._sequence.to_tf_dataset(epochs=2):
+            pass
+        self.assertEqual(self._sequence.elapsed_epochs, 2)
+        self.assertEqual(len(self._sequence.coverage_history), 2)
@@ -0,0 +1,136 @@
+"""Unit test for testing that the windows of the walks are extracted within the models."""
+import numpy as np
+import pytest
+from embiggen import CBOW, Node2VecSequence, SkipGram, Word2VecSequence
+from embiggen.embedders.layers import WalkWindows
+from embiggen.sequences.csr_graph import CSRGraph
+from .test_node_sequences import TestNodeSequences
+from .test_word_sequences import TestWordSequences
+
+
+class TestNodeWalkWindows(TestNodeSequences):
+    """Unit test for testing the windows of the graph walks."""
+
+    def setUp(self):
+        """Setup the sequence returning the walks."""
+        super().setUp()
+        self._window_size = 2
+        self._walk_length = 20
+        self._sequence = Node2VecSequence(
+            self._graph,
+            walk_length=self._walk_length,
+            batch_size=32,
+            window_size=self._window_size,
+            return_walks=True
+        )
+
+    def test_windows(self):
+        """Test that the layer extracts the same windows as the sequences."""
+        walks, labels = self._sequence[0]
+        self.assertIsNone(labels)
+        self.assertEqual(walks.shape, (32, self._walk_length))
+        contexts, words = WalkWindows(
+            window_size=self._window_size,
+            vocabulary_size=self._graph.get_nodes_number()
+        )(walks)
+        expected_contexts, expected_words = CSRGraph.get_windows(
+            walks,
+            self._window_size,
+            self._graph.get_nodes_number()
+        )
+        self.assertTrue(np.array_equal(contexts.numpy(), expected_contexts))
+        self.assertTrue(np.array_equal(words.numpy()[:, 0], expected_words))
+
+    def test_padding_batch(self):
+        """Test that a batch of walks made only of padding does not produce NaN."""
+        nodes_number = self._graph.get_nodes_number()
+        walks = np.full((4, self._walk_length), nodes_number)
+        contexts, words = WalkWindows(
+            window_size=self._window_size,
+            vocabulary_size=nodes_number
+        )(walks)
+        self.assertEqual(contexts.shape[0], 0)
+        self.assertEqual(words.shape[0], 0)
+        for model in (SkipGram, CBOW):
+            model = model(
+                vocabulary_size=nodes_number,
+                embedding_size=10,
+                window_size=self._window_size,
+                walk_length=self._walk_length
+            )
+            loss = model._model.train_on_batch(walks)  # pylint: disable=protected-access
+            self.assertFalse(np.isnan(loss))
+            self.assertFalse(np.isnan(model.embedding).any())
+        with pytest.raises(ValueError):
+            SkipGram(
+                vocabulary_size=nodes_number,
+                embedding_size=10,
+                window_size=self._window_size,
+                walk_length=self._window_size*2
+            )
+
+    def test_start_nodes(self):
+        """Test that every source node starts one walk per epoch."""
+        start_nodes = np.concatenate([
+            self._sequence[idx][0][:, 0]
+            for idx in range(self._sequence.steps_per_epoch)
+        ])
+        self.assertTrue(np.array_equal(
+            np.sort(start_nodes),
+            np.sort(CSRGraph.from_ensmallen(self._graph).get_source_nodes())
+        ))
+
+    def test_fit(self):
+        """Test that models can be trained on the walks."""
+        for model in (SkipGram, CBOW):
+            model = model(
+                vocabulary_size=self._graph.get_nodes_number(),
+                embedding_size=10,
+                window_size=self._window_size,
+                walk_length=self._walk_length
+            )
+            model.fit(
+                self._sequence,
+                steps_per_epoch=self._sequence.steps_per_epoch,
+                epochs=2,
+                verbose=False
+            )
+            self.assertFalse(np.isnan(model.embedding).any())
+
+
+class TestWordWalkWindows(TestWordSequences):
+    """Unit test for testing the windows of the words sequences."""
+
+    def test_fit(self):
+        """Test that models can be trained on the split sequences."""
+        sequence = Word2VecSequence(
+            self._tokens,
+            batch_size=self._batch_size,
+            window_size=self._window_size,
+            walk_length=10
+        )
+        walks, _ = sequence[0]
+        self.assertEqual(walks.shape[1], 10)
+        model = SkipGram(
+            self._transformer.vocabulary_size,
+            embedding_size=10,
+            window_size=self._window_size,
+            walk_length=10
+        )
+        model.fit(
+            sequence,
+            steps_per_epoch=sequence.steps_per_epoch,
+            epochs=2,
+            verbose=False
+        )
+        self.assertFalse(np.isnan(model.embedding).any())
+
+    def test_illegal_arguments(self):
+        """Test that illegal arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            Word2VecSequence(
+                self._tokens,
+                batch_size=self._batch_size,
+                window_size=self._window_size,
+                walk_length=self._window_size*2
+            )